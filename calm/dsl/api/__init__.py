@@ -1,8 +1,17 @@
-from .handle import get_client_handle_obj, get_api_client
+from .handle import (
+    get_client_handle_obj,
+    get_async_client_handle_obj,
+    get_api_client,
+    update_api_client,
+    reset_api_client,
+)
 from .resource import get_resource_api
 
 __all__ = [
     "get_client_handle_obj",
+    "get_async_client_handle_obj",
     "get_api_client",
+    "update_api_client",
+    "reset_api_client",
     "get_resource_api",
 ]
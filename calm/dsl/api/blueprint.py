@@ -1,4 +1,4 @@
-from .resource import ResourceAPI
+from .resource import ResourceAPI, sync_only
 from .connection import REQUEST
 from .util import strip_secrets, patch_secrets
 
@@ -124,6 +124,7 @@ class BlueprintAPI(ResourceAPI):
 
         return bp_payload
 
+    @sync_only
     def upload_with_secrets(
         self, bp_name, bp_desc, bp_resources, bp_metadata=None, force_create=False
     ):
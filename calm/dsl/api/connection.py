@@ -11,10 +11,13 @@ client = get_connection(pc_ip, pc_port,
 
 """
 
+import asyncio
+import functools
 import traceback
 import json
 import urllib3
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 from requests import Session as Session
 from requests_toolbelt import MultipartEncoder
@@ -320,6 +323,68 @@ class Connection:
         return res, err
 
 
+class AsyncConnection(Connection):
+    """asyncio transport with the same (response, err) contract as Connection.
+
+    `_call` is a coroutine, so every entity api method that returns
+    `self.connection._call(...)` becomes awaitable when built on top of this
+    connection. Requests are run on a worker pool sharing the pooled session,
+    so many of them can be in flight from one event loop.
+
+    Example:
+
+    async with AsyncConnection(pc_ip, pc_port, auth=(user, passwd)) as conn:
+        res, err = await conn._call(endpoint, method=REQUEST.METHOD.GET)
+    """
+
+    def __init__(self, host, port, max_concurrency=20, **kwargs):
+        """
+        Args:
+            max_concurrency (int): max number of requests in flight. Also used
+                as size of connection pool unless pool_maxsize is given
+        """
+
+        kwargs.setdefault("pool_maxsize", max_concurrency)
+        kwargs.setdefault("pool_connections", max_concurrency)
+        super().__init__(host, port, **kwargs)
+        self.max_concurrency = max_concurrency
+        self._executor = None
+
+    def connect(self):
+        session = super().connect()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency,
+            thread_name_prefix=self.__class__.__name__,
+        )
+        return session
+
+    def close(self):
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        super().close()
+
+    async def _call(self, endpoint, **kwargs):
+        """Coroutine for making http request to calm.
+        Accepts same arguments as Connection._call
+
+        Returns:
+            (tuple (requests.Response, dict)): Response
+        """
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(super()._call, endpoint, **kwargs)
+        )
+
+    async def __aenter__(self):
+        self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.close()
+
+
 _CONNECTION = None
 
 
@@ -335,6 +400,26 @@ def get_connection_obj(
     return Connection(host, port, auth_type, scheme, auth)
 
 
+def get_async_connection_obj(
+    host,
+    port,
+    auth_type=REQUEST.AUTH_TYPE.BASIC,
+    scheme=REQUEST.SCHEME.HTTPS,
+    auth=None,
+    max_concurrency=20,
+):
+    """Returns object of AsyncConnection class"""
+
+    return AsyncConnection(
+        host,
+        port,
+        auth_type=auth_type,
+        scheme=scheme,
+        auth=auth,
+        max_concurrency=max_concurrency,
+    )
+
+
 def get_connection_handle(
     host,
     port,
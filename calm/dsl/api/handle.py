@@ -2,6 +2,7 @@ from calm.dsl.config import get_context
 
 from .connection import (
     get_connection_obj,
+    get_async_connection_obj,
     get_connection_handle,
     update_connection_handle,
     REQUEST,
@@ -68,6 +69,28 @@ class ClientHandle:
         self.resource_types = ResourceTypeAPI(self.connection)
 
 
+class AsyncClientHandle(ClientHandle):
+    """ClientHandle over AsyncConnection. Entity api methods that directly
+    return the server call are awaitable and keep the (response, err) contract.
+    Helpers that post-process responses (list_all, iter_all, name-uuid maps etc.)
+    need the synchronous ClientHandle, and raise TypeError on this one.
+
+    Example:
+
+    async with get_async_client_handle_obj(pc_ip, pc_port, auth=auth) as client:
+        results = await asyncio.gather(
+            *[client.application.read(uuid) for uuid in app_uuids]
+        )
+    """
+
+    async def __aenter__(self):
+        self._connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.connection.close()
+
+
 def get_client_handle_obj(
     host,
     port,
@@ -83,6 +106,23 @@ def get_client_handle_obj(
     return handle
 
 
+def get_async_client_handle_obj(
+    host,
+    port,
+    auth_type=REQUEST.AUTH_TYPE.BASIC,
+    scheme=REQUEST.SCHEME.HTTPS,
+    auth=None,
+    max_concurrency=20,
+):
+    """returns object of AsyncClientHandle class. Connection is established on
+    entering its async context"""
+
+    connection = get_async_connection_obj(
+        host, port, auth_type, scheme, auth, max_concurrency=max_concurrency
+    )
+    return AsyncClientHandle(connection)
+
+
 _API_CLIENT_HANDLE = None
 
 
@@ -105,6 +145,13 @@ def update_api_client(
     return _API_CLIENT_HANDLE
 
 
+def reset_api_client():
+    """drops global api client object, it is created again by get_api_client"""
+
+    global _API_CLIENT_HANDLE
+    _API_CLIENT_HANDLE = None
+
+
 def get_api_client():
     """returns global api client object (_API_CLIENT_HANDLE)"""
 
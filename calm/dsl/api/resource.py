@@ -1,4 +1,26 @@
-from .connection import REQUEST
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from .connection import REQUEST, AsyncConnection
+from calm.dsl.log import get_logging_handle
+
+LOG = get_logging_handle(__name__)
+
+
+def sync_only(func):
+    """marks helpers that post-process server responses. These raise TypeError
+    over AsyncConnection, where api calls return coroutines"""
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if isinstance(self.connection, AsyncConnection):
+            raise TypeError(
+                "{}.{} is not supported over AsyncConnection, use the synchronous "
+                "client handle".format(self.__class__.__name__, func.__name__)
+            )
+        return func(self, *args, **kwargs)
+
+    return wrapper
 
 
 class ResourceAPI:
@@ -6,6 +28,9 @@ class ResourceAPI:
     ROOT = "api/nutanix/v3"
     CALM_ROOT = "api/calm/v3.0"
 
+    # Max pages fetched in parallel by list_all
+    LIST_ALL_CONCURRENCY = 5
+
     def __init__(self, connection, resource_type, calm_api=False):
         self.connection = connection
         self.PREFIX = (self.CALM_ROOT if calm_api else self.ROOT) + "/" + resource_type
@@ -43,20 +68,13 @@ class ResourceAPI:
             ignore_error=ignore_error,
         )
 
+    @sync_only
     def get_name_uuid_map(self, params={}):
-        res_entities, err = self.list_all(base_params=params, ignore_error=True)
-
-        if not err:
-            response = res_entities
-        else:
-            raise Exception("[{}] - {}".format(err["code"], err["error"]))
-
-        total_matches = len(response)
-        if total_matches == 0:
-            return {}
         name_uuid_map = {}
 
-        for entity in response:
+        for entity in self.iter_all(
+            base_params=params, fields=["status.name", "metadata.uuid"]
+        ):
             entity_name = entity["status"]["name"]
             entity_uuid = entity["metadata"]["uuid"]
 
@@ -77,19 +95,13 @@ class ResourceAPI:
 
         return name_uuid_map
 
+    @sync_only
     def get_uuid_name_map(self, params={}):
-        res_entities, err = self.list_all(base_params=params, ignore_error=True)
-        if not err:
-            response = res_entities
-        else:
-            raise Exception("[{}] - {}".format(err["code"], err["error"]))
-
-        total_matches = len(response)
-        if total_matches == 0:
-            return {}
-
         uuid_name_map = {}
-        for entity in response:
+
+        for entity in self.iter_all(
+            base_params=params, fields=["status.name", "metadata.uuid"]
+        ):
             entity_name = entity["status"]["name"]
             entity_uuid = entity["metadata"]["uuid"]
 
@@ -97,28 +109,55 @@ class ResourceAPI:
 
         return uuid_name_map
 
+    @sync_only
+    def _list_page(self, params, offset, ignore_error=False):
+        """returns (response_json, err) for the page starting at given offset"""
+
+        page_params = params.copy()
+        page_params["offset"] = offset
+        response, err = self.list(page_params, ignore_error=ignore_error)
+        if err:
+            return None, err
+
+        return response.json(), None
+
     # TODO: Fix return type of list_all helper
-    def list_all(self, api_limit=250, base_params=None, ignore_error=False):
-        """returns the list of entities"""
+    @sync_only
+    def list_all(
+        self,
+        api_limit=250,
+        base_params=None,
+        ignore_error=False,
+        concurrency=None,
+    ):
+        """returns the list of entities
+
+        Args:
+            api_limit (int): page size used if not given in base_params
+            base_params (dict): list api payload
+            ignore_error (bool): return (entities, err) instead of raising
+            concurrency (int): max pages fetched in parallel after the
+                first page (default: LIST_ALL_CONCURRENCY). 1 means serial
+        """
 
-        final_list = []
-        offset = 0
         if base_params is None:
             base_params = {}
+        if concurrency is None:
+            concurrency = self.LIST_ALL_CONCURRENCY
         params = base_params.copy()
         length = params.get("length", api_limit)
         params["length"] = length
-        params["offset"] = offset
+        params["offset"] = 0
         if params.get("sort_attribute", None) is None:
             params["sort_attribute"] = "_created_timestamp_usecs_"
         if params.get("sort_order", None) is None:
             params["sort_order"] = "ASCENDING"
+
+        final_list = []
+        offset = 0
         while True:
-            params["offset"] = offset
-            response, err = self.list(params, ignore_error=ignore_error)
-            if not err:
-                response = response.json()
-            else:
+            response, err = self._list_page(params, offset, ignore_error=ignore_error)
+            if err:
                 if ignore_error:
                     return [], err
                 else:
@@ -132,11 +171,120 @@ class ResourceAPI:
 
             offset += length
 
+            # Once total_matches is known, remaining pages are fetched concurrently
+            if concurrency > 1:
+                entities, err = self._list_remaining_pages(
+                    params, offset, total_matches, concurrency, ignore_error
+                )
+                if err:
+                    if ignore_error:
+                        return [], err
+                    else:
+                        raise Exception("[{}] - {}".format(err["code"], err["error"]))
+
+                final_list.extend(entities)
+                break
+
         if ignore_error:
             return final_list, None
 
         return final_list
 
+    def _list_remaining_pages(
+        self, params, start_offset, total_matches, concurrency, ignore_error=False
+    ):
+        """fetches pages from start_offset till total_matches in parallel.
+        Entities are returned in offset order i.e. server's sort order"""
+
+        length = params["length"]
+        offsets = list(range(start_offset, total_matches, length))
+
+        # Connection pool blocks beyond its size, so no use of more workers
+        pool_maxsize = getattr(self.connection, "_pool_maxsize", concurrency)
+        max_workers = max(1, min(concurrency, len(offsets), int(pool_maxsize)))
+        LOG.debug(
+            "Fetching {} pages of '{}' with {} workers".format(
+                len(offsets), self.LIST, max_workers
+            )
+        )
+
+        entities = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # executor.map yields results in the order of offsets
+            for response, err in executor.map(
+                lambda _offset: self._list_page(params, _offset, ignore_error),
+                offsets,
+            ):
+                if err:
+                    return [], err
+                entities.extend(response["entities"])
+
+        return entities, None
+
+    @sync_only
+    def iter_all(self, api_limit=250, base_params=None, fields=None):
+        """yields entities page by page, so only one page is held in memory
+
+        Args:
+            api_limit (int): page size used if not given in base_params
+            base_params (dict): list api payload
+            fields (list): dotted key paths to keep in each yielded entity
+                i.e. ["status.name", "metadata.uuid"]. Other keys are dropped
+        Raises:
+            Exception: if any page request fails
+        """
+
+        if base_params is None:
+            base_params = {}
+        params = base_params.copy()
+        length = params.get("length", api_limit)
+        params["length"] = length
+        if params.get("sort_attribute", None) is None:
+            params["sort_attribute"] = "_created_timestamp_usecs_"
+        if params.get("sort_order", None) is None:
+            params["sort_order"] = "ASCENDING"
+
+        offset = 0
+        while True:
+            response, err = self._list_page(params, offset, ignore_error=True)
+            if err:
+                raise Exception("[{}] - {}".format(err["code"], err["error"]))
+
+            for entity in response["entities"]:
+                yield project_fields(entity, fields) if fields else entity
+
+            total_matches = response["metadata"]["total_matches"]
+
+            if total_matches <= (length + offset):
+                break
+
+            offset += length
+
+
+def project_fields(entity, fields):
+    """returns copy of entity dict containing only the dotted key paths in fields.
+    Missing keys are skipped.
+
+    Ex: project_fields(entity, ["status.name", "metadata.uuid"]) returns
+        {"status": {"name": ...}, "metadata": {"uuid": ...}}
+    """
+
+    projected = {}
+    for field in fields:
+        keys = field.split(".")
+        value = entity
+        for key in keys:
+            if not isinstance(value, dict) or key not in value:
+                break
+            value = value[key]
+        else:
+            target = projected
+            for key in keys[:-1]:
+                target = target.setdefault(key, {})
+            target[keys[-1]] = value
+
+    return projected
+
 
 def get_resource_api(resource_type, connection, calm_api=False):
     return ResourceAPI(connection, resource_type, calm_api=calm_api)
@@ -2,7 +2,7 @@ import os
 from distutils.version import LooseVersion as LV
 
 
-from .resource import ResourceAPI
+from .resource import ResourceAPI, sync_only
 from .connection import REQUEST
 from .util import strip_secrets, patch_secrets
 from calm.dsl.config import get_context
@@ -109,6 +109,7 @@ class RunbookAPI(ResourceAPI):
 
         return runbook_payload
 
+    @sync_only
     def upload_with_secrets(
         self, runbook_name, runbook_desc, runbook_resources, force_create=False
     ):
@@ -283,6 +284,7 @@ class RunbookAPI(ResourceAPI):
                 self.POLL_RUN.format(uuid), verify=False, method=REQUEST.METHOD.GET
             )
 
+    @sync_only
     def update_with_secrets(
         self, uuid, runbook_name, runbook_desc, runbook_resources, spec_version
     ):
@@ -367,6 +369,7 @@ class RunbookAPI(ResourceAPI):
 
         return self.update(uuid, runbook)
 
+    @sync_only
     def export_file(self, uuid, passphrase=None):
         current_path = os.path.dirname(os.path.realpath(__file__))
         if passphrase:
@@ -1,4 +1,4 @@
-from .resource import ResourceAPI
+from .resource import ResourceAPI, sync_only
 from .connection import REQUEST
 
 
@@ -26,15 +26,14 @@ class AccountsAPI(ResourceAPI):
             method=REQUEST.METHOD.POST,
         )
 
+    @sync_only
     def get_uuid_type_map(self, params=dict()):
         """returns map containing {account_uuid: account_type} details"""
 
-        res_entities, err = self.list_all(base_params=params, ignore_error=True)
-        if err:
-            raise Exception(err)
-
         uuid_type_map = {}
-        for entity in res_entities:
+        for entity in self.iter_all(
+            base_params=params, fields=["metadata.uuid", "status.resources.type"]
+        ):
             a_uuid = entity["metadata"]["uuid"]
             a_type = entity["status"]["resources"]["type"]
             uuid_type_map[a_uuid] = a_type
@@ -1,10 +1,11 @@
-from .resource import ResourceAPI
+from .resource import ResourceAPI, sync_only
 
 
 class UserGroupAPI(ResourceAPI):
     def __init__(self, connection):
         super().__init__(connection, resource_type="user_groups")
 
+    @sync_only
     def get_name_uuid_map(self, params=dict()):
 
         res, err = self.list(params)
@@ -46,6 +47,7 @@ class UserGroupAPI(ResourceAPI):
 
         return name_uuid_map
 
+    @sync_only
     def get_uuid_name_map(self, params=dict()):
 
         res, err = self.list(params)
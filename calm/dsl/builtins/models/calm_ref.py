@@ -3,7 +3,7 @@ import uuid
 
 from calm.dsl.db.table_config import AhvSubnetsCache
 
-from .entity import Entity, EntityType
+from .entity import Entity, EntityType, get_compile_session
 from .validator import PropertyValidator
 from .helper import common as common_helper
 
@@ -37,8 +37,15 @@ class CalmRefType(EntityType):
 
     def __getitem__(cls, key):
         """return the vale in compiled class payload"""
-        data = cls.compile()
-        return data[key]
+
+        # Reference is compiled once per compile session
+        session = get_compile_session()
+        if session is None:
+            return cls.compile()[key]
+
+        if cls not in session.compiled:
+            session.compiled[cls] = cls.compile()
+        return session.compiled[cls][key]
 
 
 class CalmRefValidator(PropertyValidator, openapi_type="app_calm_ref"):
@@ -1,4 +1,5 @@
 from collections import OrderedDict
+from contextlib import contextmanager
 import json
 from json import JSONEncoder, JSONDecoder
 import sys
@@ -7,6 +8,7 @@ from types import MappingProxyType
 import uuid
 import copy
 import keyword
+import weakref
 
 from ruamel.yaml import YAML, resolver, SafeRepresenter
 from calm.dsl.tools import StrictDraft7Validator
@@ -17,6 +19,55 @@ from .client_attrs import update_dsl_metadata_map, get_dsl_metadata_map
 
 LOG = get_logging_handle(__name__)
 
+# Merged namespace (defaults + __dict__ along the mro) of entity classes.
+# Entries are dropped when the class or any of its bases is mutated.
+_MERGED_NS_MEMO = weakref.WeakKeyDictionary()
+
+# Memo of compiled payloads, active for the duration of a compile session
+_COMPILE_SESSION = None
+
+
+class CompileSession:
+    """
+    Payloads of entities compiled in one compile pass. An entity referenced
+    from multiple places is compiled once in a session. Entries are dropped
+    when the entity (or any of its bases) is mutated.
+    """
+
+    def __init__(self):
+        self.payloads = {}
+        self.compiled = {}
+        self.pre_compiled = set()
+
+    def invalidate(self, cls):
+        self.payloads.pop(cls, None)
+        self.compiled.pop(cls, None)
+        self.pre_compiled.discard(cls)
+
+
+@contextmanager
+def compile_session():
+    """
+    Starts a compile session if there is no active one. Nested sessions
+    share the memo of the outermost session.
+    """
+
+    global _COMPILE_SESSION
+    if _COMPILE_SESSION is not None:
+        yield _COMPILE_SESSION
+        return
+
+    _COMPILE_SESSION = CompileSession()
+    try:
+        yield _COMPILE_SESSION
+    finally:
+        _COMPILE_SESSION = None
+
+
+def get_compile_session():
+    """returns active compile session, None if there is no active session"""
+    return _COMPILE_SESSION
+
 
 class EntityDict(OrderedDict):
     @staticmethod
@@ -220,7 +271,28 @@ class EntityType(EntityTypeBase):
         value = cls.validate(name, value)
 
         # Set attribute
+        unchanged = name in cls.__dict__ and cls.__dict__[name] is value
         super().__setattr__(name, value)
+        if not unchanged:
+            cls._invalidate_memos()
+
+    def __delattr__(cls, name):
+        super().__delattr__(name)
+        cls._invalidate_memos()
+
+    def _invalidate_memos(cls):
+        """drops memoized namespace and payloads of class and its subclasses"""
+
+        if not (_MERGED_NS_MEMO or _COMPILE_SESSION):
+            return
+
+        pending = [cls]
+        while pending:
+            klass = pending.pop()
+            _MERGED_NS_MEMO.pop(klass, None)
+            if _COMPILE_SESSION:
+                _COMPILE_SESSION.invalidate(klass)
+            pending.extend(type.__subclasses__(klass))
 
     def __str__(cls):
         return cls.__name__
@@ -228,14 +300,22 @@ class EntityType(EntityTypeBase):
     def __repr__(cls):
         return cls.__name__
 
-    def get_user_attrs(cls):
+    def get_user_attrs(cls, namespace=None):
+        """
+        returns user attrs present in namespace (class __dict__ by default).
+        Descriptors (actions, runbooks etc.) are resolved against the class.
+        """
+
+        if namespace is None:
+            namespace = cls.__dict__
+
         types = EntityTypeBase.get_entity_types()
         ActionType = types.get("Action", None)
         RunbookType = types.get("Runbook", None)
         VariableType = types.get("Variable", None)
         DescriptorType = types.get("Descriptor", None)
         user_attrs = {}
-        for name, value in cls.__dict__.items():
+        for name, value in namespace.items():
             if (
                 name.startswith("__")
                 and name.endswith("__")
@@ -243,7 +323,12 @@ class EntityType(EntityTypeBase):
                 and not isinstance(type(value), DescriptorType)
             ) or name == "__parent__":
                 continue
-            user_attrs[name] = getattr(cls, name, value)
+
+            # Same as getattr(cls, name) for attrs found in class __dict__
+            descriptor_get = getattr(type(value), "__get__", None)
+            if descriptor_get is not None:
+                value = descriptor_get(value, None, cls)
+            user_attrs[name] = value
 
         return user_attrs
 
@@ -315,18 +400,30 @@ class EntityType(EntityTypeBase):
         for k in del_keys:
             attrs.pop(k)
 
-    def get_all_attrs(cls):
+    def get_merged_ns(cls):
+        """
+        returns default attrs updated with __dict__ of entity classes in mro.
+        Attrs are already validated while setting them on these classes, so
+        the merged namespace is memoized till any of these classes is mutated.
+        """
 
-        ncls_ns = cls.get_default_attrs()
-        for klass in reversed(cls.mro()):
-            if hasattr(klass, "get_user_attrs") and callable(
-                getattr(klass, "get_user_attrs")
-            ):
-                ncls_ns = {**ncls_ns, **klass.__dict__}
+        merged_ns = _MERGED_NS_MEMO.get(cls)
+        if merged_ns is None:
+            merged_ns = cls.get_default_attrs()
+            for klass in reversed(cls.mro()):
+                if hasattr(klass, "get_user_attrs") and callable(
+                    getattr(klass, "get_user_attrs")
+                ):
+                    merged_ns.update(klass.__dict__)
 
-        ncls = type(cls)(cls.__name__, cls.__bases__, ncls_ns)
+            _MERGED_NS_MEMO[cls] = merged_ns
 
-        return ncls.get_user_attrs()
+        # Callers modify the returned dict
+        return dict(merged_ns)
+
+    def get_all_attrs(cls):
+
+        return cls.get_user_attrs(cls.get_merged_ns())
 
     def get_not_required_if_none_attrs(cls):
         not_required_attrs = []
@@ -341,13 +438,7 @@ class EntityType(EntityTypeBase):
     def clone(cls):
         """returns the clone (deepcopy) of the original class"""
 
-        ncls_ns = cls.get_default_attrs()
-        for klass in reversed(cls.mro()):
-            if hasattr(klass, "get_user_attrs") and callable(
-                getattr(klass, "get_user_attrs")
-            ):
-                ncls_ns = {**ncls_ns, **klass.__dict__}
-
+        ncls_ns = cls.get_merged_ns()
         for k, v in ncls_ns.items():
             if isinstance(v, list):
                 nv = []
@@ -361,7 +452,12 @@ class EntityType(EntityTypeBase):
             elif hasattr(v, "clone") and callable(getattr(v, "clone")):
                 ncls_ns[k] = v.clone()
 
-        ncls = type(cls)(cls.__name__, cls.__bases__, ncls_ns)
+        # Attrs were validated on the original class (and clones on their own
+        # classes), so the class is created from a dict without validators
+        entitydict = type(cls).__prepare_dict__()
+        entitydict.update(ncls_ns)
+
+        ncls = type(cls)(cls.__name__, cls.__bases__, entitydict)
         return ncls
 
     def pre_compile(cls):
@@ -403,7 +499,9 @@ class EntityType(EntityTypeBase):
 
     def compile(cls):
 
-        cls.pre_compile()
+        # pre_compile hook is already run if compiled via generate_payload
+        if not (_COMPILE_SESSION and cls in _COMPILE_SESSION.pre_compiled):
+            cls.pre_compile()
         attrs = cls.get_all_attrs()
         cls.update_attrs(attrs)
 
@@ -448,9 +546,24 @@ class EntityType(EntityTypeBase):
     def generate_payload(cls):
         """generates the payload(dict) for any entity"""
 
+        session = _COMPILE_SESSION
+        if session is None:
+            cls.pre_compile()
+            cdict = cls.compile()
+            return cls.post_compile(cdict)
+
+        if cls in session.payloads:
+            return session.payloads[cls]
+
         cls.pre_compile()
+        session.pre_compiled.add(cls)
         cdict = cls.compile()
-        return cls.post_compile(cdict)
+        cdict = cls.post_compile(cdict)
+
+        # Entity may have been mutated while compiling it
+        if cls in session.pre_compiled:
+            session.payloads[cls] = cdict
+        return cdict
 
     @classmethod
     def pre_decompile(mcls, cdict, context, prefix=""):
@@ -570,13 +683,14 @@ class EntityType(EntityTypeBase):
 
     def json_dumps(cls, pprint=False, sort_keys=False):
 
-        dump = json.dumps(
-            cls,
-            cls=EntityJSONEncoder,
-            sort_keys=sort_keys,
-            indent=4 if pprint else None,
-            separators=(",", ": ") if pprint else (",", ":"),
-        )
+        with compile_session():
+            dump = json.dumps(
+                cls,
+                cls=EntityJSONEncoder,
+                sort_keys=sort_keys,
+                indent=4 if pprint else None,
+                separators=(",", ": ") if pprint else (",", ":"),
+            )
 
         # Add newline for pretty print
         return dump + "\n" if pprint else dump
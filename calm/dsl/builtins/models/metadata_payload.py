@@ -2,8 +2,14 @@
 #       Below helpers are used in both `calm/dsl/cli/` and `calm/dsl/builtins/`
 #       Import its helpers using `from calm.dsl.builtins.models.metadata_payload import *`
 
+import ast
+import importlib.util
+
 from .metadata import Metadata
 from calm.dsl.tools import get_module_from_file
+from calm.dsl.log import get_logging_handle
+
+LOG = get_logging_handle(__name__)
 
 _MetadataPayload = dict()
 
@@ -12,9 +18,89 @@ _MetadataPayload = dict()
 def get_metadata_module_from_file(dsl_file):
     """Returns module given a file (.py)"""
 
+    try:
+        return _get_metadata_only_module(dsl_file)
+    except Exception as exp:
+        LOG.debug(
+            "Could not load metadata alone from {} ({}), loading whole file".format(
+                dsl_file, exp
+            )
+        )
+
     return get_module_from_file("calm.dsl.user_metadata", dsl_file)
 
 
+def _get_metadata_only_module(dsl_file):
+    """
+    Returns module containing only the metadata class of dsl_file along with the
+    imports and module level definitions it depends on. Entity classes in the file
+    are not executed, so they are executed only once while loading the actual module.
+    """
+
+    with open(dsl_file) as fd:
+        tree = ast.parse(fd.read(), filename=dsl_file)
+
+    metadata_names = {"Metadata"}
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom):
+            for alias in node.names:
+                if alias.name == "Metadata" and alias.asname:
+                    metadata_names.add(alias.asname)
+
+    def base_name(base):
+        if isinstance(base, ast.Attribute):
+            return base.attr
+        return getattr(base, "id", None)
+
+    def loaded_names(node):
+        return {
+            n.id
+            for n in ast.walk(node)
+            if isinstance(n, ast.Name) and isinstance(n.ctx, ast.Load)
+        }
+
+    def defined_names(node):
+        if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
+            return {node.name}
+        return {
+            n.id
+            for n in ast.walk(node)
+            if isinstance(n, ast.Name) and isinstance(n.ctx, ast.Store)
+        }
+
+    selected = set()
+    required_names = set()
+    for index, node in enumerate(tree.body):
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            selected.add(index)
+        elif isinstance(node, ast.ClassDef) and any(
+            base_name(base) in metadata_names for base in node.bases
+        ):
+            selected.add(index)
+            required_names |= loaded_names(node)
+
+    definitions = (ast.Assign, ast.AnnAssign, ast.FunctionDef, ast.ClassDef)
+    changed = True
+    while changed:
+        changed = False
+        for index, node in enumerate(tree.body):
+            if index in selected or not isinstance(node, definitions):
+                continue
+            if defined_names(node) & required_names:
+                selected.add(index)
+                required_names |= loaded_names(node)
+                changed = True
+
+    tree.body = [node for index, node in enumerate(tree.body) if index in selected]
+    code = compile(tree, dsl_file, "exec")
+
+    spec = importlib.util.spec_from_file_location("calm.dsl.user_metadata", dsl_file)
+    user_module = importlib.util.module_from_spec(spec)
+    exec(code, user_module.__dict__)
+
+    return user_module
+
+
 def get_metadata_class_from_module(user_module):
     """Returns project class given a module"""
 
@@ -33,9 +119,17 @@ def get_metadata_payload(dsl_file):
     returns the metadata payload from the dsl_file
     """
 
-    global _MetadataPayload
     user_metadata_module = get_metadata_module_from_file(dsl_file)
-    UserMetadata = get_metadata_class_from_module(user_metadata_module)
+    return get_metadata_payload_from_module(user_metadata_module)
+
+
+def get_metadata_payload_from_module(user_module):
+    """
+    returns the metadata payload from an already loaded dsl module
+    """
+
+    global _MetadataPayload
+    UserMetadata = get_metadata_class_from_module(user_module)
 
     payload = {}
     if UserMetadata:
@@ -7,6 +7,7 @@ from calm.dsl.builtins import file_exists
 
 from .entity import EntityType
 from .validator import PropertyValidator
+from .utils import add_dependency_file
 from calm.dsl.log import get_logging_handle
 
 LOG = get_logging_handle(__name__)
@@ -47,6 +48,7 @@ def read_spec(filename, depth=1):
     file_path = os.path.join(
         os.path.dirname(inspect.getfile(sys._getframe(depth))), filename
     )
+    add_dependency_file(file_path)
 
     if not file_exists(file_path):
         LOG.debug("file {} not found at location {}".format(filename, file_path))
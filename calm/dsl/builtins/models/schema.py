@@ -1,7 +1,11 @@
 """ Schema should be according to OpenAPI 3 format with x-calm-dsl-type extension"""
 
+import os
 import json
+import pickle
+import hashlib
 from copy import deepcopy
+from functools import lru_cache
 from io import StringIO
 from distutils.version import LooseVersion as LV
 
@@ -12,20 +16,119 @@ from bidict import bidict
 
 from .validator import get_property_validators
 from calm.dsl.store import Version
+from calm.dsl.config import get_context
 from calm.dsl.log import get_logging_handle
 
 
 LOG = get_logging_handle(__name__)
 _SCHEMAS = None
+_CALM_VERSION = None
+_SCHEMA_DETAILS = {}
+
+SCHEMA_BUNDLE_DIR = "schema_bundles"
 
 
 def _get_all_schemas():
     global _SCHEMAS
     if not _SCHEMAS:
-        _SCHEMAS = _load_all_schemas()
+        _SCHEMAS = _load_schema_bundle()
     return _SCHEMAS
 
 
+def _get_schema_bundle_file():
+    """
+    returns the path of precompiled schema bundle. It is keyed by the schema
+    templates shipped in the package and the calm server version.
+    """
+
+    schema_dir = os.path.join(os.path.dirname(__file__), "schemas")
+    key = hashlib.sha1()
+    for file_name in sorted(os.listdir(schema_dir)):
+        stat = os.stat(os.path.join(schema_dir, file_name))
+        key.update("{}:{}:{};".format(file_name, stat.st_size, stat.st_mtime).encode())
+    key.update(str(get_calm_version()).encode())
+
+    ContextObj = get_context()
+    init_config = ContextObj.get_init_config()
+    bundle_dir = os.path.join(
+        os.path.dirname(init_config["DB"]["location"]), SCHEMA_BUNDLE_DIR
+    )
+    return os.path.join(bundle_dir, "schemas-{}.pickle".format(key.hexdigest()))
+
+
+def _load_schema_bundle():
+    """
+    returns schemas from the precompiled bundle on disk. Bundle is created
+    from the schema templates if it does not exist.
+    """
+
+    try:
+        bundle_file = _get_schema_bundle_file()
+    except Exception as exp:
+        LOG.debug("Schema bundle location not available: {}".format(exp))
+        return _load_all_schemas()
+
+    try:
+        with open(bundle_file, "rb") as fd:
+            return pickle.load(fd)
+    except FileNotFoundError:
+        pass
+    except Exception as exp:
+        LOG.debug("Ignoring invalid schema bundle {}: {}".format(bundle_file, exp))
+
+    schemas = _resolve_refs(_load_all_schemas(), {})
+    try:
+        _write_schema_bundle(bundle_file, schemas)
+    except Exception as exp:
+        LOG.debug("Could not write schema bundle {}: {}".format(bundle_file, exp))
+
+    return schemas
+
+
+def _write_schema_bundle(bundle_file, schemas):
+    """writes the bundle atomically and removes bundles of other versions"""
+
+    bundle_dir = os.path.dirname(bundle_file)
+    os.makedirs(bundle_dir, exist_ok=True)
+
+    tmp_file = "{}.{}.tmp".format(bundle_file, os.getpid())
+    with open(tmp_file, "wb") as fd:
+        pickle.dump(schemas, fd, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_file, bundle_file)
+
+    for file_name in os.listdir(bundle_dir):
+        file_path = os.path.join(bundle_dir, file_name)
+        if file_path != bundle_file and file_name.endswith(".pickle"):
+            os.remove(file_path)
+
+
+def _resolve_refs(obj, memo):
+    """
+    returns copy of obj having jsonref proxies replaced by the objects they
+    refer to. Objects referred at multiple places are shared in the copy too.
+    """
+
+    if isinstance(obj, jsonref.JsonRef):
+        obj = obj.__subject__
+
+    if id(obj) in memo:
+        return memo[id(obj)]
+
+    if isinstance(obj, dict):
+        result = memo[id(obj)] = {}
+        for key, value in obj.items():
+            result[key] = _resolve_refs(value, memo)
+        return result
+
+    elif isinstance(obj, list):
+        result = memo[id(obj)] = []
+        for value in obj:
+            result.append(_resolve_refs(value, memo))
+        return result
+
+    return obj
+
+
 def _load_all_schemas(schema_file="main.yaml.jinja2"):
 
     loader = PackageLoader(__name__, "schemas")
@@ -42,6 +145,37 @@ def _load_all_schemas(schema_file="main.yaml.jinja2"):
     return schemas
 
 
+def get_calm_version():
+    """
+    returns the parsed calm version used for filtering schema attributes.
+    It is read from the db once per process.
+    """
+
+    global _CALM_VERSION
+    if _CALM_VERSION is None:
+        # Raise warning and set default to 2.9.0
+        calm_version = Version.get_version("Calm") or "2.9.0"
+        _CALM_VERSION = LV(calm_version)
+
+    return _CALM_VERSION
+
+
+@lru_cache(maxsize=None)
+def _parse_version(version):
+    return LV(version)
+
+
+def is_supported_attribute(props):
+    """checks if attribute is supported by calm version (x-calm-dsl-min-version)"""
+
+    # dev machines do not follow standard version protocols. Avoid matching there
+    attribute_min_version = str(props.get("x-calm-dsl-min-version", ""))
+    if not attribute_min_version:
+        return True
+
+    return _parse_version(attribute_min_version) <= get_calm_version()
+
+
 def get_schema(name):
 
     schemas = _get_all_schemas()
@@ -94,19 +228,9 @@ def get_validator_details(schema_props, name):
             object_type = True
             for name in props.get("properties", {}):
                 attr_props = props["properties"].get(name, dict())
-                calm_version = Version.get_version("Calm")
-
-                # dev machines do not follow standard version protocols. Avoid matching there
-                attribute_min_version = str(
-                    attr_props.get("x-calm-dsl-min-version", "")
-                )
-                if not calm_version:
-                    calm_version = "2.9.0"  # Raise warning and set default to 2.9.0
 
                 # If attribute version is less than calm version, ignore it
-                if attribute_min_version and LV(attribute_min_version) > LV(
-                    calm_version
-                ):
+                if not is_supported_attribute(attr_props):
                     continue
 
                 validator, is_array, default = get_validator_details(
@@ -161,16 +285,9 @@ def get_validators_with_defaults(schema_props):
     defaults = {}
     display_map = bidict()
     for name, props in schema_props.items():
-        calm_version = Version.get_version("Calm")
-
-        # dev machines do not follow standard version protocols. Avoid matching there
-        attribute_min_version = str(props.get("x-calm-dsl-min-version", ""))
-        if not calm_version:
-            # Raise warning and set default to 2.9.0
-            calm_version = "2.9.0"
 
         # If attribute version is less than calm version, ignore it
-        if attribute_min_version and LV(attribute_min_version) > LV(calm_version):
+        if not is_supported_attribute(props):
             continue
 
         ValidatorType, is_array, default = get_validator_details(schema_props, name)
@@ -185,7 +302,11 @@ def get_validators_with_defaults(schema_props):
 
 def get_schema_details(schema_name):
 
-    schema_props = get_schema_props(schema_name)
-    validators, defaults, display_map = get_validators_with_defaults(schema_props)
+    calm_version = get_calm_version()
+    key = (str(calm_version), schema_name)
+    if key not in _SCHEMA_DETAILS:
+        schema_props = get_schema_props(schema_name)
+        validators, defaults, display_map = get_validators_with_defaults(schema_props)
+        _SCHEMA_DETAILS[key] = (schema_props, validators, defaults, display_map)
 
-    return schema_props, validators, defaults, display_map
+    return _SCHEMA_DETAILS[key]
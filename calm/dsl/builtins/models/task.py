@@ -9,6 +9,7 @@ from .validator import PropertyValidator
 from .ref import RefType
 from .task_input import TaskInputType
 from .variable import CalmVariable
+from .utils import add_dependency_file
 from calm.dsl.log import get_logging_handle
 
 LOG = get_logging_handle(__name__)
@@ -209,6 +210,7 @@ def _exec_create(
         file_path = os.path.join(
             os.path.dirname(sys._getframe(depth).f_globals.get("__file__")), filename
         )
+        add_dependency_file(file_path)
         with open(file_path, "r") as scriptf:
             script = scriptf.read()
 
@@ -255,6 +257,7 @@ def _decision_create(
         file_path = os.path.join(
             os.path.dirname(sys._getframe(depth).f_globals.get("__file__")), filename
         )
+        add_dependency_file(file_path)
 
         with open(file_path, "r") as scriptf:
             script = scriptf.read()
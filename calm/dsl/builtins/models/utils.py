@@ -2,6 +2,7 @@ import os
 import sys
 import inspect
 import json
+from contextlib import contextmanager
 
 from ruamel import yaml
 import re
@@ -10,6 +11,34 @@ from calm.dsl.config import get_context
 
 LOG = get_logging_handle(__name__)
 
+# Files looked up by dsl helpers, collected while tracking is enabled
+_DEPENDENCY_FILES = None
+
+
+@contextmanager
+def track_dependency_files():
+    """
+    collects paths of files looked up by dsl helpers (read_file, read_spec,
+    script files of tasks etc.) in the set it yields
+    """
+
+    global _DEPENDENCY_FILES
+    old_files = _DEPENDENCY_FILES
+    _DEPENDENCY_FILES = set()
+    try:
+        yield _DEPENDENCY_FILES
+    finally:
+        if old_files is not None:
+            old_files.update(_DEPENDENCY_FILES)
+        _DEPENDENCY_FILES = old_files
+
+
+def add_dependency_file(file_path):
+    """records file in tracked dependencies, it may or may not exist"""
+
+    if _DEPENDENCY_FILES is not None:
+        _DEPENDENCY_FILES.add(os.path.abspath(file_path))
+
 
 def read_file(filename, depth=1):
     """reads the file"""
@@ -22,6 +51,7 @@ def read_file(filename, depth=1):
     file_path = os.path.join(
         os.path.dirname(inspect.getfile(sys._getframe(depth))), filename
     )
+    add_dependency_file(file_path)
 
     if not file_exists(file_path):
         LOG.debug("file {} not found at location {}".format(filename, file_path))
@@ -57,6 +87,7 @@ def read_env(relpath=".env"):
 
     # Get filepath
     filepath = _get_caller_filepath(relpath)
+    add_dependency_file(filepath)
 
     LOG.debug("Reading env from file: {}".format(filepath))
 
@@ -114,6 +145,7 @@ def read_local_file(filename):
     abs_file_path = os.path.join(
         os.path.dirname(inspect.getfile(sys._getframe(1))), file_path
     )
+    add_dependency_file(abs_file_path)
 
     # If not exists read from home directory
     if not file_exists(abs_file_path):
@@ -1,32 +1,17 @@
 from .main import main
-from .bp_commands import *  # NoQA
-from .app_commands import *  # NoQA
-from .runbook_commands import *  # NoQA
-from .library_tasks_commands import *  # NoQA
-from .endpoint_commands import *  # NoQA
-from .config_commands import *  # NoQA
-from .account_commands import *  # NoQA
-from .project_commands import *  # NoQA
-from .secret_commands import *  # NoQA
-from .cache_commands import *  # NoQA
-from .completion_commands import *  # NoQA
-from .init_command import *  # NoQA
 from calm.dsl.api import get_api_client
-from .marketplace_bp_commands import *  # NoQA
-from .marketplace_item_commands import *  # NoQA
-from .marketplace_runbook_commands import *  # NoQA
-from .app_icon_commands import *  # NoQA
-from .user_commands import *  # NoQA
-from .group_commands import *  # NoQA
-from .role_commands import *  # NoQA
-from .directory_service_commands import *  # NoQA
-from .acp_commands import *  # NoQA
-from .task_commands import *  # NoQA
-from .brownfield_commands import *  # NoQA
-from .environment_commands import *  # NoQA
-from .protection_policy_commands import *  # NoQA
-from .vm_recovery_point_commands import *  # NoQA
-from .scheduler_commands import *  # NoQA
-from .network_group_commands import *  # NoQA
+from .command_registry import load_all_command_modules
 
 __all__ = ["main", "get_api_client"]
+
+
+def __getattr__(name):
+    """Command modules are imported on first use, see command_registry"""
+
+    if not name.startswith("_"):
+        for module in reversed(load_all_command_modules()):
+            names = getattr(module, "__all__", None) or dir(module)
+            if name in names:
+                return getattr(module, name)
+
+    raise AttributeError("module {} has no attribute {}".format(__name__, name))
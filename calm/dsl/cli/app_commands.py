@@ -217,7 +217,7 @@ def _watch_app(app_name, poll_interval):
     """Watch an app"""
 
     def display_action(screen):
-        watch_app(app_name, screen)
+        watch_app(app_name, screen, poll_interval=poll_interval)
         screen.wait_for_input(10.0)
 
     Display.wrapper(display_action, watch=True)
@@ -16,6 +16,8 @@ from calm.dsl.config import get_context
 
 from .utils import get_name_query, get_states_filter, highlight_text, Display
 from .constants import APPLICATION, RUNLOG, SYSTEM_ACTIONS
+from .runlog import RunlogTree
+from .poller import poll_until, get_response_state
 from .bps import (
     launch_blueprint_simple,
     compile_blueprint,
@@ -391,41 +393,30 @@ class RunlogJSONEncoder(JSONEncoder):
         return "\n".join(encodedStringList)
 
 
+def get_runlog_node_lines(node):
+    """returns encoded lines of runlog node, re-encoded only if node changed"""
+
+    version = getattr(node, "version", None)
+    cache = getattr(node, "lines_cache", None)
+    if cache is None or cache[0] != version:
+        cache = (version, json.dumps(node, cls=RunlogJSONEncoder).split("\\n"))
+        node.lines_cache = cache
+    return cache[1]
+
+
 def get_completion_func(screen):
+
+    # Runlog tree maintained across polls
+    tree = RunlogTree(node_class=RunlogNode)
+
     def is_action_complete(response):
 
         entities = response["entities"]
         if len(entities):
 
-            # Sort entities based on creation time
-            sorted_entities = sorted(
-                entities, key=lambda x: int(x["metadata"]["creation_time"])
-            )
-
-            # Create nodes of runlog tree and a map based on uuid
-            root = None
-            nodes = {}
-            for runlog in sorted_entities:
-                # Create root node
-                # TODO - Get details of root node
-                if not root:
-                    root_uuid = runlog["status"]["root_reference"]["uuid"]
-                    root_runlog = {
-                        "metadata": {"uuid": root_uuid},
-                        "status": {"type": "action_runlog", "state": ""},
-                    }
-                    root = RunlogNode(root_runlog)
-                    nodes[str(root_uuid)] = root
-
-                uuid = runlog["metadata"]["uuid"]
-                nodes[str(uuid)] = RunlogNode(runlog, parent=root)
-
-            # Attach parent to nodes
-            for runlog in sorted_entities:
-                uuid = runlog["metadata"]["uuid"]
-                parent_uuid = runlog["status"]["parent_reference"]["uuid"]
-                node = nodes[str(uuid)]
-                node.parent = nodes[str(parent_uuid)]
+            # Apply only the runlogs that are new or changed since last poll
+            tree.update(entities)
+            sorted_entities = tree.runlogs
 
             # Show Progress
             # TODO - Draw progress bar
@@ -446,9 +437,8 @@ def get_completion_func(screen):
 
             # Render Tree on next line
             line = 1
-            for pre, fill, node in RenderTree(root):
-                lines = json.dumps(node, cls=RunlogJSONEncoder).split("\\n")
-                for linestr in lines:
+            for pre, fill, node in RenderTree(tree.root):
+                for linestr in get_runlog_node_lines(node):
                     tabcount = linestr.count("\\t")
                     if not tabcount:
                         screen.print_at("{}{}".format(pre, linestr), 0, line)
@@ -599,7 +589,6 @@ def watch_app(app_name, screen, app=None, poll_interval=10):
             if not is_app_describe:
                 screen.print_at(msg, 0, line)
                 screen.refresh()
-                time.sleep(10)
             return (is_complete, msg)
         return (False, "")
 
@@ -1517,21 +1506,17 @@ def run_actions(
 
 
 def poll_runnnable(poll_func, completion_func, poll_interval=10):
-    # Poll every 10 seconds on the app status, for 5 mins
-    maxWait = 5 * 60
-    count = 0
-    while count < maxWait:
+    # Poll on the app status (atmost every poll_interval seconds), for 5 mins
+    def poll():
         # call status api
         res, err = poll_func()
         if err:
             raise Exception("[{}] - {}".format(err["code"], err["error"]))
         response = res.json()
         (completed, msg) = completion_func(response)
-        if completed:
-            # click.echo(msg)
-            break
-        count += poll_interval
-        time.sleep(poll_interval)
+        return (completed, get_response_state(response))
+
+    poll_until(poll, max_interval=poll_interval, timeout=5 * 60)
 
 
 def download_runlog(runlog_id, app_name, file_name):
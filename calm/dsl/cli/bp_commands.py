@@ -15,6 +15,7 @@ from .bps import (
     format_blueprint_command,
     compile_blueprint_command,
     launch_blueprint_simple,
+    launch_blueprints,
     patch_bp_if_required,
     delete_blueprint,
     decompile_bp,
@@ -130,9 +131,15 @@ def _format_blueprint_command(bp_file):
     default="json",
     help="output format",
 )
-def _compile_blueprint_command(bp_file, brownfield_deployment_file, out):
+@click.option(
+    "--use-cache/--no-use-cache",
+    "use_cache",
+    default=False,
+    help="Reuse payload compiled earlier if blueprint and the files it uses are unchanged",
+)
+def _compile_blueprint_command(bp_file, brownfield_deployment_file, out, use_cache):
     """Compiles a DSL (Python) blueprint into JSON or YAML"""
-    compile_blueprint_command(bp_file, brownfield_deployment_file, out)
+    compile_blueprint_command(bp_file, brownfield_deployment_file, out, use_cache)
 
 
 @decompile.command("bp", experimental=True)
@@ -164,10 +171,17 @@ def _compile_blueprint_command(bp_file, brownfield_deployment_file, out):
     default=None,
     help="Blueprint directory location used for placing decompiled entities",
 )
-def _decompile_bp(name, bp_file, with_secrets, prefix, bp_dir):
+@click.option(
+    "--no-format",
+    "no_format",
+    is_flag=True,
+    default=False,
+    help="Skip formatting decompiled blueprint file using black",
+)
+def _decompile_bp(name, bp_file, with_secrets, prefix, bp_dir, no_format):
     """Decompiles blueprint present on server or json file"""
 
-    decompile_bp(name, bp_file, with_secrets, prefix, bp_dir)
+    decompile_bp(name, bp_file, with_secrets, prefix, bp_dir, format_code=not no_format)
 
 
 @create.command("bp")
@@ -398,6 +412,72 @@ def launch_blueprint_command(
         LOG.info("Action runs completed for app {}".format(app_name))
 
 
+@launch.command("bps")
+@click.option(
+    "--file",
+    "-f",
+    "manifest_file",
+    type=click.Path(exists=True, file_okay=True, dir_okay=False, readable=True),
+    required=True,
+    help="Path of yaml/json manifest file listing the launches",
+)
+@click.option(
+    "--max-inflight",
+    "-m",
+    "max_inflight",
+    type=int,
+    default=10,
+    show_default=True,
+    help="Maximum number of launches pending at a time",
+)
+@click.option(
+    "--report",
+    "-r",
+    "report_file",
+    default=None,
+    help="Path of json file to write the launch results to",
+)
+@click.option(
+    "--poll-interval",
+    "poll_interval",
+    "-pi",
+    type=int,
+    default=10,
+    show_default=True,
+    help="Maximum interval between status checks of a launch",
+)
+@click.option(
+    "--max-requests",
+    "max_requests",
+    type=click.IntRange(min=1),
+    default=5,
+    show_default=True,
+    help="Maximum requests sent to server per second",
+)
+def _launch_blueprints(
+    manifest_file, max_inflight, report_file, poll_interval, max_requests
+):
+    """Launches many apps from blueprints listed in a manifest file.
+    Launches are submitted concurrently and polled together. Runtime editables are taken from the 'launch_params' file of the launch, defaults are used if it is not given.
+
+    \b
+    >: manifest file: yaml/json file listing the launches
+    Ex: launches:
+          - blueprint: <Blueprint Name>
+            app_name: <App Name>
+            profile: <Profile Name>               # Optional
+            launch_params: <launch_params file>   # Optional, relative to manifest
+    """
+
+    launch_blueprints(
+        manifest_file,
+        max_inflight=max_inflight,
+        report_file=report_file,
+        poll_interval=poll_interval,
+        max_requests=max_requests,
+    )
+
+
 @delete.command("bp")
 @click.argument("blueprint_names", nargs=-1)
 def _delete_blueprint(blueprint_names):
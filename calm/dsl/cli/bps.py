@@ -1,6 +1,7 @@
 from re import sub
 import time
 import json
+import datetime
 import sys
 import os
 import uuid
@@ -27,6 +28,7 @@ from calm.dsl.builtins import (
     init_dsl_metadata_map,
 )
 from calm.dsl.builtins.models.metadata_payload import get_metadata_payload
+from calm.dsl.builtins.models.utils import track_dependency_files
 from calm.dsl.config import get_context
 from calm.dsl.api import get_api_client
 from calm.dsl.store import Cache
@@ -42,6 +44,9 @@ from .utils import (
 from .secrets import find_secret, create_secret
 from .constants import BLUEPRINT
 from .environments import get_project_environment
+from .compile_cache import CompileCache
+from .poller import poll_until
+from .watcher import MultiWatcher, WatchTarget, WatchError, print_status_lines
 from calm.dsl.tools import get_module_from_file
 from calm.dsl.builtins import Brownfield as BF
 from calm.dsl.providers import get_provider
@@ -282,12 +287,43 @@ def get_brownfield_deployment_classes(brownfield_deployment_file=None):
     return bf_deployments
 
 
-def compile_blueprint(bp_file, brownfield_deployment_file=None):
+def compile_blueprint(bp_file, brownfield_deployment_file=None, use_cache=False):
+    """
+    returns payload of the blueprint. If use_cache is set, payload stored in
+    the compile cache is returned if the blueprint (or anything it depends
+    on) is not changed since it was compiled.
+    """
+
+    # Helper modules imported by the blueprint (also while loading metadata) are
+    # found by comparing with modules loaded now
+    old_module_names = set(sys.modules)
 
     # Constructing metadata payload
     # Note: This should be constructed before loading bp module. As metadata will be used while getting bp_payload
+    # Only the metadata class (and what it depends on) is executed here, the blueprint module is executed once below
     metadata_payload = get_metadata_payload(bp_file)
 
+    if not use_cache:
+        return _compile_blueprint(bp_file, brownfield_deployment_file, metadata_payload)
+
+    compile_cache = CompileCache(bp_file, brownfield_deployment_file)
+    bp_payload = compile_cache.get_payload()
+    if bp_payload is not None:
+        return bp_payload
+
+    with track_dependency_files() as read_files:
+        bp_payload = _compile_blueprint(
+            bp_file, brownfield_deployment_file, metadata_payload
+        )
+
+    if bp_payload is not None:
+        compile_cache.set_payload(bp_payload, read_files, old_module_names)
+
+    return bp_payload
+
+
+def _compile_blueprint(bp_file, brownfield_deployment_file, metadata_payload):
+
     user_bp_module = get_blueprint_module_from_file(bp_file)
     UserBlueprint = get_blueprint_class_from_module(user_bp_module)
     if UserBlueprint is None:
@@ -472,7 +508,9 @@ def create_blueprint_from_dsl(
     )
 
 
-def decompile_bp(name, bp_file, with_secrets=False, prefix="", bp_dir=None):
+def decompile_bp(
+    name, bp_file, with_secrets=False, prefix="", bp_dir=None, format_code=True
+):
     """helper to decompile blueprint"""
 
     if name and bp_file:
@@ -483,12 +521,20 @@ def decompile_bp(name, bp_file, with_secrets=False, prefix="", bp_dir=None):
 
     if name:
         decompile_bp_from_server(
-            name=name, with_secrets=with_secrets, prefix=prefix, bp_dir=bp_dir
+            name=name,
+            with_secrets=with_secrets,
+            prefix=prefix,
+            bp_dir=bp_dir,
+            format_code=format_code,
         )
 
     elif bp_file:
         decompile_bp_from_file(
-            filename=bp_file, with_secrets=with_secrets, prefix=prefix, bp_dir=bp_dir
+            filename=bp_file,
+            with_secrets=with_secrets,
+            prefix=prefix,
+            bp_dir=bp_dir,
+            format_code=format_code,
         )
 
     else:
@@ -498,7 +544,9 @@ def decompile_bp(name, bp_file, with_secrets=False, prefix="", bp_dir=None):
         sys.exit(-1)
 
 
-def decompile_bp_from_server(name, with_secrets=False, prefix="", bp_dir=None):
+def decompile_bp_from_server(
+    name, with_secrets=False, prefix="", bp_dir=None, format_code=True
+):
     """decompiles the blueprint by fetching it from server"""
 
     client = get_api_client()
@@ -511,22 +559,34 @@ def decompile_bp_from_server(name, with_secrets=False, prefix="", bp_dir=None):
 
     res = res.json()
     _decompile_bp(
-        bp_payload=res, with_secrets=with_secrets, prefix=prefix, bp_dir=bp_dir
+        bp_payload=res,
+        with_secrets=with_secrets,
+        prefix=prefix,
+        bp_dir=bp_dir,
+        format_code=format_code,
     )
 
 
-def decompile_bp_from_file(filename, with_secrets=False, prefix="", bp_dir=None):
+def decompile_bp_from_file(
+    filename, with_secrets=False, prefix="", bp_dir=None, format_code=True
+):
     """decompile blueprint from local blueprint file"""
 
     # ToDo - Fix this
     bp_payload = json.loads(open(filename).read())
     # bp_payload = read_spec(filename)
     _decompile_bp(
-        bp_payload=bp_payload, with_secrets=with_secrets, prefix=prefix, bp_dir=bp_dir
+        bp_payload=bp_payload,
+        with_secrets=with_secrets,
+        prefix=prefix,
+        bp_dir=bp_dir,
+        format_code=format_code,
     )
 
 
-def _decompile_bp(bp_payload, with_secrets=False, prefix="", bp_dir=None):
+def _decompile_bp(
+    bp_payload, with_secrets=False, prefix="", bp_dir=None, format_code=True
+):
     """decompiles the blueprint from payload"""
 
     blueprint = bp_payload["spec"]["resources"]
@@ -569,6 +629,7 @@ def _decompile_bp(bp_payload, with_secrets=False, prefix="", bp_dir=None):
         with_secrets=with_secrets,
         metadata_obj=metadata_obj,
         bp_dir=bp_dir,
+        format_code=format_code,
     )
     click.echo(
         "\nSuccessfully decompiled. Directory location: {}. Blueprint location: {}".format(
@@ -577,10 +638,14 @@ def _decompile_bp(bp_payload, with_secrets=False, prefix="", bp_dir=None):
     )
 
 
-def compile_blueprint_command(bp_file, brownfield_deployment_file, out):
+def compile_blueprint_command(
+    bp_file, brownfield_deployment_file, out, use_cache=False
+):
 
     bp_payload = compile_blueprint(
-        bp_file, brownfield_deployment_file=brownfield_deployment_file
+        bp_file,
+        brownfield_deployment_file=brownfield_deployment_file,
+        use_cache=use_cache,
     )
     if bp_payload is None:
         LOG.error("User blueprint not found in {}".format(bp_file))
@@ -963,23 +1028,27 @@ def get_variable_value_options(bp_uuid, var_uuid, poll_interval=10):
     trl_id = var_task_data["trl_id"]
 
     # Poll till completion of epsilon task
-    maxWait = 5 * 60
-    count = 0
-    while count < maxWait:
+    result = {}
+
+    def poll_func():
         res, err = client.blueprint.variable_values_from_trlid(
             uuid=bp_uuid, var_uuid=var_uuid, req_id=req_id, trl_id=trl_id
         )
 
         # If there is exception during variable api call, it would be silently ignored
         if err:
-            return list(), err
+            result["values"] = (list(), err)
+            return (True, None)
 
         var_val_data = res.json()
         if var_val_data["state"] == "SUCCESS":
-            return var_val_data["values"], None
+            result["values"] = (var_val_data["values"], None)
+            return (True, var_val_data["state"])
+
+        return (False, var_val_data["state"])
 
-        count += poll_interval
-        time.sleep(poll_interval)
+    if poll_until(poll_func, max_interval=poll_interval, timeout=5 * 60):
+        return result["values"]
 
     LOG.error("Waited for 5 minutes for dynamic variable evaludation")
     sys.exit(-1)
@@ -1230,147 +1299,42 @@ def get_protection_policy_rule(
     return selected_policy, rule_choices[selected_rule]["rule"]
 
 
-def launch_blueprint_simple(
-    blueprint_name=None,
-    app_name=None,
-    blueprint=None,
-    profile_name=None,
-    patch_editables=True,
-    launch_params=None,
-    is_brownfield=False,
-    brownfield_deployment_file=None,
-):
-    client = get_api_client()
+def get_launch_profile(profiles, profile_name=None):
+    """returns runtime editables of profile, first profile if name is not given"""
 
-    if app_name:
-        LOG.info("Searching for existing applications with name {}".format(app_name))
+    if profile_name is None:
+        return profiles[0]
 
-        res, err = client.application.list(
-            params={"filter": "name=={}".format(app_name)}
-        )
-        if err:
-            raise Exception("[{}] - {}".format(err["code"], err["error"]))
+    for app_profile in profiles:
+        app_prof_ref = app_profile.get("app_profile_reference", {})
+        if app_prof_ref.get("name") == profile_name:
+            return app_profile
 
-        res = res.json()
-        total_matches = res["metadata"]["total_matches"]
-        if total_matches:
-            LOG.debug(res)
-            LOG.error("Application Name ({}) is already used.".format(app_name))
-            sys.exit(-1)
+    LOG.error("No profile found with name {}".format(profile_name))
+    sys.exit(-1)
 
-        LOG.info("No existing application found with name {}".format(app_name))
 
-    if not blueprint:
-        blueprint = get_blueprint(blueprint_name, is_brownfield=is_brownfield)
+def get_blueprint_launch_payload(
+    client,
+    blueprint,
+    app_name,
+    profile,
+    blueprint_name=None,
+    patch_editables=True,
+    launch_params=None,
+    bp_data=None,
+):
+    """
+    returns launch payload of blueprint using runtime editables of profile.
+    Editables are patched from launch_params file (or cli prompts) if
+    patch_editables is set. bp_data is blueprint read response, it is fetched
+    if not given.
+    """
 
     bp_metadata = blueprint.get("metadata", {})
-    bp_status_data = blueprint.get("status", {})
-
     blueprint_uuid = bp_metadata.get("uuid", "")
-    blueprint_name = blueprint_name or blueprint.get("metadata", {}).get("name", "")
-
-    project_ref = bp_metadata.get("project_reference", {})
-    project_uuid = project_ref.get("uuid")
-    bp_status = bp_status_data["state"]
-    if bp_status != "ACTIVE":
-        LOG.error("Blueprint is in {} state. Unable to launch it".format(bp_status))
-        sys.exit(-1)
-
-    LOG.info("Fetching runtime editables in the blueprint")
-    profiles = get_blueprint_runtime_editables(client, blueprint)
-    profile = None
-    if profile_name is None:
-        profile = profiles[0]
-    else:
-        for app_profile in profiles:
-            app_prof_ref = app_profile.get("app_profile_reference", {})
-            if app_prof_ref.get("name") == profile_name:
-                profile = app_profile
-
-                break
-        if not profile:
-            LOG.error("No profile found with name {}".format(profile_name))
-            sys.exit(-1)
-
-    runtime_bf_deployment_list = []
-    if brownfield_deployment_file:
-        bp_metadata = blueprint.get("metadata", {})
-        project_uuid = bp_metadata.get("project_reference", {}).get("uuid", "")
-
-        # Set bp project in dsl context
-        ContextObj = get_context()
-        project_config = ContextObj.get_project_config()
-        project_name = project_config["name"]
-
-        if project_uuid:
-            project_data = Cache.get_entity_data_using_uuid(
-                entity_type=CACHE.ENTITY.PROJECT, uuid=project_uuid
-            )
-            bp_project = project_data.get("name")
-
-            if bp_project and bp_project != project_name:
-                project_name = bp_project
-                ContextObj.update_project_context(project_name=project_name)
-
-        bf_deployments = get_brownfield_deployment_classes(brownfield_deployment_file)
-
-        bp_profile_data = {}
-        for _profile in bp_status_data["resources"]["app_profile_list"]:
-            if _profile["name"] == profile["app_profile_reference"]["name"]:
-                bp_profile_data = _profile
-
-        # Get substrate-account map
-        bp_subs_uuid_account_uuid_map = {}
-        for _sub in bp_status_data["resources"]["substrate_definition_list"]:
-            if _sub.get("type", "") == "EXISTING_VM":
-                bp_subs_uuid_account_uuid_map[_sub["uuid"]] = ""
-                continue
-
-            account_uuid = _sub["create_spec"]["resources"]["account_uuid"]
-
-            if _sub.get("type", "") == "AHV_VM":
-                account_data = Cache.get_entity_data_using_uuid(
-                    entity_type=CACHE.ENTITY.ACCOUNT, uuid=account_uuid
-                )
-                # replace pe account uuid by pc account uuid
-                account_uuid = account_data["data"]["pc_account_uuid"]
-
-            bp_subs_uuid_account_uuid_map[_sub["uuid"]] = account_uuid
-
-        # Get dep name-uuid map and dep-account_uuid map
-        bp_dep_name_uuid_map = {}
-        bp_dep_name_account_uuid_map = {}
-        for _dep in bp_profile_data.get("deployment_create_list", []):
-            bp_dep_name_uuid_map[_dep["name"]] = _dep["uuid"]
-
-            _dep_sub_uuid = _dep["substrate_local_reference"]["uuid"]
-            bp_dep_name_account_uuid_map[_dep["name"]] = bp_subs_uuid_account_uuid_map[
-                _dep_sub_uuid
-            ]
-
-        # Compile brownfield deployment after attaching valid account to instance
-        for _bf_dep in bf_deployments:
-            _bf_dep_name = getattr(_bf_dep, "name", "") or _bf_dep.__name__
-
-            # Attaching correct account to brownfield instances
-            for _inst in _bf_dep.instances:
-                _inst.account_uuid = bp_dep_name_account_uuid_map[_bf_dep_name]
-
-            _bf_dep = _bf_dep.get_dict()
-
-            if _bf_dep_name in list(bp_dep_name_uuid_map.keys()):
-                runtime_bf_deployment_list.append(
-                    {
-                        "uuid": bp_dep_name_uuid_map[_bf_dep_name],
-                        "name": _bf_dep_name,
-                        "value": {
-                            "brownfield_instance_list": _bf_dep.get(
-                                "brownfield_instance_list"
-                            )
-                            or []
-                        },
-                    }
-                )
+    blueprint_name = blueprint_name or bp_metadata.get("name", "")
+    project_uuid = bp_metadata.get("project_reference", {}).get("uuid")
 
     runtime_editables = profile.pop("runtime_editables", [])
 
@@ -1401,12 +1365,13 @@ def launch_blueprint_simple(
             launch_params, "snapshot"
         )
 
-        res, err = client.blueprint.read(blueprint_uuid)
-        if err:
-            LOG.error("[{}] - {}".format(err["code"], err["error"]))
-            sys.exit(-1)
+        if bp_data is None:
+            res, err = client.blueprint.read(blueprint_uuid)
+            if err:
+                LOG.error("[{}] - {}".format(err["code"], err["error"]))
+                sys.exit(-1)
 
-        bp_data = res.json()
+            bp_data = res.json()
 
         substrate_list = runtime_editables.get("substrate_list", [])
         if substrate_list:
@@ -1669,6 +1634,149 @@ def launch_blueprint_simple(
         )
         LOG.info("Updated blueprint editables are:\n{}".format(runtime_editables_json))
 
+    return launch_payload
+
+
+def launch_blueprint_simple(
+    blueprint_name=None,
+    app_name=None,
+    blueprint=None,
+    profile_name=None,
+    patch_editables=True,
+    launch_params=None,
+    is_brownfield=False,
+    brownfield_deployment_file=None,
+):
+    client = get_api_client()
+
+    if app_name:
+        LOG.info("Searching for existing applications with name {}".format(app_name))
+
+        res, err = client.application.list(
+            params={"filter": "name=={}".format(app_name)}
+        )
+        if err:
+            raise Exception("[{}] - {}".format(err["code"], err["error"]))
+
+        res = res.json()
+        total_matches = res["metadata"]["total_matches"]
+        if total_matches:
+            LOG.debug(res)
+            LOG.error("Application Name ({}) is already used.".format(app_name))
+            sys.exit(-1)
+
+        LOG.info("No existing application found with name {}".format(app_name))
+
+    if not blueprint:
+        blueprint = get_blueprint(blueprint_name, is_brownfield=is_brownfield)
+
+    bp_metadata = blueprint.get("metadata", {})
+    bp_status_data = blueprint.get("status", {})
+
+    blueprint_uuid = bp_metadata.get("uuid", "")
+    blueprint_name = blueprint_name or blueprint.get("metadata", {}).get("name", "")
+
+    project_ref = bp_metadata.get("project_reference", {})
+    project_uuid = project_ref.get("uuid")
+    bp_status = bp_status_data["state"]
+    if bp_status != "ACTIVE":
+        LOG.error("Blueprint is in {} state. Unable to launch it".format(bp_status))
+        sys.exit(-1)
+
+    LOG.info("Fetching runtime editables in the blueprint")
+    profiles = get_blueprint_runtime_editables(client, blueprint)
+    profile = get_launch_profile(profiles, profile_name)
+
+    runtime_bf_deployment_list = []
+    if brownfield_deployment_file:
+        bp_metadata = blueprint.get("metadata", {})
+        project_uuid = bp_metadata.get("project_reference", {}).get("uuid", "")
+
+        # Set bp project in dsl context
+        ContextObj = get_context()
+        project_config = ContextObj.get_project_config()
+        project_name = project_config["name"]
+
+        if project_uuid:
+            project_data = Cache.get_entity_data_using_uuid(
+                entity_type=CACHE.ENTITY.PROJECT, uuid=project_uuid
+            )
+            bp_project = project_data.get("name")
+
+            if bp_project and bp_project != project_name:
+                project_name = bp_project
+                ContextObj.update_project_context(project_name=project_name)
+
+        bf_deployments = get_brownfield_deployment_classes(brownfield_deployment_file)
+
+        bp_profile_data = {}
+        for _profile in bp_status_data["resources"]["app_profile_list"]:
+            if _profile["name"] == profile["app_profile_reference"]["name"]:
+                bp_profile_data = _profile
+
+        # Get substrate-account map
+        bp_subs_uuid_account_uuid_map = {}
+        for _sub in bp_status_data["resources"]["substrate_definition_list"]:
+            if _sub.get("type", "") == "EXISTING_VM":
+                bp_subs_uuid_account_uuid_map[_sub["uuid"]] = ""
+                continue
+
+            account_uuid = _sub["create_spec"]["resources"]["account_uuid"]
+
+            if _sub.get("type", "") == "AHV_VM":
+                account_data = Cache.get_entity_data_using_uuid(
+                    entity_type=CACHE.ENTITY.ACCOUNT, uuid=account_uuid
+                )
+                # replace pe account uuid by pc account uuid
+                account_uuid = account_data["data"]["pc_account_uuid"]
+
+            bp_subs_uuid_account_uuid_map[_sub["uuid"]] = account_uuid
+
+        # Get dep name-uuid map and dep-account_uuid map
+        bp_dep_name_uuid_map = {}
+        bp_dep_name_account_uuid_map = {}
+        for _dep in bp_profile_data.get("deployment_create_list", []):
+            bp_dep_name_uuid_map[_dep["name"]] = _dep["uuid"]
+
+            _dep_sub_uuid = _dep["substrate_local_reference"]["uuid"]
+            bp_dep_name_account_uuid_map[_dep["name"]] = bp_subs_uuid_account_uuid_map[
+                _dep_sub_uuid
+            ]
+
+        # Compile brownfield deployment after attaching valid account to instance
+        for _bf_dep in bf_deployments:
+            _bf_dep_name = getattr(_bf_dep, "name", "") or _bf_dep.__name__
+
+            # Attaching correct account to brownfield instances
+            for _inst in _bf_dep.instances:
+                _inst.account_uuid = bp_dep_name_account_uuid_map[_bf_dep_name]
+
+            _bf_dep = _bf_dep.get_dict()
+
+            if _bf_dep_name in list(bp_dep_name_uuid_map.keys()):
+                runtime_bf_deployment_list.append(
+                    {
+                        "uuid": bp_dep_name_uuid_map[_bf_dep_name],
+                        "name": _bf_dep_name,
+                        "value": {
+                            "brownfield_instance_list": _bf_dep.get(
+                                "brownfield_instance_list"
+                            )
+                            or []
+                        },
+                    }
+                )
+
+    launch_payload = get_blueprint_launch_payload(
+        client,
+        blueprint,
+        app_name,
+        profile,
+        blueprint_name=blueprint_name,
+        patch_editables=patch_editables,
+        launch_params=launch_params,
+    )
+
     if runtime_bf_deployment_list:
         bf_dep_names = [bfd["name"] for bfd in runtime_bf_deployment_list]
         runtime_deployments = launch_payload["spec"]["runtime_editables"].get(
@@ -1702,11 +1810,9 @@ def launch_blueprint_simple(
     poll_launch_status(client, blueprint_uuid, launch_req_id)
 
 
-def poll_launch_status(client, blueprint_uuid, launch_req_id):
-    # Poll every 10 seconds on the app status, for 5 mins
-    maxWait = 5 * 60
-    count = 0
-    while count < maxWait:
+def poll_launch_status(client, blueprint_uuid, launch_req_id, poll_interval=10):
+    # Poll on the app status (atmost every poll_interval seconds), for 5 mins
+    def poll_func():
         # call status api
         LOG.info("Polling status of Launch")
         res, err = client.blueprint.poll_launch(blueprint_uuid, launch_req_id)
@@ -1728,16 +1834,204 @@ def poll_launch_status(client, blueprint_uuid, launch_req_id):
                     pc_ip, pc_port, app_uuid
                 )
             )
-            break
+            return (True, app_state)
         elif app_state == "failure":
             LOG.debug("API response: {}".format(response))
             LOG.error("Failed to launch blueprint. Check API response above.")
-            break
+            return (True, app_state)
         elif err:
             raise Exception("[{}] - {}".format(err["code"], err["error"]))
         LOG.info(app_state)
-        count += 10
-        time.sleep(10)
+        return (False, app_state)
+
+    poll_until(poll_func, max_interval=poll_interval, timeout=5 * 60)
+
+
+class LaunchTarget(WatchTarget):
+    """Launch of an app, started by submitting the launch request"""
+
+    kind = "launch"
+    terminal_states = ["success", "failure"]
+    failure_states = ["failure"]
+
+    def __init__(self, app_name, blueprint_name, blueprint_uuid, launch_payload):
+        super().__init__(app_name)
+        self.blueprint_name = blueprint_name
+        self.blueprint_uuid = blueprint_uuid
+        self.launch_payload = launch_payload
+        self.request_id = None
+        self.submit_time = None
+
+    def resolve(self, client):
+        res, err = client.application.list(
+            params={"filter": "name=={}".format(self.name)}
+        )
+        if err:
+            raise Exception("[{}] - {}".format(err["code"], err["error"]))
+
+        if res.json()["metadata"]["total_matches"]:
+            raise Exception("Application Name ({}) is already used.".format(self.name))
+
+        self.submit_time = datetime.datetime.now().isoformat()
+        res, err = client.blueprint.launch(self.blueprint_uuid, self.launch_payload)
+        if err:
+            raise Exception("[{}] - {}".format(err["code"], err["error"]))
+
+        self.request_id = res.json()["status"]["request_id"]
+
+    def read_state(self, client):
+        res, err = client.blueprint.poll_launch(self.blueprint_uuid, self.request_id)
+        if err:
+            raise WatchError(err)
+
+        status = res.json()["status"]
+        if status["state"] == "success":
+            self.uuid = status.get("application_uuid")
+        return status["state"]
+
+    def to_dict(self):
+        data = super().to_dict()
+        data.update(
+            {
+                "blueprint": self.blueprint_name,
+                "request_id": self.request_id,
+                "submit_time": self.submit_time,
+            }
+        )
+        return data
+
+
+def get_launch_manifest(manifest_file):
+    """returns launch entries of bulk launch manifest (yaml/json)"""
+
+    with open(manifest_file) as fd:
+        manifest = yaml.safe_load(fd)
+
+    if isinstance(manifest, dict):
+        manifest = manifest.get("launches", [])
+
+    manifest_dir = os.path.dirname(os.path.abspath(manifest_file))
+    app_names = set()
+    for entry in manifest:
+        if not entry.get("blueprint") or not entry.get("app_name"):
+            LOG.error(
+                "Each launch must have 'blueprint' and 'app_name': {}".format(entry)
+            )
+            sys.exit(-1)
+
+        if entry["app_name"] in app_names:
+            LOG.error("App name {} is repeated in manifest".format(entry["app_name"]))
+            sys.exit(-1)
+        app_names.add(entry["app_name"])
+
+        # launch_params file is relative to manifest file
+        if entry.get("launch_params"):
+            entry["launch_params"] = os.path.join(manifest_dir, entry["launch_params"])
+
+    return manifest
+
+
+def launch_blueprints(
+    manifest_file, max_inflight=10, report_file=None, poll_interval=10, max_requests=5
+):
+    """
+    Launches apps listed in manifest file. Blueprints and their runtime
+    editables are fetched once, launches are submitted concurrently keeping
+    atmost max_inflight launches pending and all of them are polled together.
+    """
+
+    client = get_api_client()
+    manifest = get_launch_manifest(manifest_file)
+
+    blueprints = {}
+    blueprint_profiles = {}
+    targets = []
+    for entry in manifest:
+        blueprint_name = entry["blueprint"]
+        if blueprint_name not in blueprints:
+            blueprint = get_blueprint(blueprint_name)
+            bp_status = blueprint["status"]["state"]
+            if bp_status != "ACTIVE":
+                LOG.error(
+                    "Blueprint {} is in {} state. Unable to launch it".format(
+                        blueprint_name, bp_status
+                    )
+                )
+                sys.exit(-1)
+
+            LOG.info(
+                "Fetching runtime editables in the blueprint {}".format(blueprint_name)
+            )
+            blueprints[blueprint_name] = blueprint
+            blueprint_profiles[blueprint_name] = get_blueprint_runtime_editables(
+                client, blueprint
+            )
+
+        blueprint = blueprints[blueprint_name]
+        profile = deepcopy(
+            get_launch_profile(blueprint_profiles[blueprint_name], entry.get("profile"))
+        )
+
+        # Runtime editables are patched only from launch_params, defaults are used otherwise
+        launch_params = entry.get("launch_params")
+        launch_payload = get_blueprint_launch_payload(
+            client,
+            blueprint,
+            entry["app_name"],
+            profile,
+            blueprint_name=blueprint_name,
+            patch_editables=bool(launch_params),
+            launch_params=launch_params,
+            bp_data=blueprint,
+        )
+        targets.append(
+            LaunchTarget(
+                entry["app_name"],
+                blueprint_name,
+                blueprint["metadata"]["uuid"],
+                launch_payload,
+            )
+        )
+
+    LOG.info(
+        "Launching {} apps, atmost {} at a time".format(len(targets), max_inflight)
+    )
+    watcher = MultiWatcher(
+        targets,
+        poll_interval=poll_interval,
+        max_requests=max_requests,
+        max_active=max_inflight,
+        on_change=print_status_lines,
+        client=client,
+    )
+    watcher.run()
+
+    results = [target.to_dict() for target in targets]
+    table = PrettyTable()
+    table.field_names = ["APP NAME", "BLUEPRINT", "STATE", "LATENCY (s)", "APP UUID"]
+    for result in results:
+        table.add_row(
+            [
+                highlight_text(result["name"]),
+                highlight_text(result["blueprint"]),
+                highlight_text(result["state"] or result["error"]),
+                highlight_text(result["elapsed"]),
+                highlight_text(result["uuid"]),
+            ]
+        )
+    click.echo(table)
+
+    if report_file:
+        with open(report_file, "w") as fd:
+            json.dump(results, fd, indent=4, separators=(",", ": "))
+        LOG.info("Launch report saved as {}".format(report_file))
+
+    failed_targets = [x for x in targets if x.failed or not x.completed]
+    if failed_targets:
+        LOG.error("{} of {} launches failed".format(len(failed_targets), len(targets)))
+        sys.exit(-1)
+
+    LOG.info("All {} apps launched successfully".format(len(targets)))
 
 
 def delete_blueprint(blueprint_names):
@@ -47,13 +47,20 @@ def clear_cache():
     help="Cache entity, if not given will update whole cache",
     type=click.Choice(get_cache_table_types()),
 )
-def update_cache(entity):
+@click.option(
+    "--incremental",
+    "-i",
+    is_flag=True,
+    default=False,
+    help="Update only the entities changed on server since last update",
+)
+def update_cache(entity, incremental):
     """Update the data for dynamic entities stored in the cache"""
 
     if entity:
-        Cache.sync_table(entity)
+        Cache.sync_table(entity, incremental=incremental)
         Cache.show_table(entity)
     else:
-        Cache.sync()
+        Cache.sync(incremental=incremental)
         Cache.show_data()
     LOG.info(highlight_text("Cache updated at {}".format(datetime.datetime.now())))
@@ -0,0 +1,141 @@
+"""
+Lazy loading of cli command modules.
+
+Command modules attach their commands to the groups defined in `main`
+(`get`, `create` ...). Instead of importing all of them at startup, their
+sources are scanned for command decorators and a module is imported only when
+one of its commands is looked up.
+"""
+
+import os
+import re
+import importlib
+from collections import defaultdict
+
+
+# Order of modules is the order in which they were imported earlier
+COMMAND_MODULES = [
+    "bp_commands",
+    "app_commands",
+    "runbook_commands",
+    "library_tasks_commands",
+    "endpoint_commands",
+    "config_commands",
+    "account_commands",
+    "project_commands",
+    "secret_commands",
+    "cache_commands",
+    "completion_commands",
+    "init_command",
+    "marketplace_commands_main",
+    "marketplace_bp_commands",
+    "marketplace_item_commands",
+    "marketplace_runbook_commands",
+    "app_icon_commands",
+    "user_commands",
+    "group_commands",
+    "role_commands",
+    "directory_service_commands",
+    "acp_commands",
+    "task_commands",
+    "brownfield_commands",
+    "environment_commands",
+    "protection_policy_commands",
+    "vm_recovery_point_commands",
+    "scheduler_commands",
+    "network_group_commands",
+    "daemon_commands",
+    "watch_commands",
+]
+
+# Matches `@<group>.command("<name>", ...)` and `@<group>.group(...)`
+_DECORATOR_RE = re.compile(r'@(\w+)\.(?:command|group)\(\s*(?:"([^"]+)")?')
+_FUNCTION_RE = re.compile(r"def (\w+)\(")
+
+_COMMAND_MAP = None
+
+
+def _scan_module(module_name):
+    """returns (group, command name) pairs of commands defined in module"""
+
+    file_path = os.path.join(os.path.dirname(__file__), module_name + ".py")
+    with open(file_path) as fd:
+        lines = fd.read().splitlines()
+
+    commands = []
+    decorators = []
+    index = 0
+    while index < len(lines):
+        line = lines[index]
+        if line.startswith("@"):
+            # Decorator arguments may span multiple lines
+            while line.count("(") > line.count(")") and index + 1 < len(lines):
+                index += 1
+                line += lines[index]
+
+            match = _DECORATOR_RE.match(line)
+            if match:
+                decorators.append(match.groups())
+
+        elif line.startswith("def ") and decorators:
+            func_name = _FUNCTION_RE.match(line).group(1)
+            for group_name, cmd_name in decorators:
+                # click derives the command name from the function if not given
+                if not cmd_name:
+                    cmd_name = func_name.lower().replace("_", "-")
+                commands.append((group_name, cmd_name))
+            decorators = []
+
+        index += 1
+
+    return commands
+
+
+def _get_command_map():
+    """returns map of group name -> command name -> modules defining it"""
+
+    global _COMMAND_MAP
+    if _COMMAND_MAP is None:
+        command_map = defaultdict(lambda: defaultdict(list))
+        for module_name in COMMAND_MODULES:
+            for group_name, cmd_name in _scan_module(module_name):
+                command_map[group_name][cmd_name].append(module_name)
+        _COMMAND_MAP = command_map
+
+    return _COMMAND_MAP
+
+
+def _import_command_modules(module_names):
+
+    modules = []
+    for module_name in COMMAND_MODULES:
+        if module_name in module_names:
+            modules.append(
+                importlib.import_module("{}.{}".format(__package__, module_name))
+            )
+
+    return modules
+
+
+def load_command_modules(group_name, cmd_name=None):
+    """
+    imports modules defining `cmd_name` command of group. Function name of the
+    group callback is used as group name. All modules adding commands to the
+    group are imported if cmd_name is not given.
+    """
+
+    group_commands = _get_command_map().get(group_name, {})
+    if cmd_name:
+        module_names = group_commands.get(cmd_name, [])
+    else:
+        module_names = set()
+        for cmd_modules in group_commands.values():
+            module_names.update(cmd_modules)
+
+    return _import_command_modules(module_names)
+
+
+def load_all_command_modules():
+    """imports all command modules"""
+
+    return _import_command_modules(COMMAND_MODULES)
@@ -0,0 +1,225 @@
+"""
+On-disk cache of compiled blueprint payloads.
+
+An entry is stored per blueprint file. It is used only if the key (content
+of the dsl and brownfield files, calm version, cache db state, server and
+project config and dsl code) is unchanged and none of the files the
+blueprint depends on (files read by dsl helpers, modules imported while
+compiling it or from the blueprint directory, other than python's and
+installed packages' modules) has changed since the payload was compiled.
+"""
+
+import os
+import sys
+import site
+import json
+import hashlib
+import sysconfig
+
+import calm.dsl
+from calm.dsl.config import get_context
+from calm.dsl.builtins.models.schema import get_calm_version
+from calm.dsl.log import get_logging_handle
+
+LOG = get_logging_handle(__name__)
+
+_DSL_CODE_FINGERPRINT = None
+_LIBRARY_DIRS = None
+
+
+def _get_file_hash(file_path):
+    """returns sha1 of file content, None if file does not exist"""
+
+    try:
+        with open(file_path, "rb") as fd:
+            return hashlib.sha1(fd.read()).hexdigest()
+    except (FileNotFoundError, IsADirectoryError):
+        return None
+
+
+def _get_file_stat(file_path):
+    try:
+        stat = os.stat(file_path)
+        return "{}:{}".format(stat.st_size, stat.st_mtime_ns)
+    except FileNotFoundError:
+        return ""
+
+
+def _get_dsl_code_fingerprint():
+    """returns fingerprint of installed dsl code, payload may change with it"""
+
+    global _DSL_CODE_FINGERPRINT
+    if _DSL_CODE_FINGERPRINT is None:
+        key = hashlib.sha1()
+        dsl_dir = os.path.dirname(calm.dsl.__file__)
+        for root, dirs, files in os.walk(dsl_dir):
+            dirs.sort()
+            for file_name in sorted(files):
+                if file_name.endswith((".py", ".jinja2")):
+                    file_path = os.path.join(root, file_name)
+                    key.update(
+                        "{}:{};".format(file_path, _get_file_stat(file_path)).encode()
+                    )
+        _DSL_CODE_FINGERPRINT = key.hexdigest()
+
+    return _DSL_CODE_FINGERPRINT
+
+
+def _get_library_dirs():
+    """returns dirs of python's standard library, installed packages and dsl"""
+
+    global _LIBRARY_DIRS
+    if _LIBRARY_DIRS is None:
+        paths = sysconfig.get_paths()
+        library_dirs = {
+            paths[name]
+            for name in ["stdlib", "platstdlib", "purelib", "platlib"]
+            if paths.get(name)
+        }
+        if hasattr(site, "getsitepackages"):
+            library_dirs.update(site.getsitepackages())
+        library_dirs.add(site.getusersitepackages())
+        library_dirs.add(os.path.dirname(calm.dsl.__file__))
+
+        _LIBRARY_DIRS = tuple(
+            os.path.join(os.path.abspath(x), "") for x in sorted(library_dirs)
+        )
+
+    return _LIBRARY_DIRS
+
+
+def get_cache_dir():
+    """returns directory containing compile cache, it lives next to the db"""
+
+    init_config = get_context().get_init_config()
+    db_location = init_config["DB"]["location"]
+    return os.path.join(os.path.dirname(db_location), "compile_cache")
+
+
+class CompileCache:
+    """Compiled payload cache of a blueprint file"""
+
+    def __init__(self, bp_file, brownfield_deployment_file=None):
+        self.bp_file = os.path.abspath(bp_file)
+        self.brownfield_deployment_file = (
+            os.path.abspath(brownfield_deployment_file)
+            if brownfield_deployment_file
+            else ""
+        )
+
+        entry_name = hashlib.sha1(
+            "{}:{}".format(self.bp_file, self.brownfield_deployment_file).encode()
+        ).hexdigest()
+        self.entry_file = os.path.join(get_cache_dir(), entry_name + ".json")
+
+        # Key is computed before compiling, so that changes made meanwhile
+        # (cache update etc.) are not hidden by the stored entry
+        self.key = self._get_key()
+
+    def _get_key(self):
+
+        context = get_context()
+        server_config = context.get_server_config()
+        project_config = context.get_project_config()
+        init_config = context.get_init_config()
+
+        key_data = {
+            "bp_file": _get_file_hash(self.bp_file),
+            "brownfield_deployment_file": _get_file_hash(
+                self.brownfield_deployment_file
+            ),
+            "calm_version": str(get_calm_version()),
+            "db": _get_file_stat(init_config["DB"]["location"]),
+            "server": [
+                server_config.get("pc_ip"),
+                server_config.get("pc_port"),
+                server_config.get("pc_username"),
+            ],
+            "project": project_config.get("name"),
+            "dsl_code": _get_dsl_code_fingerprint(),
+        }
+        return hashlib.sha1(json.dumps(key_data, sort_keys=True).encode()).hexdigest()
+
+    def get_payload(self):
+        """returns the stored payload, None if it is missing or outdated"""
+
+        try:
+            with open(self.entry_file) as fd:
+                entry = json.load(fd)
+        except FileNotFoundError:
+            return None
+        except Exception as exp:
+            LOG.debug(
+                "Ignoring invalid compile cache {}: {}".format(self.entry_file, exp)
+            )
+            return None
+
+        if entry.get("key") != self.key:
+            LOG.debug("Compile cache of {} is outdated".format(self.bp_file))
+            return None
+
+        for file_path, file_hash in entry.get("dependencies", {}).items():
+            if _get_file_hash(file_path) != file_hash:
+                LOG.debug(
+                    "Dependency {} of {} is changed".format(file_path, self.bp_file)
+                )
+                return None
+
+        LOG.debug("Using compiled payload of {} from cache".format(self.bp_file))
+        return entry["payload"]
+
+    def get_dependency_files(self, read_files, old_module_names=None):
+        """
+        returns files read while compiling, modules from blueprint dir and
+        modules imported since sys.modules had old_module_names. Modules of
+        python and installed packages are skipped.
+        """
+
+        bp_dir = os.path.join(os.path.dirname(self.bp_file), "")
+        library_dirs = _get_library_dirs()
+        dependency_files = set(read_files)
+        for module_name, module in list(sys.modules.items()):
+            module_file = getattr(module, "__file__", None)
+            if not module_file:
+                continue
+
+            module_file = os.path.abspath(module_file)
+            if module_file.startswith(library_dirs):
+                continue
+
+            if module_file.startswith(bp_dir) or (
+                old_module_names is not None and module_name not in old_module_names
+            ):
+                dependency_files.add(module_file)
+
+        return dependency_files
+
+    def set_payload(self, payload, read_files, old_module_names=None):
+        """stores the payload along with hashes of the files it depends on"""
+
+        dependency_files = self.get_dependency_files(read_files, old_module_names)
+        entry = {
+            "key": self.key,
+            "dependencies": {
+                file_path: _get_file_hash(file_path)
+                for file_path in sorted(dependency_files)
+            },
+            "payload": payload,
+        }
+
+        try:
+            data = json.dumps(entry)
+        except TypeError as exp:
+            LOG.debug("Payload of {} can not be cached: {}".format(self.bp_file, exp))
+            return
+
+        cache_dir = os.path.dirname(self.entry_file)
+        os.makedirs(cache_dir, exist_ok=True)
+
+        # Payload contains secrets of credentials, only the user can read it
+        tmp_file = "{}.{}.tmp".format(self.entry_file, os.getpid())
+        with os.fdopen(
+            os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "w"
+        ) as fd:
+            fd.write(data)
+        os.replace(tmp_file, self.entry_file)
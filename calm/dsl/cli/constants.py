@@ -106,6 +106,16 @@ class APPLICATION:
         RESTARTING = "restarting"
         UPDATING = "updating"
 
+    # States in which no action/operation is running on the app
+    TERMINAL_STATES = [
+        STATES.RUNNING,
+        STATES.STOPPED,
+        STATES.ERROR,
+        STATES.DELETED,
+        STATES.TIMEOUT,
+    ]
+    FAILURE_STATES = [STATES.ERROR, STATES.TIMEOUT]
+
 
 class ACCOUNT:
     class STATES:
@@ -0,0 +1,67 @@
+import sys
+import click
+
+from calm.dsl.daemon import send_request, get_socket_path
+from calm.dsl.log import get_logging_handle
+
+from .main import main
+from .utils import FeatureFlagGroup
+
+LOG = get_logging_handle(__name__)
+
+socket_option = click.option(
+    "--socket",
+    "-s",
+    "socket_path",
+    default=None,
+    help="Path of daemon unix socket, defaults to $CALM_DSL_DAEMON_SOCKET or ~/.calm/daemon.sock",
+)
+
+
+@main.group(cls=FeatureFlagGroup)
+def daemon():
+    """Warm server running calm commands sent by `calmc` client
+
+    \b
+    Keeps schemas, api client connections and cache db loaded across commands:
+      calm daemon start &   -> Start daemon in background
+      calmc get bps         -> Run `calm get bps` on the daemon
+      calm daemon stop      -> Stop the daemon
+
+    \b
+    Commands run in daemon's environment, with the client's working directory.
+    Interactive prompts are not supported."""
+    pass
+
+
+@daemon.command("start")
+@socket_option
+def start_daemon(socket_path):
+    """Start calm daemon in foreground"""
+
+    from calm.dsl.daemon.server import run_server
+
+    run_server(socket_path)
+
+
+@daemon.command("stop")
+@socket_option
+def stop_daemon(socket_path):
+    """Stop calm daemon"""
+
+    if send_request({"action": "stop"}, socket_path) is None:
+        LOG.error(
+            "calm daemon is not running at {}".format(get_socket_path(socket_path))
+        )
+        sys.exit(-1)
+
+
+@daemon.command("status")
+@socket_option
+def daemon_status(socket_path):
+    """Show status of calm daemon"""
+
+    if send_request({"action": "status"}, socket_path) is None:
+        click.echo(
+            "calm daemon is not running at {}".format(get_socket_path(socket_path))
+        )
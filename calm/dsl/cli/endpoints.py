@@ -9,7 +9,11 @@ import click
 from prettytable import PrettyTable
 from black import format_file_in_place, WriteBack, FileMode
 
-from calm.dsl.builtins.models.metadata_payload import get_metadata_payload
+from calm.dsl.builtins.models.metadata_payload import (
+    get_metadata_payload,
+    get_metadata_payload_from_module,
+    get_metadata_obj,
+)
 from calm.dsl.runbooks import Endpoint, create_endpoint_payload
 from calm.dsl.config import get_context
 from calm.dsl.api import get_api_client
@@ -128,6 +132,9 @@ def compile_endpoint(endpoint_file):
     if UserEndpoint is None:
         return None
 
+    # Metadata is read from the loaded module instead of executing the file again
+    get_metadata_payload_from_module(user_endpoint_module)
+
     endpoint_payload = None
     UserEndpointPayload, _ = create_endpoint_payload(UserEndpoint)
     endpoint_payload = UserEndpointPayload.get_dict()
@@ -142,7 +149,7 @@ def compile_endpoint_command(endpoint_file, out):
         LOG.error("User endpoint not found in {}".format(endpoint_file))
         return
 
-    metadata_payload = get_metadata_payload(endpoint_file)
+    metadata_payload = get_metadata_obj()
     project_cache_data = {}
     project_name = ""
     if "project_reference" in metadata_payload:
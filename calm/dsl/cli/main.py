@@ -5,7 +5,6 @@ import copy
 
 import click_completion
 import click_completion.core
-from click_repl import repl
 from prettytable import PrettyTable
 
 # TODO - move providers to separate file
@@ -17,7 +16,7 @@ from calm.dsl.store import Cache
 
 from .version_validator import validate_version
 from .click_options import simple_verbosity_option, show_trace_option
-from .utils import FeatureFlagGroup, highlight_text
+from .utils import FeatureFlagGroup, LazyGroup, highlight_text
 
 CONTEXT_SETTINGS = dict(help_option_names=["-h", "--help"])
 
@@ -448,6 +447,10 @@ def calmrepl():
       :exit, :q, :quit  exits the repl
 
       :?, :h, :help     displays general help information"""
+
+    # Imported here as prompt_toolkit is slow to import and rarely needed
+    from click_repl import repl
+
     repl(click.get_current_context())
 
 
@@ -463,31 +466,31 @@ def calm_import():
     pass
 
 
-@get.group("library")
+@get.group("library", cls=LazyGroup)
 def library_get():
     """Get Library entities"""
     pass
 
 
-@create.group("library")
+@create.group("library", cls=LazyGroup)
 def library_create():
     """Create Library entities"""
     pass
 
 
-@calm_import.group("library")
+@calm_import.group("library", cls=LazyGroup)
 def library_import():
     """Import Library entities"""
     pass
 
 
-@describe.group("library")
+@describe.group("library", cls=LazyGroup)
 def library_describe():
     """Describe Library entities"""
     pass
 
 
-@delete.group("library")
+@delete.group("library", cls=LazyGroup)
 def library_delete():
     """Delete Library entities"""
     pass
@@ -572,7 +572,7 @@ def launch_marketplace_bp(
 
 
 def decompile_marketplace_bp(
-    name, version, app_source, bp_name, project, with_secrets, bp_dir
+    name, version, app_source, bp_name, project, with_secrets, bp_dir, format_code=True
 ):
     """decompiles marketplace blueprint"""
 
@@ -622,7 +622,12 @@ def decompile_marketplace_bp(
     bp_cls.__name__ = blueprint_name
     bp_cls.__doc__ = blueprint_description
 
-    create_bp_dir(bp_cls=bp_cls, bp_dir=bp_dir, with_secrets=with_secrets)
+    create_bp_dir(
+        bp_cls=bp_cls,
+        bp_dir=bp_dir,
+        with_secrets=with_secrets,
+        format_code=format_code,
+    )
     click.echo(
         "\nSuccessfully decompiled. Directory location: {}. Blueprint location: {}".format(
             get_bp_dir(), os.path.join(get_bp_dir(), "blueprint.py")
@@ -264,8 +264,15 @@ def _launch_marketplace_bp(
     default=None,
     help="Blueprint directory location used for placing decompiled entities",
 )
+@click.option(
+    "--no-format",
+    "no_format",
+    is_flag=True,
+    default=False,
+    help="Skip formatting decompiled blueprint file using black",
+)
 def _decompile_marketplace_bp(
-    mpi_name, version, project, name, source, with_secrets, bp_dir
+    mpi_name, version, project, name, source, with_secrets, bp_dir, no_format
 ):
     """Decompiles marketplace manager blueprint
 
@@ -284,6 +291,7 @@ def _decompile_marketplace_bp(
         app_source=None,
         with_secrets=with_secrets,
         bp_dir=bp_dir,
+        format_code=not no_format,
     )
 
 
@@ -21,6 +21,7 @@ from calm.dsl.config import get_context
 from calm.dsl.providers.base import get_provider
 
 from .utils import highlight_text
+from .poller import poll_until
 from calm.dsl.tools import get_module_from_file
 from calm.dsl.log import get_logging_handle
 from calm.dsl.builtins.models.helper.common import (
@@ -491,14 +492,16 @@ def compile_network_group_tunnel_vm_dsl_class(
 def watch_network_group_tunnel_launch_task(tunnel_setup_task, poll_interval):
 
     client = get_api_client()
-    cnt = 0
-    app_uuid = None
-    milestone_reached = NETWORK_GROUP_TUNNEL_TASK.STATUS.QUEUED
-    app_state = "provisioning"
-    while True:
+    result = {
+        "app_uuid": None,
+        "milestone": NETWORK_GROUP_TUNNEL_TASK.STATUS.QUEUED,
+        "app_state": "provisioning",
+    }
+
+    def poll_func():
         LOG.info(
             "Fetching status of network group tunnel creation task: {}, state: {}".format(
-                tunnel_setup_task, app_state
+                tunnel_setup_task, result["app_state"]
             )
         )
 
@@ -511,11 +514,12 @@ def watch_network_group_tunnel_launch_task(tunnel_setup_task, poll_interval):
 
         res_json = res.json()
         # LOG.info("Response is : {}".format(res_json))
-        app_uuid = res_json.get("status", {}).get("application_uuid", "")
-        app_state = res_json.get("status", {}).get("state", "provisioning")
+        result["app_uuid"] = res_json.get("status", {}).get("application_uuid", "")
+        result["app_state"] = res_json.get("status", {}).get("state", "provisioning")
         milestone_reached = res_json.get("status", {}).get(
             "milestone", NETWORK_GROUP_TUNNEL_TASK.STATUS.QUEUED
         )
+        result["milestone"] = milestone_reached
 
         if milestone_reached in NETWORK_GROUP_TUNNEL_TASK.TERMINAL_STATES:
             message_list = res_json.get("status", {}).get("message_list", [])
@@ -524,30 +528,29 @@ def watch_network_group_tunnel_launch_task(tunnel_setup_task, poll_interval):
                     LOG.error(message_list)
             LOG.info(
                 "Network Group tunnel creation task reached terminal status: {}".format(
-                    app_state
+                    result["app_state"]
                 )
             )
-            return (milestone_reached, app_uuid)
+            return (True, milestone_reached)
 
-        time.sleep(poll_interval)
-        cnt += 1
-        if cnt == 20:
-            break
+        return (False, (milestone_reached, result["app_state"]))
 
-    LOG.info(
-        "Task couldn't reached to terminal state in {} seconds. Exiting...".format(
-            poll_interval * 20
+    if not poll_until(
+        poll_func, max_interval=poll_interval, timeout=poll_interval * 20
+    ):
+        LOG.info(
+            "Task couldn't reached to terminal state in {} seconds. Exiting...".format(
+                poll_interval * 20
+            )
         )
-    )
-    return (milestone_reached, app_uuid)
+    return (result["milestone"], result["app_uuid"])
 
 
 def watch_network_group_tunnel_app(account_uuid, network_group_name, poll_interval):
 
-    cnt = 0
-    network_group_json = {}
-    app_state = "provisioning"
-    while True:
+    result = {"network_group_json": {}, "app_state": "provisioning"}
+
+    def poll_func():
         network_group_json = get_network_group_by_name(account_uuid, network_group_name)
         app_uuid = (
             network_group_json.get("status", {}).get("resources", {}).get("app_uuid")
@@ -555,24 +558,26 @@ def watch_network_group_tunnel_app(account_uuid, network_group_name, poll_interv
         app_state = (
             network_group_json.get("status", {}).get("resources", {}).get("app_status")
         )
+        result["network_group_json"] = network_group_json
+        result["app_state"] = app_state
         LOG.info("Application uuid: {}, status: {}".format(app_uuid, app_state))
         if app_state == "running":
             LOG.info(
                 "Network Group Tunnel Provisioned successfully, wait for 5 minutes for Tunnel Sync"
             )
-            return (network_group_json, app_state)
+            return (True, app_state)
 
-        time.sleep(poll_interval)
-        cnt += 1
-        if cnt == 20:
-            break
+        return (False, app_state)
 
-    LOG.info(
-        "Application did not reach Running status in {}. Exiting...".format(
-            20 * poll_interval
+    if not poll_until(
+        poll_func, max_interval=poll_interval, timeout=poll_interval * 20
+    ):
+        LOG.info(
+            "Application did not reach Running status in {}. Exiting...".format(
+                20 * poll_interval
+            )
         )
-    )
-    return (network_group_json, app_state)
+    return (result["network_group_json"], result["app_state"])
 
 
 def get_network_group_by_name(
@@ -0,0 +1,143 @@
+"""
+Adaptive polling of long running operations (launches, action runs, tasks).
+
+The first check is done right away. Later checks are spaced by an interval
+that starts at `min_interval` and grows by `backoff` (with random jitter) till
+`max_interval`. Whenever the polled state changes, the interval goes back to
+`min_interval`, as the operation is making progress and more changes are
+likely soon. Polling stops when the operation completes, the deadline is
+reached or the cancel event is set.
+"""
+
+import time
+import random
+import threading
+
+from calm.dsl.log import get_logging_handle
+
+LOG = get_logging_handle(__name__)
+
+
+class Poller:
+    """
+    Polls a function till it reports completion.
+
+    poll_func() returns a tuple (completed, state). state is any comparable
+    value, a change in it resets the poll interval.
+
+    on_poll(PollStats) is called after every check, use it to collect metrics.
+    """
+
+    def __init__(
+        self,
+        max_interval=10,
+        timeout=5 * 60,
+        min_interval=1,
+        backoff=1.5,
+        jitter=0.1,
+        cancel_event=None,
+        on_poll=None,
+    ):
+        self.max_interval = max_interval
+        self.min_interval = min(min_interval, max_interval)
+        self.timeout = timeout
+        self.backoff = backoff
+        self.jitter = jitter
+        self.cancel_event = cancel_event or threading.Event()
+        self.on_poll = on_poll
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def get_interval(self, interval, state_changed):
+        """returns interval till next check, interval is None before first check"""
+
+        if interval is None or state_changed:
+            return self.min_interval
+        return min(interval * self.backoff, self.max_interval)
+
+    def get_sleep_time(self, interval):
+        return interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def poll(self, poll_func):
+        """polls till completion, returns False on timeout or cancellation"""
+
+        stats = PollStats()
+        interval = None
+        deadline = None
+        if self.timeout is not None:
+            deadline = time.monotonic() + self.timeout
+
+        while not self.cancel_event.is_set():
+            completed, state = poll_func()
+
+            state_changed = stats.polls > 0 and state != stats.state
+            if state_changed:
+                stats.state_changes += 1
+            interval = self.get_interval(interval, state_changed)
+
+            stats.polls += 1
+            stats.state = state
+            stats.elapsed = time.monotonic() - stats.start_time
+            stats.completed = bool(completed)
+            stats.interval = 0 if completed else interval
+            if self.on_poll:
+                self.on_poll(stats)
+
+            if completed:
+                return True
+
+            sleep_time = self.get_sleep_time(interval)
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                sleep_time = min(sleep_time, remaining)
+
+            self.cancel_event.wait(sleep_time)
+
+        if self.cancel_event.is_set():
+            LOG.debug("Polling cancelled after {} checks".format(stats.polls))
+        else:
+            LOG.debug(
+                "Polling timed out after {} checks in {:.1f} seconds".format(
+                    stats.polls, stats.elapsed
+                )
+            )
+        return False
+
+
+class PollStats:
+    """Stats of a poll loop, passed to the on_poll hook"""
+
+    def __init__(self):
+        self.start_time = time.monotonic()
+        self.polls = 0
+        self.state_changes = 0
+        self.state = None
+        self.elapsed = 0
+        self.interval = 0
+        self.completed = False
+
+
+def poll_until(poll_func, max_interval=10, timeout=5 * 60, **kwargs):
+    """polls poll_func with a Poller, returns False on timeout or cancellation"""
+
+    return Poller(max_interval=max_interval, timeout=timeout, **kwargs).poll(poll_func)
+
+
+def get_response_state(response):
+    """returns state of a polled entity or states of entities in a list response"""
+
+    entities = response.get("entities", None)
+    if entities is None:
+        return response.get("status", {}).get("state", None)
+
+    return tuple(
+        (
+            entity.get("metadata", {}).get("uuid", None),
+            entity.get("status", {}).get("state", None),
+            entity.get("metadata", {}).get("last_update_time", None),
+        )
+        for entity in entities
+    )
@@ -14,6 +14,7 @@ from calm.dsl.config import get_context
 
 from .utils import get_name_query, highlight_text
 from .environments import create_environment_from_dsl_class
+from .poller import poll_until
 from calm.dsl.tools import get_module_from_file
 from calm.dsl.log import get_logging_handle
 from calm.dsl.providers import get_provider
@@ -116,8 +117,9 @@ def watch_project_task(project_uuid, task_uuid, poll_interval=4):
     """poll project tasks"""
 
     client = get_api_client()
-    cnt = 0
-    while True:
+    result = {}
+
+    def poll_func():
         LOG.info("Fetching status of project task (uuid={})".format(task_uuid))
         res, err = client.project.read_pending_task(project_uuid, task_uuid)
         if err:
@@ -131,12 +133,13 @@ def watch_project_task(project_uuid, task_uuid, poll_interval=4):
             message_list = res["status"].get("message_list")
             if status != PROJECT_TASK.STATUS.SUCCESS and message_list:
                 LOG.error(message_list)
-            return status
+            result["status"] = status
+            return (True, status)
+
+        return (False, status)
 
-        time.sleep(poll_interval)
-        cnt += 1
-        if cnt == 10:
-            break
+    if poll_until(poll_func, max_interval=poll_interval, timeout=poll_interval * 10):
+        return result["status"]
 
     LOG.info(
         "Task couldn't reached to terminal state in {} seconds. Exiting...".format(
@@ -27,6 +27,7 @@ from .utils import (
 )
 from .constants import RUNBOOK, RUNLOG
 from .runlog import get_completion_func, get_runlog_status
+from .poller import poll_until, get_response_state
 from .endpoints import get_endpoint
 
 from anytree import NodeMixin, RenderTree
@@ -920,10 +921,10 @@ def abort_runbook_execution(runlog_uuid):
 
 
 def poll_action(poll_func, completion_func, poll_interval=10, **kwargs):
-    # Poll every 10 seconds on the runlog status, for 10 mins
-    maxWait = 10 * 60
-    count = 0
-    while count < maxWait:
+    # Poll on the runlog status (atmost every poll_interval seconds), for 10 mins
+    result = {"msg": ""}
+
+    def poll():
         # call status api
         res, err = poll_func()
         if err:
@@ -931,12 +932,11 @@ def poll_action(poll_func, completion_func, poll_interval=10, **kwargs):
         response = res.json()
         (completed, msg) = completion_func(response, **kwargs)
         if completed:
-            # click.echo(msg)
-            if msg:
-                return False
-            break
-        count += poll_interval
-        time.sleep(poll_interval)
+            result["msg"] = msg
+        return (completed, get_response_state(response))
+
+    if poll_until(poll, max_interval=poll_interval, timeout=10 * 60) and result["msg"]:
+        return False
     return True
 
 
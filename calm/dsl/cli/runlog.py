@@ -19,6 +19,8 @@ import time
 from time import sleep
 from datetime import timedelta
 import itertools
+import bisect
+from concurrent.futures import ThreadPoolExecutor
 
 from anytree import NodeMixin, RenderTree
 import datetime
@@ -210,7 +212,7 @@ def displayRunLogTree(screen, root, completed_tasks, total_tasks, msg=None):
     )
     line = 1
     for pre, fill, node in RenderTree(root):
-        line = displayRunLog(screen, node, pre, fill, line)
+        line = displayCachedRunLog(screen, node, pre, fill, line)
     if msg:
         screen.print_at(msg, 0, line, colour=6)
     line = line + 1
@@ -237,6 +239,180 @@ class RunlogNode(NodeMixin):
             self.children = children
 
 
+class RunlogTree:
+    """
+    Tree of runlog nodes maintained across polls of a runlog list.
+
+    Runlogs are keyed on uuid. On every poll only the runlogs that are new or
+    whose state/last update time changed are applied to the tree, and only
+    their nodes are marked dirty (version is bumped) for rendering.
+    """
+
+    def __init__(self, node_class=RunlogNode):
+        self.node_class = node_class
+        self.root = None
+        self.nodes = {}
+        self.runlog_map = {}
+        self.hidden = set()
+        self._versions = {}
+        self._order = []
+        self._creation_times = []
+        self._orphans = set()
+
+    @property
+    def runlogs(self):
+        """returns runlogs sorted based on creation time"""
+        return [self.runlog_map[uuid] for uuid in self._order]
+
+    def create_root(self, runlog):
+        root_uuid = runlog["status"]["root_reference"]["uuid"]
+        root_runlog = {
+            "metadata": {"uuid": root_uuid},
+            "status": {"type": "action_runlog", "state": ""},
+        }
+        return root_uuid, self.node_class(root_runlog)
+
+    def is_hidden(self, runlog):
+        return False
+
+    def create_node(self, runlog):
+        return self.node_class(runlog)
+
+    def update_node(self, node, runlog):
+        node.runlog = runlog
+
+    def get_parent_uuid(self, runlog):
+        return runlog["status"]["parent_reference"]["uuid"]
+
+    def get_changed(self, entities):
+        """returns runlogs of poll response that are new or changed"""
+
+        changed = []
+        for runlog in entities:
+            uuid = str(runlog["metadata"]["uuid"])
+            version = (
+                runlog["status"].get("state"),
+                runlog["metadata"].get("last_update_time"),
+            )
+            if self._versions.get(uuid) != version:
+                changed.append(runlog)
+
+        return sorted(changed, key=lambda x: int(x["metadata"]["creation_time"]))
+
+    def apply(self, changed):
+        """applies new/changed runlogs (sorted on creation time) to the tree"""
+
+        for runlog in changed:
+            uuid = str(runlog["metadata"]["uuid"])
+            self._versions[uuid] = (
+                runlog["status"].get("state"),
+                runlog["metadata"].get("last_update_time"),
+            )
+            if self.root is None:
+                root_uuid, self.root = self.create_root(runlog)
+                self.root.version = 0
+                self.nodes[str(root_uuid)] = self.root
+
+            if uuid not in self.runlog_map:
+                creation_time = int(runlog["metadata"]["creation_time"])
+                index = bisect.bisect_right(self._creation_times, creation_time)
+                self._creation_times.insert(index, creation_time)
+                self._order.insert(index, uuid)
+            self.runlog_map[uuid] = runlog
+
+            node = self.nodes.get(uuid, None)
+            if node is not None:
+                self.update_node(node, runlog)
+                node.version += 1
+            elif uuid not in self.hidden:
+                if self.is_hidden(runlog):
+                    self.hidden.add(uuid)
+                    continue
+
+                node = self.create_node(runlog)
+                node.version = 0
+                self.nodes[uuid] = node
+                self._attach(uuid)
+
+        # Parents missing in earlier polls may have arrived now
+        for uuid in list(self._orphans):
+            self._attach(uuid)
+
+    def update(self, entities):
+        changed = self.get_changed(entities)
+        self.apply(changed)
+        return changed
+
+    def _attach(self, uuid):
+        parent_uuid = str(self.get_parent_uuid(self.runlog_map[uuid]))
+        while parent_uuid in self.hidden:
+            parent_uuid = str(self.get_parent_uuid(self.runlog_map[parent_uuid]))
+
+        node = self.nodes[uuid]
+        parent = self.nodes.get(parent_uuid, None)
+        if parent is None:
+            # Show it under root till the parent runlog is received
+            self._orphans.add(uuid)
+            parent = self.root
+        else:
+            self._orphans.discard(uuid)
+
+        if node.parent is parent:
+            return
+
+        node.parent = parent
+        children = parent.children
+        if len(children) > 1 and self._creation_time(
+            children[-2]
+        ) > self._creation_time(node):
+            parent.children = sorted(children, key=self._creation_time)
+
+    def _creation_time(self, node):
+        return int(node.runlog["metadata"].get("creation_time", 0))
+
+
+class RunbookRunlogTree(RunlogTree):
+    """Runlog tree of a runbook/action run, skipping meta and endpoint loop runlogs"""
+
+    def __init__(self, runlog_uuid, task_type_map, runlog_outputs):
+        super().__init__()
+        self.runlog_uuid = runlog_uuid
+        self.task_type_map = task_type_map
+        self.runlog_outputs = runlog_outputs
+
+    def is_hidden(self, runlog):
+        machine = self.get_machine(runlog)
+        if machine and len(machine) == 1:
+            return True  # this runlog corresponds to endpoint loop
+
+        if runlog["status"]["type"] == "task_runlog":
+            task_id = runlog["status"]["task_reference"]["uuid"]
+            if self.task_type_map[task_id] == "META":
+                return True  # don't add metatask's trl in runlogTree
+
+        return False
+
+    def get_machine(self, runlog):
+        machine_name = runlog["status"].get("machine_name", None)
+        return parse_machine_name(self.runlog_uuid, machine_name)
+
+    def create_node(self, runlog):
+        node = RunlogNode(runlog)
+        self.update_node(node, runlog)
+        return node
+
+    def update_node(self, node, runlog):
+        uuid = runlog["metadata"]["uuid"]
+        machine = self.get_machine(runlog)
+        if machine:
+            machine = "{} ({})".format(machine[1], machine[0])
+
+        node.runlog = runlog
+        node.machine = machine
+        node.reasons = runlog["status"].get("reason_list", [])
+        node.outputs = list(self.runlog_outputs.get(uuid, []))
+
+
 def displayRunLog(screen, obj, pre, fill, line):
 
     if not isinstance(obj, RunlogNode):
@@ -341,7 +517,70 @@ def displayRunLog(screen, obj, pre, fill, line):
     return idx()
 
 
-def get_completion_func(screen):
+class _ScreenRecorder:
+    """Records print_at calls so that they can be replayed at another line"""
+
+    def __init__(self):
+        self.calls = []
+
+    def print_at(self, text, x, y, **kwargs):
+        self.calls.append((text, x, y, kwargs))
+
+
+def displayCachedRunLog(screen, obj, pre, fill, line):
+    """displays runlog node, re-rendering it only if it changed since last display"""
+
+    key = (pre, fill, bool(obj.children), getattr(obj, "version", None))
+    cache = getattr(obj, "render_cache", None)
+    if cache is None or cache[0] != key:
+        input_count = len(input_tasks)
+        confirm_count = len(confirm_tasks)
+        recorder = _ScreenRecorder()
+        height = displayRunLog(recorder, obj, pre, fill, 0)
+        cache = (
+            key,
+            recorder.calls,
+            height,
+            input_tasks[input_count:],
+            confirm_tasks[confirm_count:],
+        )
+        obj.render_cache = cache
+    else:
+        input_tasks.extend(cache[3])
+        confirm_tasks.extend(cache[4])
+
+    for text, x, y, kwargs in cache[1]:
+        screen.print_at(text, x, line + y, **kwargs)
+    return line + cache[2]
+
+
+def get_completion_func(screen, max_workers=8):
+
+    # Outputs of task runlogs, fetched once the runlog is in terminal state
+    runlog_outputs = {}
+
+    # Runlog tree maintained across polls, created on first poll
+    tree = None
+
+    def fetch_runlog_outputs(client, runlog_uuid, task_runlog_uuids):
+        """fetches outputs of task runlogs on a pool of max_workers threads"""
+
+        def fetch_output(uuid):
+            res, err = client.runbook.runlog_output(runlog_uuid, uuid)
+            if err:
+                raise Exception("\n[{}] - {}".format(err["code"], err["error"]))
+            runlog_output = res.json()
+            output_list = runlog_output["status"]["output_list"]
+            if len(output_list) > 0:
+                return [output_list[0]["output"]]
+            return []
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for uuid, outputs in zip(
+                task_runlog_uuids, executor.map(fetch_output, task_runlog_uuids)
+            ):
+                runlog_outputs[uuid] = outputs
+
     def is_action_complete(
         response,
         task_type_map=[],
@@ -351,6 +590,7 @@ def get_completion_func(screen):
         **kwargs,
     ):
 
+        nonlocal tree
         client = get_api_client()
         global input_tasks
         global input_payload
@@ -367,85 +607,38 @@ def get_completion_func(screen):
             if hasattr(screen, "get_event"):
                 interrupt = screen.get_event()
 
-            # Sort entities based on creation time
-            sorted_entities = sorted(
-                entities, key=lambda x: int(x["metadata"]["creation_time"])
-            )
+            if tree is None:
+                tree = RunbookRunlogTree(runlog_uuid, task_type_map, runlog_outputs)
 
-            # Create nodes of runlog tree and a map based on uuid
-            root = None
-            nodes = {}
-            runlog_map = {}
-            for runlog in sorted_entities:
-                # Create root node
-                # TODO - Get details of root node
-                if not root:
-                    root_uuid = runlog["status"]["root_reference"]["uuid"]
-                    root_runlog = {
-                        "metadata": {"uuid": root_uuid},
-                        "status": {"type": "action_runlog", "state": ""},
-                    }
-                    runlog_map[str(root_uuid)] = root_runlog
-                    root = RunlogNode(root_runlog)
-                    nodes[str(root_uuid)] = root
+            # Apply only the runlogs that are new or changed since last poll
+            changed_runlogs = tree.get_changed(entities)
 
+            # Output is not valid for meta, input, confirm and while_loop tasks
+            # and endpoint loop runlogs. Fetch it for runlogs completed since
+            # last poll.
+            pending_output_uuids = []
+            for runlog in changed_runlogs:
                 uuid = runlog["metadata"]["uuid"]
-                runlog_map[str(uuid)] = runlog
-                reasons = runlog["status"].get("reason_list", [])
-                outputs = []
-                machine_name = runlog["status"].get("machine_name", None)
-                machine = parse_machine_name(runlog_uuid, machine_name)
-                if machine and len(machine) == 1:
-                    runlog["status"]["machine_name"] = "-"
-                    continue  # this runlog corresponds to endpoint loop
-                elif machine:
-                    machine = "{} ({})".format(machine[1], machine[0])
-
-                if runlog["status"]["type"] == "task_runlog":
-
-                    task_id = runlog["status"]["task_reference"]["uuid"]
-                    if task_type_map[task_id] == "META":
-                        continue  # don't add metatask's trl in runlogTree
-
-                    # Output is not valid for input, confirm and while_loop tasks
-                    if task_type_map[task_id] not in ["INPUT", "CONFIRM", "WHILE_LOOP"]:
-                        res, err = client.runbook.runlog_output(runlog_uuid, uuid)
-                        if err:
-                            raise Exception(
-                                "\n[{}] - {}".format(err["code"], err["error"])
-                            )
-                        runlog_output = res.json()
-                        output_list = runlog_output["status"]["output_list"]
-                        if len(output_list) > 0:
-                            outputs.append(output_list[0]["output"])
-
-                nodes[str(uuid)] = RunlogNode(
-                    runlog,
-                    parent=root,
-                    outputs=outputs,
-                    machine=machine,
-                    reasons=reasons,
-                )
+                if (
+                    runlog["status"]["type"] != "task_runlog"
+                    or runlog["status"]["state"] not in RUNLOG.TERMINAL_STATES
+                    or uuid in runlog_outputs
+                    or tree.is_hidden(runlog)
+                ):
+                    continue
 
-            # Attach parent to nodes
-            for runlog in sorted_entities:
-                uuid = runlog["metadata"]["uuid"]
-                if nodes.get(str(uuid), None) is None:
+                task_id = runlog["status"]["task_reference"]["uuid"]
+                if task_type_map[task_id] in ["INPUT", "CONFIRM", "WHILE_LOOP"]:
                     continue
-                parent_uuid = runlog["status"]["parent_reference"]["uuid"]
-                parent_runlog = runlog_map[str(parent_uuid)]
-                parent_type = parent_runlog["status"]["type"]
-                while (
-                    parent_type == "task_runlog"
-                    and task_type_map[parent_runlog["status"]["task_reference"]["uuid"]]
-                    == "META"
-                ) or parent_runlog["status"].get("machine_name", None) == "-":
-                    parent_uuid = parent_runlog["status"]["parent_reference"]["uuid"]
-                    parent_runlog = runlog_map[str(parent_uuid)]
-                    parent_type = parent_runlog["status"]["type"]
-
-                node = nodes[str(uuid)]
-                node.parent = nodes[str(parent_uuid)]
+
+                pending_output_uuids.append(uuid)
+
+            if pending_output_uuids:
+                fetch_runlog_outputs(client, runlog_uuid, pending_output_uuids)
+
+            tree.apply(changed_runlogs)
+            root = tree.root
+            sorted_entities = tree.runlogs
 
             # Show Progress
             # TODO - Draw progress bar
@@ -1,8 +1,8 @@
 import click
-import time
 
 from .main import watch
 from .constants import ERGON_TASK
+from .poller import poll_until
 from calm.dsl.api import get_api_client, get_resource_api
 from calm.dsl.log import get_logging_handle
 
@@ -13,9 +13,9 @@ def watch_task(task_uuid, poll_interval=2):
 
     client = get_api_client()
     Obj = get_resource_api("tasks", client.connection)
+    result = {}
 
-    cnt = 0
-    while True:
+    def poll_func():
         LOG.info("Fetching status of task")
         res, err = Obj.read(task_uuid)
         if err:
@@ -28,12 +28,13 @@ def watch_task(task_uuid, poll_interval=2):
             error_detail = res.get("error_detail", "")
             if error_detail:
                 LOG.error(error_detail)
-            return status
+            result["status"] = status
+            return (True, status)
 
-        time.sleep(poll_interval)
-        cnt += 1
-        if cnt == 10:
-            break
+        return (False, status)
+
+    if poll_until(poll_func, max_interval=poll_interval, timeout=poll_interval * 10):
+        return result["status"]
 
     LOG.info(
         "Task couldn't reached to terminal state in {} seconds. Exiting...".format(
@@ -12,6 +12,8 @@ from calm.dsl.constants import PROVIDER_ACCOUNT_TYPE_MAP
 from calm.dsl.store import Version
 from calm.dsl.log import get_logging_handle
 
+from .command_registry import load_command_modules
+
 LOG = get_logging_handle(__name__)
 
 
@@ -127,7 +129,36 @@ class FeatureFlagMixin:
             return super().invoke(ctx)
 
 
-class FeatureFlagGroup(FeatureFlagMixin, DYMMixin, click.Group):
+class LazyCommandMixin:
+    """Imports the command modules adding commands to the group on lookup"""
+
+    def _load_commands(self, cmd_name=None):
+        if self.callback and (cmd_name is None or cmd_name not in self.commands):
+            load_command_modules(self.callback.__name__, cmd_name)
+
+    def list_commands(self, ctx):
+        self._load_commands()
+        return super().list_commands(ctx)
+
+    def get_command(self, ctx, cmd_name):
+        self._load_commands(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def invoke(self, ctx):
+
+        # Feature flags of command are needed before it is resolved
+        if ctx.protected_args:
+            self._load_commands(ctx.protected_args[0])
+        return super().invoke(ctx)
+
+
+class LazyGroup(LazyCommandMixin, click.Group):
+    """click Group whose commands are imported when looked up"""
+
+    pass
+
+
+class FeatureFlagGroup(LazyCommandMixin, FeatureFlagMixin, DYMMixin, click.Group):
     """click Group that have *did-you-mean* functionality and adds *feature_min_version* paramter to each subcommand
     which can be used to set minimum calm version for command"""
 
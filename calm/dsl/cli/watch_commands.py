@@ -0,0 +1,75 @@
+import sys
+import click
+
+from calm.dsl.log import get_logging_handle
+
+from .main import watch
+from .watcher import watch_multiple
+
+LOG = get_logging_handle(__name__)
+
+
+@watch.command("multiple")
+@click.option(
+    "--app", "-a", "app_names", multiple=True, help="Name of app to watch (Multiple)"
+)
+@click.option(
+    "--runlog",
+    "-r",
+    "runlog_uuids",
+    multiple=True,
+    help="Uuid of runbook execution to watch (Multiple)",
+)
+@click.option(
+    "--out",
+    "-o",
+    "out",
+    type=click.Choice(["text", "json"]),
+    default="text",
+    help="Output format. Text shows a status table on terminals, json emits a line per state change",
+)
+@click.option(
+    "--poll-interval",
+    "poll_interval",
+    "-p",
+    type=int,
+    default=10,
+    show_default=True,
+    help="Maximum interval between status checks of an app or runbook execution",
+)
+@click.option(
+    "--max-requests",
+    "max_requests",
+    type=click.IntRange(min=1),
+    default=5,
+    show_default=True,
+    help="Maximum status requests sent to server per second",
+)
+@click.option(
+    "--timeout",
+    "-t",
+    "timeout",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Maximum time (in seconds) to watch for, no limit if not given",
+)
+def _watch_multiple(app_names, runlog_uuids, out, poll_interval, max_requests, timeout):
+    """Watch many apps and runbook executions together, till all of them complete
+
+    \b
+    Example:
+        calm watch multiple -a app1 -a app2 -r <runbook_execution_uuid> -o json
+    """
+
+    if not (app_names or runlog_uuids):
+        LOG.error("Give atleast one app (--app) or runbook execution (--runlog)")
+        sys.exit(-1)
+
+    watch_multiple(
+        app_names=app_names,
+        runlog_uuids=runlog_uuids,
+        out=out,
+        poll_interval=poll_interval,
+        max_requests=max_requests,
+        timeout=timeout,
+    )
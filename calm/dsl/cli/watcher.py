@@ -0,0 +1,413 @@
+"""
+Watching many apps and runbook executions together.
+
+All targets are checked by one scheduler: every target has its own adaptive
+interval (see poller.Poller), the checks that are due are run on a shared
+thread pool and every API request goes through a shared rate limiter, so the
+load on the server stays bounded however many targets are watched.
+"""
+
+import sys
+import json
+import time
+import datetime
+import threading
+from uuid import UUID
+from concurrent.futures import ThreadPoolExecutor
+
+import click
+from prettytable import PrettyTable
+
+from calm.dsl.api import get_api_client
+from calm.dsl.log import get_logging_handle
+
+from .constants import APPLICATION, RUNLOG
+from .poller import Poller
+from .utils import highlight_text
+
+LOG = get_logging_handle(__name__)
+
+
+class RateLimiter:
+    """Allows atmost `rate` calls of acquire per second across threads"""
+
+    def __init__(self, rate):
+        if rate <= 0:
+            raise ValueError("Rate must be a positive number, got {}".format(rate))
+
+        self.interval = 1.0 / rate
+        self.next_time = 0
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        with self.lock:
+            now = time.monotonic()
+            wait_time = self.next_time - now
+            self.next_time = max(now, self.next_time) + self.interval
+
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+
+class WatchError(Exception):
+    """Error response of server while watching a target"""
+
+    def __init__(self, err):
+        self.code = err.get("code")
+        super().__init__("[{}] - {}".format(err["code"], err["error"]))
+
+    @property
+    def is_client_error(self):
+        """4xx errors (except too many requests) will not go away on retry"""
+
+        return (
+            isinstance(self.code, int) and 400 <= self.code < 500 and self.code != 429
+        )
+
+
+class WatchTarget:
+    """Base class of entities watched by MultiWatcher"""
+
+    kind = None
+    terminal_states = []
+    failure_states = []
+
+    def __init__(self, name, uuid=None):
+        self.name = name
+        self.uuid = uuid
+        self.state = None
+        self.error = None
+        self.errors = 0
+        self.dropped = False
+        self.polls = 0
+        self.interval = None
+        self.next_poll_time = 0
+        self.start_time = time.monotonic()
+        self.end_time = None
+
+    @property
+    def completed(self):
+        return self.state in self.terminal_states
+
+    @property
+    def failed(self):
+        return self.dropped or self.state in self.failure_states
+
+    def resolve(self, client):
+        """fetches uuid of the target, if not given"""
+        pass
+
+    def read_state(self, client):
+        raise NotImplementedError
+
+    def to_dict(self):
+        end_time = self.end_time or time.monotonic()
+        return {
+            "type": self.kind,
+            "name": self.name,
+            "uuid": self.uuid,
+            "state": self.state,
+            "completed": self.completed,
+            "elapsed": round(end_time - self.start_time, 2),
+            "error": self.error,
+        }
+
+
+class AppTarget(WatchTarget):
+
+    kind = "app"
+    terminal_states = APPLICATION.TERMINAL_STATES
+    failure_states = APPLICATION.FAILURE_STATES
+
+    def resolve(self, client):
+        if self.uuid:
+            return
+
+        res, err = client.application.list(
+            params={"filter": "name=={}".format(self.name)}
+        )
+        if err:
+            raise WatchError(err)
+
+        entities = res.json().get("entities", [])
+        for entity in entities:
+            if entity["metadata"]["name"] == self.name:
+                self.uuid = entity["metadata"]["uuid"]
+                return
+
+        raise Exception("Application {} not found".format(self.name))
+
+    def read_state(self, client):
+        res, err = client.application.read(self.uuid)
+        if err:
+            raise WatchError(err)
+        return res.json()["status"]["state"]
+
+
+class RunlogTarget(WatchTarget):
+
+    kind = "runbook_execution"
+    terminal_states = RUNLOG.TERMINAL_STATES
+    failure_states = RUNLOG.FAILURE_STATES
+
+    def __init__(self, uuid):
+        super().__init__(uuid, uuid=uuid)
+
+    def resolve(self, client):
+        try:
+            UUID(self.uuid)
+        except ValueError:
+            raise Exception("Invalid runbook execution uuid '{}'".format(self.uuid))
+
+        # Fails for unknown runbook executions
+        self.read_state(client)
+
+    def read_state(self, client):
+        res, err = client.runbook.poll_action_run(self.uuid)
+        if err:
+            raise WatchError(err)
+
+        status = res.json()["status"]
+        self.name = status.get("runbook_reference", {}).get("name", self.name)
+        return status["state"]
+
+
+class MultiWatcher:
+    """
+    Watches targets till all of them reach terminal state.
+
+    Targets are started (WatchTarget.resolve) in order, keeping atmost
+    max_active of them pending at a time, if given.
+
+    on_change(watcher, changed_targets) is called after every round of checks
+    in which the state of some target changed, a target failed to start or
+    its check failed. A target is dropped after max_errors consecutive failed
+    checks, or on the first 4xx error.
+    """
+
+    def __init__(
+        self,
+        targets,
+        poll_interval=10,
+        timeout=None,
+        max_workers=8,
+        max_requests=5,
+        max_active=None,
+        max_errors=3,
+        on_change=None,
+        cancel_event=None,
+        client=None,
+    ):
+        self.targets = targets
+        self.poller = Poller(max_interval=poll_interval)
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.rate_limiter = RateLimiter(max_requests)
+        self.max_active = max_active
+        self.max_errors = max_errors
+        self.on_change = on_change
+        self.cancel_event = cancel_event or threading.Event()
+        self.client = client or get_api_client()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def _call(self, func):
+        self.rate_limiter.acquire()
+        try:
+            return func(self.client), None
+        except Exception as exp:
+            return None, exp
+
+    def _start(self, target):
+        target.start_time = time.monotonic()
+        return self._call(target.resolve)
+
+    def _check(self, target):
+        return self._call(target.read_state)
+
+    def run(self):
+        """watches the targets, returns False on timeout or cancellation"""
+
+        deadline = None
+        if self.timeout is not None:
+            deadline = time.monotonic() + self.timeout
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+
+            queued = list(self.targets)
+            pending = []
+            while (queued or pending) and not self.cancel_event.is_set():
+
+                # Start queued targets, keeping atmost max_active of them pending
+                started_targets = []
+                while queued and (
+                    self.max_active is None
+                    or len(pending) + len(started_targets) < self.max_active
+                ):
+                    started_targets.append(queued.pop(0))
+
+                changed_targets = []
+                for target, (_, error) in zip(
+                    started_targets, executor.map(self._start, started_targets)
+                ):
+                    if error:
+                        target.error = str(error)
+                        target.dropped = True
+                        target.end_time = time.monotonic()
+                        changed_targets.append(target)
+                        LOG.error("Failed to start {}: {}".format(target.name, error))
+                    else:
+                        pending.append(target)
+
+                now = time.monotonic()
+                due_targets = [x for x in pending if x.next_poll_time <= now]
+
+                for target, (state, error) in zip(
+                    due_targets, executor.map(self._check, due_targets)
+                ):
+                    target.polls += 1
+                    state_changed = False
+                    if error:
+                        target.error = str(error)
+                        target.errors += 1
+                        changed_targets.append(target)
+                        if target.errors >= self.max_errors or getattr(
+                            error, "is_client_error", False
+                        ):
+                            LOG.error(
+                                "Stopped watching {}: {}".format(
+                                    target.name, target.error
+                                )
+                            )
+                            target.dropped = True
+                            target.end_time = time.monotonic()
+                            pending.remove(target)
+                            continue
+
+                    else:
+                        target.error = None
+                        target.errors = 0
+                        state_changed = state != target.state
+                        if state_changed:
+                            target.state = state
+                            changed_targets.append(target)
+
+                    target.interval = self.poller.get_interval(
+                        target.interval, state_changed
+                    )
+                    target.next_poll_time = time.monotonic() + (
+                        self.poller.get_sleep_time(target.interval)
+                    )
+                    if target.completed:
+                        target.end_time = time.monotonic()
+                        pending.remove(target)
+
+                if changed_targets and self.on_change:
+                    self.on_change(self, changed_targets)
+
+                # Start queued targets right away, if any pending one completed
+                if not pending or (
+                    queued
+                    and (self.max_active is None or len(pending) < self.max_active)
+                ):
+                    continue
+
+                wait_time = min(x.next_poll_time for x in pending) - time.monotonic()
+                if deadline is not None:
+                    if time.monotonic() >= deadline:
+                        break
+                    wait_time = min(wait_time, deadline - time.monotonic())
+
+                if wait_time > 0:
+                    self.cancel_event.wait(wait_time)
+
+        return all(x.completed for x in self.targets)
+
+
+def print_json_lines(watcher, changed_targets):
+    for target in changed_targets:
+        data = target.to_dict()
+        data["time"] = datetime.datetime.now().isoformat()
+        click.echo(json.dumps(data))
+
+
+def print_status_lines(watcher, changed_targets):
+    for target in changed_targets:
+        status = target.state
+        if target.error:
+            status = "error: {}".format(target.error)
+
+        click.echo(
+            "[{}] {} {}: {}".format(
+                datetime.datetime.now().strftime("%H:%M:%S"),
+                target.kind,
+                highlight_text(target.name),
+                highlight_text(status),
+            )
+        )
+
+
+def print_status_table(watcher, changed_targets):
+    table = PrettyTable()
+    table.field_names = ["TYPE", "NAME", "STATE", "ELAPSED (s)", "UUID"]
+    for target in watcher.targets:
+        data = target.to_dict()
+        table.add_row(
+            [
+                data["type"],
+                highlight_text(data["name"]),
+                highlight_text(data["error"] or data["state"] or "-"),
+                highlight_text(int(data["elapsed"])),
+                highlight_text(data["uuid"]),
+            ]
+        )
+
+    click.clear()
+    click.echo(table)
+
+
+def watch_multiple(
+    app_names=(),
+    runlog_uuids=(),
+    out="text",
+    poll_interval=10,
+    max_requests=5,
+    timeout=None,
+):
+    """Watch apps and runbook executions till all of them reach terminal state
+    or timeout (in seconds) is reached"""
+
+    targets = [AppTarget(name) for name in app_names]
+    targets.extend(RunlogTarget(uuid) for uuid in runlog_uuids)
+
+    if out == "json":
+        on_change = print_json_lines
+    elif sys.stdout.isatty():
+        on_change = print_status_table
+    else:
+        on_change = print_status_lines
+
+    watcher = MultiWatcher(
+        targets,
+        poll_interval=poll_interval,
+        timeout=timeout,
+        max_requests=max_requests,
+        on_change=on_change,
+    )
+    if not watcher.run() and not all(x.completed or x.dropped for x in targets):
+        LOG.error("Timed out after {} seconds".format(timeout))
+
+    failed_targets = [x for x in targets if x.failed or not x.completed]
+    if failed_targets:
+        LOG.error(
+            "{} of {} watched entities did not complete successfully: {}".format(
+                len(failed_targets),
+                len(targets),
+                ", ".join(x.name for x in failed_targets),
+            )
+        )
+        sys.exit(-1)
+
+    if out != "json":
+        LOG.info("All {} watched entities completed".format(len(targets)))
@@ -13,6 +13,21 @@ class EnvConfig:
     local_dir_location = os.environ.get("CALM_DSL_LOCAL_DIR_LOCATION") or ""
     db_location = os.environ.get("CALM_DSL_DB_LOCATION")
 
+    @classmethod
+    def reload(cls):
+        """reads the environment variables again, ex: for each command run by calm daemon"""
+
+        cls.pc_ip = os.environ.get("CALM_DSL_PC_IP") or ""
+        cls.pc_port = os.environ.get("CALM_DSL_PC_PORT") or ""
+        cls.pc_username = os.environ.get("CALM_DSL_PC_USERNAME") or ""
+        cls.pc_password = os.environ.get("CALM_DSL_PC_PASSWORD") or ""
+        cls.default_project = os.environ.get("CALM_DSL_DEFAULT_PROJECT") or ""
+        cls.log_level = os.environ.get("CALM_DSL_LOG_LEVEL") or ""
+
+        cls.config_file_location = os.environ.get("CALM_DSL_CONFIG_FILE_LOCATION") or ""
+        cls.local_dir_location = os.environ.get("CALM_DSL_LOCAL_DIR_LOCATION") or ""
+        cls.db_location = os.environ.get("CALM_DSL_DB_LOCATION")
+
     @classmethod
     def get_server_config(cls):
 
@@ -0,0 +1,7 @@
+# NOTE Only lightweight modules are imported here, so that the client does not
+#      load the dsl. Server is at `calm.dsl.daemon.server`
+
+from .client import run_command, send_request
+from .protocol import get_socket_path
+
+__all__ = ["run_command", "send_request", "get_socket_path"]
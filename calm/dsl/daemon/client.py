@@ -0,0 +1,85 @@
+"""
+Thin client forwarding calm commands to the daemon (`calm daemon start`).
+
+It only imports modules from the standard library, so that a command costs a
+socket round trip instead of loading the dsl. If no daemon is listening, the
+command is run in-process like `calm`.
+"""
+
+import os
+import sys
+import socket
+
+from .protocol import get_socket_path, get_dsl_environ, send_message, read_message
+
+
+def connect(socket_path=None):
+    """returns socket connected to the daemon, None if it is not running"""
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(get_socket_path(socket_path))
+    except (FileNotFoundError, ConnectionRefusedError):
+        sock.close()
+        return None
+
+    return sock
+
+
+def send_request(request, socket_path=None, stdout=None, stderr=None):
+    """
+    sends request to the daemon and writes the streamed output. Returns exit
+    code of the command, None if daemon is not running or is restarting.
+    """
+
+    sock = connect(socket_path)
+    if sock is None:
+        return None
+
+    streams = {"stdout": stdout or sys.stdout, "stderr": stderr or sys.stderr}
+    with sock, sock.makefile("rwb") as fd:
+        send_message(fd, request)
+        while True:
+            message = read_message(fd)
+            if message is None:
+                streams["stderr"].write("Connection to calm daemon closed\n")
+                return 1
+
+            if "exit_code" in message:
+                return message["exit_code"]
+
+            stream = streams[message["stream"]]
+            stream.write(message["data"])
+            stream.flush()
+
+
+def run_command(argv, socket_path=None):
+    """runs the calm command (argv excludes program name) on the daemon"""
+
+    request = {
+        "argv": argv,
+        "cwd": os.getcwd(),
+        "isatty": sys.stdout.isatty(),
+        "environ": get_dsl_environ(),
+    }
+    return send_request(request, socket_path)
+
+
+def main():
+    argv = sys.argv[1:]
+
+    # Daemon commands talk to the daemon themselves
+    exit_code = None
+    if argv[:1] != ["daemon"]:
+        exit_code = run_command(argv)
+
+    if exit_code is None:
+        from calm.dsl.cli import main as cli
+
+        cli(prog_name="calm")
+
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
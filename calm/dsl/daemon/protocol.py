@@ -0,0 +1,47 @@
+"""
+Messages exchanged between daemon and client over the unix socket. Each message
+is a json object on a single line.
+
+    client -> daemon: {"argv": [...], "cwd": "...", "isatty": bool, "environ": {...}}
+                      {"action": "stop"} / {"action": "status"}
+    daemon -> client: {"stream": "stdout"|"stderr", "data": "..."} (any number)
+                      {"exit_code": int} (last message, null if command
+                      was not run as daemon is restarting)
+"""
+
+import os
+import json
+
+
+DEFAULT_SOCKET_PATH = os.path.join(os.path.expanduser("~"), ".calm", "daemon.sock")
+
+# Environment variables of the client forwarded with each command
+DSL_ENV_PREFIX = "CALM_DSL_"
+
+
+def get_socket_path(socket_path=None):
+    """returns socket path. Can be overridden using CALM_DSL_DAEMON_SOCKET env"""
+
+    return (
+        socket_path or os.environ.get("CALM_DSL_DAEMON_SOCKET") or DEFAULT_SOCKET_PATH
+    )
+
+
+def get_dsl_environ():
+    """returns CALM_DSL_* environment variables"""
+
+    return {k: v for k, v in os.environ.items() if k.startswith(DSL_ENV_PREFIX)}
+
+
+def send_message(fd, message):
+    fd.write(json.dumps(message).encode("utf-8") + b"\n")
+    fd.flush()
+
+
+def read_message(fd):
+    """returns next message, None if other end closed the connection"""
+
+    line = fd.readline()
+    if not line:
+        return None
+    return json.loads(line.decode("utf-8"))
@@ -0,0 +1,324 @@
+import io
+import os
+import sys
+import socket
+import logging
+import traceback
+import socketserver
+from contextlib import contextmanager
+
+from calm.dsl.config import get_context
+from calm.dsl.config.env_config import EnvConfig
+from calm.dsl.api import reset_api_client
+from calm.dsl.store import Cache
+from calm.dsl.log import CustomLogging, get_logging_handle
+
+from .protocol import get_socket_path, get_dsl_environ, send_message, read_message
+
+LOG = get_logging_handle(__name__)
+
+
+class _StreamWriter(io.TextIOBase):
+    """File like object sending the data written to it to the client"""
+
+    def __init__(self, fd, name, isatty=False):
+        self._fd = fd
+        self.name = name
+        self._isatty = isatty
+
+    @property
+    def encoding(self):
+        return "utf-8"
+
+    def writable(self):
+        return True
+
+    def isatty(self):
+        return self._isatty
+
+    def write(self, data):
+
+        # click checks if a stream is binary by writing b"" to it
+        if not isinstance(data, str):
+            raise TypeError(
+                "write() argument must be str, not {}".format(type(data).__name__)
+            )
+
+        if data:
+            send_message(self._fd, {"stream": self.name, "data": data})
+        return len(data)
+
+
+@contextmanager
+def _redirect_output(stdout, stderr):
+    """redirects sys streams and streams of logging handlers writing to stderr"""
+
+    handlers = []
+    for logger in list(logging.Logger.manager.loggerDict.values()):
+        for handler in getattr(logger, "handlers", []):
+            if type(handler) is logging.StreamHandler and handler.stream in (
+                sys.stderr,
+                sys.__stderr__,
+            ):
+                handlers.append((handler, handler.stream))
+                handler.setStream(stderr)
+
+    old_streams = (sys.stdin, sys.stdout, sys.stderr)
+    sys.stdin, sys.stdout, sys.stderr = io.StringIO(), stdout, stderr
+    try:
+        yield
+    finally:
+        sys.stdin, sys.stdout, sys.stderr = old_streams
+        for handler, stream in handlers:
+            handler.setStream(stream)
+
+
+def _set_dsl_environ(environ):
+    """replaces the CALM_DSL_* environment variables by given ones"""
+
+    for key in get_dsl_environ():
+        if key not in environ:
+            del os.environ[key]
+    os.environ.update(environ)
+
+
+class CommandHandler(socketserver.StreamRequestHandler):
+    """Runs the calm command sent by client, streaming back its output"""
+
+    def handle(self):
+        fd = self.wfile
+        request = read_message(self.rfile)
+        if not request:
+            return
+
+        action = request.get("action")
+        if action == "stop":
+            LOG.info("Stopping calm daemon")
+            self.server.stop_requested = True
+            send_message(fd, {"exit_code": 0})
+            return
+
+        elif action == "status":
+            stdout = _StreamWriter(fd, "stdout")
+            stdout.write(
+                "calm daemon (pid {}) served {} commands\n".format(
+                    os.getpid(), self.server.commands_served
+                )
+            )
+            send_message(fd, {"exit_code": 0})
+            return
+
+        if request["argv"][:1] == ["daemon"]:
+            stderr = _StreamWriter(fd, "stderr")
+            stderr.write("daemon commands can not be run on the daemon\n")
+            send_message(fd, {"exit_code": 1})
+            return
+
+        exit_code = self.server.run_command(
+            request["argv"],
+            request.get("cwd"),
+            stdout=_StreamWriter(fd, "stdout", request.get("isatty", False)),
+            stderr=_StreamWriter(fd, "stderr", request.get("isatty", False)),
+            environ=request.get("environ"),
+        )
+        # Command is not run if daemon is restarting, client runs it instead
+        send_message(fd, {"exit_code": exit_code})
+
+
+class DaemonServer(socketserver.UnixStreamServer):
+    """
+    Unix socket server running calm commands in this process, keeping the
+    loaded schemas, api client (and its connection pool) and db handle warm
+    across commands. Commands are run one at a time.
+
+    Schemas (and validators of entity classes) are built for the calm version
+    of the server. If config points to another server or calm version in cache
+    changes, daemon stops with restart_requested set, as these can not be
+    reloaded in this process.
+    """
+
+    def __init__(self, socket_path):
+        self.stop_requested = False
+        self.restart_requested = False
+        self.commands_served = 0
+        self._server_config = None
+        self._calm_server = None
+        super().__init__(socket_path, CommandHandler)
+
+    def server_bind(self):
+
+        # Commands run with user's credentials, allow only the user to connect.
+        # Socket is created with these permissions, so it is never open to others
+        old_umask = os.umask(0o177)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(old_umask)
+
+    def warm_up(self):
+        """loads the dsl models and all cli commands"""
+
+        from calm.dsl.cli.command_registry import load_all_command_modules
+
+        load_all_command_modules()
+        self._record_calm_server(self._get_calm_server()[0])
+
+    def _get_calm_server(self):
+        """returns pc host of current config and calm version in cache"""
+
+        from calm.dsl.store import Version
+
+        host = get_context().server_config.get("pc_ip")
+        try:
+            calm_version = Version.get_version("Calm") or "2.9.0"
+        except Exception:
+            calm_version = None
+
+        return host, calm_version
+
+    def _record_calm_server(self, host):
+        """records server and calm version used by the loaded schemas"""
+
+        from calm.dsl.builtins.models import schema
+
+        if self._calm_server is None and schema._CALM_VERSION is not None:
+            self._calm_server = (host, str(schema._CALM_VERSION))
+
+    def _refresh_api_client(self):
+        """drops api client if server config is changed. It is created by the
+        command on first use, so commands not talking to the server (ex: help,
+        init) do not need a valid config"""
+
+        server_config = dict(get_context().server_config)
+        if server_config != self._server_config:
+            self._server_config = server_config
+            reset_api_client()
+
+    def _reset_state(self):
+        """resets state which is otherwise carried over from last command"""
+
+        from calm.dsl.builtins.models.metadata_payload import reset_metadata_obj
+
+        EnvConfig.reload()
+        get_context().reset_configuration()
+        CustomLogging._SHOW_TRACE = False
+        Cache.invalidate_memo()
+        reset_metadata_obj()
+
+    def run_command(self, argv, cwd, stdout, stderr, environ=None):
+        """runs calm cli with given args, returns the exit code. environ holds
+        the CALM_DSL_* variables of the client, used in place of daemon's ones"""
+
+        from calm.dsl.cli import main as cli
+
+        LOG.debug("Running command: calm {}".format(" ".join(argv)))
+
+        old_cwd = os.getcwd()
+        old_environ = get_dsl_environ()
+        exit_code = 0
+        calm_server = None
+        with _redirect_output(stdout, stderr):
+            try:
+                if cwd:
+                    os.chdir(cwd)
+                if environ is not None:
+                    _set_dsl_environ(environ)
+                self._reset_state()
+                calm_server = self._get_calm_server()
+                if (
+                    self._calm_server
+                    and calm_server[1] is not None
+                    and calm_server != self._calm_server
+                ):
+                    LOG.warning(
+                        "Calm server changed from {} (calm {}) to {} (calm {}) "
+                        "since calm daemon started, restarting it".format(
+                            *(self._calm_server + calm_server)
+                        )
+                    )
+                    self.restart_requested = True
+                    self.stop_requested = True
+                    return None
+
+                self.commands_served += 1
+                self._refresh_api_client()
+                cli.main(args=argv, prog_name="calm")
+
+            except SystemExit as exp:
+                if exp.code is None:
+                    exit_code = 0
+                elif isinstance(exp.code, int):
+                    exit_code = exp.code
+                else:
+                    stderr.write("{}\n".format(exp.code))
+                    exit_code = 1
+
+            except Exception:
+                stderr.write(traceback.format_exc())
+                exit_code = 1
+
+            finally:
+                os.chdir(old_cwd)
+                _set_dsl_environ(old_environ)
+
+        # Schemas may be loaded by the first command if config was missing at start
+        if calm_server:
+            self._record_calm_server(calm_server[0])
+        return exit_code
+
+    def serve(self):
+        while not self.stop_requested:
+            self.handle_request()
+
+
+def _remove_stale_socket(socket_path):
+    """removes socket file left by a daemon which is not running"""
+
+    if not os.path.exists(socket_path):
+        return
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path)
+    except ConnectionRefusedError:
+        os.remove(socket_path)
+    else:
+        raise Exception("calm daemon is already running at {}".format(socket_path))
+    finally:
+        sock.close()
+
+
+def run_server(socket_path=None):
+    """runs calm daemon in foreground till it is stopped"""
+
+    socket_path = get_socket_path(socket_path)
+    _remove_stale_socket(socket_path)
+
+    server = DaemonServer(socket_path)
+    try:
+        server.warm_up()
+        LOG.info("calm daemon listening at {}".format(socket_path))
+        server.serve()
+
+    except KeyboardInterrupt:
+        LOG.info("Stopping calm daemon")
+
+    finally:
+        server.server_close()
+        os.remove(socket_path)
+
+    # Start a new daemon process, loading schemas for the current server
+    if server.restart_requested:
+        LOG.info("Restarting calm daemon")
+        os.execv(
+            sys.executable,
+            [
+                sys.executable,
+                "-c",
+                "from calm.dsl.cli import main; main()",
+                "daemon",
+                "start",
+                "--socket",
+                socket_path,
+            ],
+        )
@@ -1,3 +1,4 @@
 from .handler import get_db_handle, init_db_handle
+from .writer import get_db_writer, db_writer_context
 
-__all__ = ["get_db_handle", "init_db_handle"]
+__all__ = ["get_db_handle", "init_db_handle", "get_db_writer", "db_writer_context"]
@@ -3,6 +3,7 @@ import os
 
 from calm.dsl.config import get_context
 from .table_config import dsl_database, SecretTable, DataTable, VersionTable
+from .table_config import EntityRevisionTable
 from .table_config import CacheTableBase
 from calm.dsl.log import get_logging_handle
 
@@ -33,6 +34,7 @@ class Database:
         self.secret_table = self.set_and_verify(SecretTable)
         self.data_table = self.set_and_verify(DataTable)
         self.version_table = self.set_and_verify(VersionTable)
+        self.entity_revision_table = self.set_and_verify(EntityRevisionTable)
 
         for table_type, table in CacheTableBase.tables.items():
             setattr(self, table_type, self.set_and_verify(table))
@@ -42,8 +44,11 @@ class Database:
         If not, then creates one
         """
 
-        if not self.db.table_exists((table_cls.__name__).lower()):
+        table_name = (table_cls.__name__).lower()
+        if not self.db.table_exists(table_name):
             self.db.create_tables([table_cls])
+        else:
+            self.create_missing_indexes(table_cls)
 
         # Register table to class
         if table_cls not in self.registered_tables:
@@ -51,6 +56,16 @@ class Database:
 
         return table_cls
 
+    def create_missing_indexes(self, table_cls):
+        """Creates indexes declared on the table but absent in existing db file"""
+
+        table_name = (table_cls.__name__).lower()
+        existing_indexes = {index.name for index in self.db.get_indexes(table_name)}
+        for index in table_cls._meta.fields_to_index():
+            if index._name not in existing_indexes:
+                LOG.debug("Creating index {} on {}".format(index._name, table_name))
+                self.db.execute(table_cls._schema._create_index(index, safe=True))
+
     def is_closed(self):
         """return True if db connection is closed else False"""
 
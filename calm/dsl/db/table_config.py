@@ -11,16 +11,19 @@ from peewee import (
     IntegerField,
 )
 import datetime
+import threading
 import click
 import arrow
 import json
 import sys
+from contextlib import contextmanager
 from prettytable import PrettyTable
 
 from calm.dsl.api import get_resource_api, get_api_client
 from calm.dsl.config import get_context
 from calm.dsl.log import get_logging_handle
 from calm.dsl.constants import CACHE
+from .writer import get_db_writer
 
 LOG = get_logging_handle(__name__)
 # Proxy database
@@ -60,8 +63,15 @@ class DataTable(BaseModel):
 
 
 class CacheTableBase(BaseModel):
+    """Base class for cache tables. Subclasses declare indexes in Meta for
+    the column combinations queried by get_entity_data* helpers"""
+
     tables = {}
 
+    # Cache types whose data is read while syncing this table.
+    # Those tables are synced before this one in a parallel cache sync
+    sync_dependencies = []
+
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
 
@@ -78,6 +88,101 @@ class CacheTableBase(BaseModel):
             )
         )
 
+    @classmethod
+    def create(cls, **query):
+        write_batch = cls._get_write_batch()
+        if write_batch is not None:
+            write_batch.append((cls._BATCH_INSERT, query))
+            return
+
+        return cls._db_write(super().create, **query)
+
+    def delete_instance(self, *args, **kwargs):
+        return self._db_write(super().delete_instance, *args, **kwargs)
+
+    @classmethod
+    def _db_write(cls, write_func, *args, **kwargs):
+        """performs the write inline, adds it to the table's write batch or
+        hands it over to the active db writer"""
+
+        write_batch = cls._get_write_batch()
+        if write_batch is not None:
+            write_batch.append((cls._BATCH_QUERY, (write_func, args, kwargs)))
+            return
+
+        db_writer = get_db_writer()
+        if not db_writer:
+            return write_func(*args, **kwargs)
+
+        db_writer.submit(write_func, *args, **kwargs)
+
+    _BATCH_INSERT = "insert"
+    _BATCH_QUERY = "query"
+    _write_batches = threading.local()
+
+    @classmethod
+    def _get_write_batch(cls):
+        """returns ops buffered for this table in current thread, else None"""
+
+        return getattr(cls._write_batches, "batches", {}).get(cls)
+
+    @classmethod
+    @contextmanager
+    def write_batch(cls):
+        """buffers the writes done to this table within the context. On exit they
+        are written in a single transaction with rows inserted by chunked
+        insert_many, instead of autocommitting every row. Nothing is written
+        if the context raises."""
+
+        batches = cls._write_batches.__dict__.setdefault("batches", {})
+        if cls in batches:
+            yield
+            return
+
+        batches[cls] = []
+        try:
+            yield
+            write_batch = batches.pop(cls)
+        except BaseException:
+            batches.pop(cls, None)
+            raise
+
+        if write_batch:
+            cls._db_write(cls._flush_write_batch, write_batch)
+
+    @classmethod
+    def _flush_write_batch(cls, write_batch):
+        # Keep bound parameters per statement below sqlite's default limit (999)
+        chunk_size = max(1, 900 // len(cls._meta.fields))
+
+        with cls._meta.database.atomic():
+            rows = []
+            for op_type, op_data in write_batch + [(None, None)]:
+                if op_type == cls._BATCH_INSERT:
+                    rows.append(op_data)
+                    continue
+
+                cls._insert_rows(rows, chunk_size)
+                rows = []
+
+                if op_type == cls._BATCH_QUERY:
+                    write_func, args, kwargs = op_data
+                    write_func(*args, **kwargs)
+
+    @classmethod
+    def _insert_rows(cls, rows, chunk_size):
+        """inserts rows by chunked insert_many. insert_many takes the columns
+        from the first row of a chunk, so rows are grouped by their keys
+        (ex: subnets have cluster or vpc columns based on subnet type)"""
+
+        row_groups = {}
+        for row in rows:
+            row_groups.setdefault(tuple(sorted(row.keys())), []).append(row)
+
+        for group_rows in row_groups.values():
+            for i in range(0, len(group_rows), chunk_size):
+                cls.insert_many(group_rows[i : i + chunk_size]).execute()
+
     @classmethod
     def get_provider_plugin(self, provider_type="AHV_VM"):
         """returns the provider plugin"""
@@ -100,9 +205,8 @@ class CacheTableBase(BaseModel):
     @classmethod
     def clear(cls):
         """removes entire data from table"""
-        raise NotImplementedError(
-            "clear helper not implemented for {} table".format(cls.get_cache_type())
-        )
+
+        cls._db_write(cls.delete().execute)
 
     @classmethod
     def show_data(cls):
@@ -116,6 +220,104 @@ class CacheTableBase(BaseModel):
             "sync helper not implemented for {} table".format(cls.get_cache_type())
         )
 
+    @classmethod
+    def get_list_api(cls):
+        """returns resource api used to list the table entities.
+        Tables returning None do not support incremental sync"""
+
+        return None
+
+    # Fields of listed entities read by is_entity_cacheable, other than revision
+    cacheable_fields = []
+
+    @classmethod
+    def is_entity_cacheable(cls, entity):
+        """returns False for listed entities that sync() does not store"""
+
+        return True
+
+    _revision_recorders = threading.local()
+
+    @classmethod
+    @contextmanager
+    def record_revisions(cls):
+        """yields {uuid: revision} map filled by record_revision calls made by
+        sync() within the context"""
+
+        recorders = cls._revision_recorders.__dict__.setdefault("recorders", {})
+        recorders[cls] = {}
+        try:
+            yield recorders[cls]
+        finally:
+            recorders.pop(cls, None)
+
+    @classmethod
+    def record_revision(cls, entity):
+        """records revision of an entity listed by sync(), if recording"""
+
+        revisions = getattr(cls._revision_recorders, "recorders", {}).get(cls)
+        if revisions is not None and cls.is_entity_cacheable(entity):
+            revisions[
+                entity["metadata"]["uuid"]
+            ] = EntityRevisionTable.get_entity_revision(entity)
+
+    @classmethod
+    def sync_incremental(cls):
+        """sync only the entities added, modified or deleted on server since
+        last sync. Falls back to sync() if table doesn't support it"""
+
+        list_api = cls.get_list_api()
+        if not list_api:
+            cls.sync()
+            return
+
+        cache_type = cls.get_cache_type()
+        stored_revisions = EntityRevisionTable.get_revisions(cache_type)
+
+        # No watermark found, so do a full sync and store the revisions of
+        # entities listed by it
+        if not stored_revisions:
+            with cls.record_revisions() as server_revisions:
+                cls.sync()
+            cls._db_write(
+                EntityRevisionTable.set_revisions, cache_type, server_revisions
+            )
+            return
+
+        # Only revisions are needed from the listing
+        fields = EntityRevisionTable.revision_fields + cls.cacheable_fields
+        server_revisions = {}
+        for entity in list_api.iter_all(fields=fields):
+            if not cls.is_entity_cacheable(entity):
+                continue
+
+            uuid = entity["metadata"]["uuid"]
+            revision = EntityRevisionTable.get_entity_revision(entity)
+            server_revisions[uuid] = revision
+            if stored_revisions.get(uuid) == revision:
+                continue
+
+            # Entity may also be present if table was fully synced in between
+            LOG.debug("Updating {} '{}' in cache".format(cache_type, uuid))
+            cls._delete_if_exists(uuid)
+            cls.add_one(uuid)
+
+        for uuid in set(stored_revisions.keys()) - set(server_revisions.keys()):
+            LOG.debug("Deleting {} '{}' from cache".format(cache_type, uuid))
+            cls._delete_if_exists(uuid)
+
+        if server_revisions != stored_revisions:
+            cls._db_write(
+                EntityRevisionTable.set_revisions, cache_type, server_revisions
+            )
+
+    @classmethod
+    def _delete_if_exists(cls, uuid):
+        try:
+            cls.delete_one(uuid)
+        except DoesNotExist:
+            pass
+
     @classmethod
     def create_entry(cls, name, uuid, **kwargs):
         raise NotImplementedError(
@@ -192,12 +394,6 @@ class AccountCache(CacheTableBase):
             "last_update_time": self.last_update_time,
         }
 
-    @classmethod
-    def clear(cls):
-        """removes entire data from table"""
-        for db_entity in cls.select():
-            db_entity.delete_instance()
-
     @classmethod
     def show_data(cls):
         """display stored data in table"""
@@ -323,12 +519,17 @@ class AccountCache(CacheTableBase):
     class Meta:
         database = dsl_database
         primary_key = CompositeKey("name", "uuid")
+        indexes = (
+            (("uuid",), False),
+            (("name", "provider_type"), False),
+        )
 
 
 class AhvClustersCache(CacheTableBase):
     __cache_type__ = CACHE.ENTITY.AHV_CLUSTER
     feature_min_version = "3.5.0"
     is_policy_required = False
+    sync_dependencies = [CACHE.ENTITY.ACCOUNT]
     name = CharField()
     uuid = CharField()
     pe_account_uuid = CharField(default="")
@@ -344,12 +545,6 @@ class AhvClustersCache(CacheTableBase):
             "last_update_time": self.last_update_time,
         }
 
-    @classmethod
-    def clear(cls):
-        """removes entire data from table"""
-        for db_entity in cls.select():
-            db_entity.delete_instance()
-
     @classmethod
     def show_data(cls):
         """display stored data in table"""
@@ -407,7 +602,7 @@ class AhvClustersCache(CacheTableBase):
                 )
                 continue
 
-            # TODO the order of cache sync is how their model is defined in table_config.py file
+            # Account cache is synced before this table (see sync_dependencies)
             account = AccountCache.get(uuid=pc_acc_uuid)
             account_clusters_data = json.loads(account.data).get("clusters", {})
             account_clusters_data_rev = {v: k for k, v in account_clusters_data.items()}
@@ -511,6 +706,10 @@ class AhvClustersCache(CacheTableBase):
     class Meta:
         database = dsl_database
         primary_key = CompositeKey("name", "uuid", "account_uuid")
+        indexes = (
+            (("uuid",), False),
+            (("name", "account_uuid"), False),
+        )
 
 
 class AhvVpcsCache(CacheTableBase):
@@ -534,12 +733,6 @@ class AhvVpcsCache(CacheTableBase):
             "last_update_time": self.last_update_time,
         }
 
-    @classmethod
-    def clear(cls):
-        """removes entire data from table"""
-        for db_entity in cls.select():
-            db_entity.delete_instance()
-
     @classmethod
     def show_data(cls):
         """display stored data in table"""
@@ -596,7 +789,19 @@ class AhvVpcsCache(CacheTableBase):
         AhvObj = AhvVmProvider.get_api_obj()
 
         # Get all Calm vpcs and Tunnels
-        calm_vpc_entities = client.network_group.list_all()
+        vpc_tunnel_reference_map = {}
+        for calm_vpc in client.network_group.iter_all(
+            fields=[
+                "status.resources.tunnel_reference",
+                "status.resources.platform_vpc_uuid_list",
+            ]
+        ):
+            calm_vpc_resources = calm_vpc.get("status", {}).get("resources", {})
+            for vpc_uuid in calm_vpc_resources.get("platform_vpc_uuid_list", []):
+                vpc_tunnel_reference_map.setdefault(
+                    vpc_uuid, calm_vpc_resources.get("tunnel_reference", {})
+                )
+
         for pc_acc_name, pc_acc_uuid in account_name_uuid_map.items():
             try:
                 res = AhvObj.vpcs(account_uuid=pc_acc_uuid)
@@ -612,18 +817,7 @@ class AhvVpcsCache(CacheTableBase):
                 name = entity["status"]["name"]
                 uuid = entity["metadata"]["uuid"]
 
-                # TODO improve this, it shouldn't iterate over these entities every time
-                tunnel_reference = next(
-                    (
-                        calm_vpc["status"]["resources"].get("tunnel_reference", {})
-                        for calm_vpc in calm_vpc_entities
-                        if uuid
-                        in calm_vpc["status"]["resources"].get(
-                            "platform_vpc_uuid_list", []
-                        )
-                    ),
-                    {},
-                )
+                tunnel_reference = vpc_tunnel_reference_map.get(uuid, {})
 
                 cls.create_entry(
                     name=name,
@@ -690,6 +884,10 @@ class AhvVpcsCache(CacheTableBase):
     class Meta:
         database = dsl_database
         primary_key = CompositeKey("name", "uuid", "account_uuid")
+        indexes = (
+            (("uuid",), False),
+            (("name", "account_uuid"), False),
+        )
 
 
 class AhvSubnetsCache(CacheTableBase):
@@ -719,12 +917,6 @@ class AhvSubnetsCache(CacheTableBase):
             details["vpc_uuid"] = self.vpc.uuid
         return details
 
-    @classmethod
-    def clear(cls):
-        """removes entire data from table"""
-        for db_entity in cls.select():
-            db_entity.delete_instance()
-
     @classmethod
     def show_data(cls):
         """display stored data in table"""
@@ -894,6 +1086,10 @@ class AhvSubnetsCache(CacheTableBase):
     class Meta:
         database = dsl_database
         primary_key = CompositeKey("name", "uuid", "account_uuid")
+        indexes = (
+            (("uuid", "account_uuid"), False),
+            (("name", "account_uuid"), False),
+        )
 
 
 class AhvImagesCache(CacheTableBase):
@@ -914,12 +1110,6 @@ class AhvImagesCache(CacheTableBase):
             "last_update_time": self.last_update_time,
         }
 
-    @classmethod
-    def clear(cls):
-        """removes entire data from table"""
-        for db_entity in cls.select():
-            db_entity.delete_instance()
-
     @classmethod
     def show_data(cls):
         """display stored data in table"""
@@ -1040,6 +1230,10 @@ class AhvImagesCache(CacheTableBase):
     class Meta:
         database = dsl_database
         primary_key = CompositeKey("name", "uuid", "account_uuid")
+        indexes = (
+            (("uuid", "account_uuid"), False),
+            (("name", "image_type", "account_uuid"), False),
+        )
 
 
 class ProjectCache(CacheTableBase):
@@ -1064,12 +1258,6 @@ class ProjectCache(CacheTableBase):
             "last_update_time": self.last_update_time,
         }
 
-    @classmethod
-    def clear(cls):
-        """removes entire data from table"""
-        for db_entity in cls.select():
-            db_entity.delete_instance()
-
     @classmethod
     def show_data(cls):
         """display stored data in table"""
@@ -1093,6 +1281,10 @@ class ProjectCache(CacheTableBase):
             )
         click.echo(table)
 
+    @classmethod
+    def get_list_api(cls):
+        return get_api_client().project
+
     @classmethod
     def sync(cls):
         """sync the table data from server"""
@@ -1185,6 +1377,8 @@ class ProjectCache(CacheTableBase):
             LOG.exception(err)
 
         for entity in res_entities:
+            cls.record_revision(entity)
+
             # populating a map to lookup the account to which a subnet belongs
             whitelisted_subnets = dict()
             whitelisted_clusters = dict()
@@ -1496,6 +1690,7 @@ class ProjectCache(CacheTableBase):
     class Meta:
         database = dsl_database
         primary_key = CompositeKey("name", "uuid")
+        indexes = ((("uuid",), False),)
 
 
 class EnvironmentCache(CacheTableBase):
@@ -1516,12 +1711,6 @@ class EnvironmentCache(CacheTableBase):
             "last_update_time": self.last_update_time,
         }
 
-    @classmethod
-    def clear(cls):
-        """removes entire data from table"""
-        for db_entity in cls.select():
-            db_entity.delete_instance()
-
     @classmethod
     def show_data(cls):
         """display stored data in table"""
@@ -1546,6 +1735,17 @@ class EnvironmentCache(CacheTableBase):
             )
         click.echo(table)
 
+    @classmethod
+    def get_list_api(cls):
+        return get_api_client().environment
+
+    cacheable_fields = ["metadata.project_reference"]
+
+    @classmethod
+    def is_entity_cacheable(cls, entity):
+        # environments that are not associated to a project are not cached
+        return bool(entity["metadata"].get("project_reference", {}).get("uuid", ""))
+
     @classmethod
     def sync(cls):
         """sync the table data from server"""
@@ -1555,8 +1755,8 @@ class EnvironmentCache(CacheTableBase):
         # update by latest data
         client = get_api_client()
 
-        env_list = client.environment.list_all()
-        for entity in env_list:
+        for entity in client.environment.iter_all():
+            cls.record_revision(entity)
             name = entity["status"]["name"]
             uuid = entity["metadata"]["uuid"]
             project_uuid = (
@@ -1786,6 +1986,10 @@ class EnvironmentCache(CacheTableBase):
     class Meta:
         database = dsl_database
         primary_key = CompositeKey("name", "uuid")
+        indexes = (
+            (("uuid",), False),
+            (("name", "project_uuid"), False),
+        )
 
 
 class UsersCache(CacheTableBase):
@@ -1806,12 +2010,6 @@ class UsersCache(CacheTableBase):
             "last_update_time": self.last_update_time,
         }
 
-    @classmethod
-    def clear(cls):
-        """removes entire data from table"""
-        for db_entity in cls.select():
-            db_entity.delete_instance()
-
     @classmethod
     def show_data(cls):
         """display stored data in table"""
@@ -1858,6 +2056,10 @@ class UsersCache(CacheTableBase):
             name=name, uuid=uuid, directory=directory, display_name=display_name
         )
 
+    @classmethod
+    def get_list_api(cls):
+        return get_api_client().user
+
     @classmethod
     def sync(cls):
         """sync the table from server"""
@@ -1873,6 +2075,7 @@ class UsersCache(CacheTableBase):
 
         res = res.json()
         for entity in res["entities"]:
+            cls.record_revision(entity)
             name = entity["status"]["name"]
             uuid = entity["metadata"]["uuid"]
             display_name = entity["status"]["resources"].get("display_name") or ""
@@ -1980,6 +2183,10 @@ class UsersCache(CacheTableBase):
     class Meta:
         database = dsl_database
         primary_key = CompositeKey("name", "uuid")
+        indexes = (
+            (("uuid",), False),
+            (("name", "directory"), False),
+        )
 
 
 class RolesCache(CacheTableBase):
@@ -1996,12 +2203,6 @@ class RolesCache(CacheTableBase):
             "last_update_time": self.last_update_time,
         }
 
-    @classmethod
-    def clear(cls):
-        """removes entire data from table"""
-        for db_entity in cls.select():
-            db_entity.delete_instance()
-
     @classmethod
     def show_data(cls):
         """display stored data in table"""
@@ -2030,6 +2231,10 @@ class RolesCache(CacheTableBase):
     def create_entry(cls, name, uuid, **kwargs):
         super().create(name=name, uuid=uuid)
 
+    @classmethod
+    def get_list_api(cls):
+        return get_api_client().role
+
     @classmethod
     def sync(cls):
         """sync the table from server"""
@@ -2045,6 +2250,7 @@ class RolesCache(CacheTableBase):
 
         res = res.json()
         for entity in res["entities"]:
+            cls.record_revision(entity)
             name = entity["status"]["name"]
             uuid = entity["metadata"]["uuid"]
             cls.create_entry(name=name, uuid=uuid)
@@ -2101,6 +2307,7 @@ class RolesCache(CacheTableBase):
     class Meta:
         database = dsl_database
         primary_key = CompositeKey("name", "uuid")
+        indexes = ((("uuid",), False),)
 
 
 class DirectoryServiceCache(CacheTableBase):
@@ -2117,12 +2324,6 @@ class DirectoryServiceCache(CacheTableBase):
             "last_update_time": self.last_update_time,
         }
 
-    @classmethod
-    def clear(cls):
-        """removes entire data from table"""
-        for db_entity in cls.select():
-            db_entity.delete_instance()
-
     @classmethod
     def show_data(cls):
         """display stored data in table"""
@@ -2193,6 +2394,7 @@ class DirectoryServiceCache(CacheTableBase):
     class Meta:
         database = dsl_database
         primary_key = CompositeKey("name", "uuid")
+        indexes = ((("uuid",), False),)
 
 
 class UserGroupCache(CacheTableBase):
@@ -2213,12 +2415,6 @@ class UserGroupCache(CacheTableBase):
             "last_update_time": self.last_update_time,
         }
 
-    @classmethod
-    def clear(cls):
-        """removes entire data from table"""
-        for db_entity in cls.select():
-            db_entity.delete_instance()
-
     @classmethod
     def show_data(cls):
         """display stored data in table"""
@@ -2265,6 +2461,28 @@ class UserGroupCache(CacheTableBase):
             name=name, uuid=uuid, directory=directory, display_name=display_name
         )
 
+    @classmethod
+    def get_list_api(cls):
+        return get_api_client().group
+
+    cacheable_fields = ["status.state", "status.resources.directory_service_user_group"]
+
+    @classmethod
+    def is_entity_cacheable(cls, entity):
+        if entity["status"]["state"] != "COMPLETE":
+            return False
+
+        directory_service_user_group = (
+            entity["status"]["resources"].get("directory_service_user_group") or dict()
+        )
+        directory_service_ref = (
+            directory_service_user_group.get("directory_service_reference") or dict()
+        )
+        return bool(
+            directory_service_user_group.get("distinguished_name")
+            and directory_service_ref.get("name", "")
+        )
+
     @classmethod
     def sync(cls):
         """sync the table from server"""
@@ -2280,6 +2498,7 @@ class UserGroupCache(CacheTableBase):
 
         res = res.json()
         for entity in res["entities"]:
+            cls.record_revision(entity)
             state = entity["status"]["state"]
             if state != "COMPLETE":
                 continue
@@ -2401,6 +2620,10 @@ class UserGroupCache(CacheTableBase):
     class Meta:
         database = dsl_database
         primary_key = CompositeKey("name", "uuid")
+        indexes = (
+            (("uuid",), False),
+            (("name", "directory"), False),
+        )
 
 
 class AhvNetworkFunctionChain(CacheTableBase):
@@ -2417,12 +2640,6 @@ class AhvNetworkFunctionChain(CacheTableBase):
             "last_update_time": self.last_update_time,
         }
 
-    @classmethod
-    def clear(cls):
-        """removes entire data from table"""
-        for db_entity in cls.select():
-            db_entity.delete_instance()
-
     @classmethod
     def show_data(cls):
         """display stored data in table"""
@@ -2507,12 +2724,6 @@ class AppProtectionPolicyCache(CacheTableBase):
             "last_update_time": self.last_update_time,
         }
 
-    @classmethod
-    def clear(cls):
-        """removes entire data from table"""
-        for db_entity in cls.select():
-            db_entity.delete_instance()
-
     @classmethod
     def show_data(cls):
         """display stored data in table"""
@@ -2561,9 +2772,7 @@ class AppProtectionPolicyCache(CacheTableBase):
         Obj = get_resource_api(
             "app_protection_policies", client.connection, calm_api=True
         )
-        entities = Obj.list_all()
-
-        for entity in entities:
+        for entity in Obj.iter_all():
             name = entity["status"]["name"]
             uuid = entity["metadata"]["uuid"]
             project_reference = entity["metadata"].get("project_reference", {})
@@ -2640,6 +2849,7 @@ class AppProtectionPolicyCache(CacheTableBase):
     class Meta:
         database = dsl_database
         primary_key = CompositeKey("name", "uuid", "rule_uuid")
+        indexes = ((("name", "project_name"), False),)
 
 
 class VersionTable(BaseModel):
@@ -2651,6 +2861,54 @@ class VersionTable(BaseModel):
         return {"name": self.name, "version": self.version}
 
 
+class EntityRevisionTable(BaseModel):
+    """Stores server side revision of cached entities, used by incremental sync"""
+
+    cache_type = CharField()
+    uuid = CharField()
+    revision = CharField()
+
+    # Entity fields read by get_entity_revision
+    revision_fields = [
+        "metadata.uuid",
+        "metadata.spec_version",
+        "metadata.last_update_time",
+    ]
+
+    @classmethod
+    def get_entity_revision(cls, entity):
+        """returns revision string of entity from its metadata"""
+
+        metadata = entity.get("metadata", {})
+        return "{}|{}".format(
+            metadata.get("spec_version", ""), metadata.get("last_update_time", "")
+        )
+
+    @classmethod
+    def get_revisions(cls, cache_type):
+        """returns {uuid: revision} map stored for the cache type"""
+
+        query = cls.select().where(cls.cache_type == cache_type)
+        return {row.uuid: row.revision for row in query}
+
+    @classmethod
+    def set_revisions(cls, cache_type, revisions):
+        """replaces the stored revisions of cache type"""
+
+        with cls._meta.database.atomic():
+            cls.delete().where(cls.cache_type == cache_type).execute()
+            rows = [
+                {"cache_type": cache_type, "uuid": uuid, "revision": revision}
+                for uuid, revision in revisions.items()
+            ]
+            for i in range(0, len(rows), 100):
+                cls.insert_many(rows[i : i + 100]).execute()
+
+    class Meta:
+        database = dsl_database
+        primary_key = CompositeKey("cache_type", "uuid")
+
+
 def highlight_text(text, **kwargs):
     """Highlight text in our standard format"""
     return click.style("{}".format(text), fg="blue", bold=False, **kwargs)
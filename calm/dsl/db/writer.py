@@ -0,0 +1,78 @@
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+
+from calm.dsl.log import get_logging_handle
+
+LOG = get_logging_handle(__name__)
+
+
+class DBWriter:
+    """Single thread performing db writes submitted by other threads.
+
+    SQLite allows only one writer at a time. While cache tables are synced in
+    parallel, their writes are queued here and executed in submission order
+    instead of failing with 'database is locked' errors.
+    """
+
+    def __init__(self, database):
+        self.database = database
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=self.__class__.__name__
+        )
+        self._local = threading.local()
+
+    def submit(self, func, *args, **kwargs):
+        """queues the write. Errors are raised by flush() of submitting thread"""
+
+        future = self._executor.submit(func, *args, **kwargs)
+        if not hasattr(self._local, "futures"):
+            self._local.futures = []
+        self._local.futures.append(future)
+        return future
+
+    def flush(self):
+        """waits till all writes submitted by current thread are done"""
+
+        futures = getattr(self._local, "futures", [])
+        self._local.futures = []
+        for future in futures:
+            future.result()
+
+    def close(self):
+        """closes the writer thread's db connection and stops the thread"""
+
+        self._executor.submit(self._close_connection)
+        self._executor.shutdown(wait=True)
+
+    def _close_connection(self):
+        if not self.database.is_closed():
+            self.database.close()
+
+
+_DB_WRITER = None
+
+
+def get_db_writer():
+    """returns active db writer, None if writes are done inline"""
+
+    return _DB_WRITER
+
+
+@contextmanager
+def db_writer_context(database):
+    """routes cache table writes through a single DBWriter within the context"""
+
+    global _DB_WRITER
+    if _DB_WRITER:
+        yield _DB_WRITER
+        return
+
+    _DB_WRITER = DBWriter(database)
+    LOG.debug("Started db writer thread")
+    try:
+        yield _DB_WRITER
+    finally:
+        _DB_WRITER.close()
+        _DB_WRITER = None
+        LOG.debug("Stopped db writer thread")
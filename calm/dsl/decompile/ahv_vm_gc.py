@@ -4,7 +4,11 @@ from ruamel import yaml
 
 from calm.dsl.decompile.render import render_template
 from calm.dsl.decompile.credential import get_cred_var_name
-from calm.dsl.decompile.file_handler import get_specs_dir, get_specs_dir_key
+from calm.dsl.decompile.file_handler import (
+    get_specs_dir,
+    get_specs_dir_key,
+    write_file,
+)
 from calm.dsl.builtins import RefType
 from calm.dsl.log import get_logging_handle
 
@@ -32,9 +36,11 @@ def render_ahv_vm_gc(cls, vm_name_prefix=""):
         if not cloud_init_user_data:
             return
 
-        with open(os.path.join(spec_dir, file_name), "w+") as fd:
-            # TODO take care of macro case
-            fd.write(yaml.dump(cloud_init_user_data, default_flow_style=False))
+        # TODO take care of macro case
+        write_file(
+            os.path.join(spec_dir, file_name),
+            yaml.dump(cloud_init_user_data, default_flow_style=False),
+        )
 
     elif sys_prep:
         file_name = "{}_sysprep_unattend_xml.xml".format(vm_name_prefix)
@@ -42,8 +48,7 @@ def render_ahv_vm_gc(cls, vm_name_prefix=""):
             get_specs_dir_key(), file_name
         )
         sysprep_unattend_xml = sys_prep.get("unattend_xml", "")
-        with open(os.path.join(spec_dir, file_name), "w+") as fd:
-            fd.write(sysprep_unattend_xml)
+        write_file(os.path.join(spec_dir, file_name), sysprep_unattend_xml)
 
         install_type = sys_prep.get("install_type", "PREPARED")
         is_domain = sys_prep.get("is_domain", False)
@@ -14,7 +14,7 @@ from calm.dsl.decompile.credential import render_credential_template, get_cred_f
 from calm.dsl.decompile.blueprint import render_blueprint_template
 from calm.dsl.decompile.metadata import render_metadata_template
 from calm.dsl.decompile.variable import get_secret_variable_files
-from calm.dsl.decompile.file_handler import get_local_dir
+from calm.dsl.decompile.file_handler import get_local_dir, write_file
 from calm.dsl.builtins import BlueprintType, ServiceType, PackageType
 from calm.dsl.builtins import DeploymentType, ProfileType, SubstrateType
 
@@ -113,8 +113,7 @@ def render_bp_file_template(cls, with_secrets=False, metadata_obj=None):
                 hide_input=True,
             )
             file_loc = os.path.join(get_local_dir(), file_name)
-            with open(file_loc, "w+") as fd:
-                fd.write(secret_val)
+            write_file(file_loc, secret_val)
 
     dependepent_entities = []
     dependepent_entities = get_ordered_entities(entity_name_text_map, entity_edges)
@@ -2,7 +2,7 @@ import os
 
 from calm.dsl.decompile.render import render_template
 from calm.dsl.builtins import CredentialType
-from calm.dsl.decompile.file_handler import get_local_dir
+from calm.dsl.decompile.file_handler import get_local_dir, write_file
 from calm.dsl.log import get_logging_handle
 from calm.dsl.builtins import get_valid_identifier
 
@@ -26,8 +26,7 @@ def render_credential_template(cls):
     file_loc = os.path.join(get_local_dir(), file_name)
 
     # Storing empty value in the file
-    with open(file_loc, "w+") as fd:
-        fd.write("")
+    write_file(file_loc, "")
 
     user_attrs["var_name"] = var_name
     user_attrs["value"] = file_name
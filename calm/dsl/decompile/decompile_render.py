@@ -1,9 +1,10 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from black import format_str, FileMode
 
 from calm.dsl.log import get_logging_handle
 from calm.dsl.decompile.bp_file_helper import render_bp_file_template
-from calm.dsl.decompile.file_handler import init_bp_dir
+from calm.dsl.decompile.file_handler import init_bp_dir, flush_files
 
 LOG = get_logging_handle(__name__)
 
@@ -15,7 +16,9 @@ def create_bp_file(dir_name, bp_data):
         fd.write(bp_data)
 
 
-def create_bp_dir(bp_cls=None, bp_dir=None, with_secrets=False, metadata_obj=None):
+def create_bp_dir(
+    bp_cls=None, bp_dir=None, with_secrets=False, metadata_obj=None, format_code=True
+):
 
     if not bp_dir:
         bp_dir = os.path.join(os.getcwd(), bp_cls.__name__)
@@ -26,7 +29,17 @@ def create_bp_dir(bp_cls=None, bp_dir=None, with_secrets=False, metadata_obj=Non
     bp_data = render_bp_file_template(
         cls=bp_cls, with_secrets=with_secrets, metadata_obj=metadata_obj
     )
-    LOG.info("Formatting blueprint file using black")
-    bp_data = format_str(bp_data, mode=FileMode())
+
+    # Scripts, specs and secret files are written while blueprint file is formatted
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        LOG.info("Creating script, spec and secret files")
+        flush_future = executor.submit(flush_files)
+
+        if format_code:
+            LOG.info("Formatting blueprint file using black")
+            bp_data = format_str(bp_data, mode=FileMode())
+
+        flush_future.result()
+
     LOG.info("Creating blueprint file")
     create_bp_file(bp_dir, bp_data)
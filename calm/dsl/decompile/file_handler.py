@@ -5,6 +5,9 @@ SCRIPTS_DIR = None
 SPECS_DIR = None
 BP_DIR = None
 
+# Files rendered while decompiling, written together by flush_files
+BP_FILES = {}
+
 LOCAL_DIR_KEY = ".local"
 SCRIPTS_DIR_KEY = "scripts"
 SPECS_DIR_KEY = "specs"
@@ -12,20 +15,13 @@ SPECS_DIR_KEY = "specs"
 
 def make_bp_dirs(bp_dir):
 
-    if not os.path.isdir(bp_dir):
-        os.makedirs(bp_dir)
-
     local_dir = os.path.join(bp_dir, LOCAL_DIR_KEY)
-    if not os.path.isdir(local_dir):
-        os.makedirs(local_dir)
-
     spec_dir = os.path.join(bp_dir, SPECS_DIR_KEY)
-    if not os.path.isdir(spec_dir):
-        os.makedirs(spec_dir)
-
     scripts_dir = os.path.join(bp_dir, SCRIPTS_DIR_KEY)
-    if not os.path.isdir(scripts_dir):
-        os.makedirs(scripts_dir)
+
+    # Parent bp_dir is created along with the first sub directory
+    for dir_name in (local_dir, spec_dir, scripts_dir):
+        os.makedirs(dir_name, exist_ok=True)
 
     return (bp_dir, local_dir, spec_dir, scripts_dir)
 
@@ -34,10 +30,27 @@ def init_bp_dir(bp_dir):
 
     global LOCAL_DIR, SCRIPTS_DIR, SPECS_DIR, BP_DIR
     BP_DIR, LOCAL_DIR, SPECS_DIR, SCRIPTS_DIR = make_bp_dirs(bp_dir)
+    BP_FILES.clear()
 
     return (BP_DIR, LOCAL_DIR, SPECS_DIR, SCRIPTS_DIR)
 
 
+def write_file(file_location, data=""):
+    """buffers the data of file, it is written to disk by flush_files"""
+
+    BP_FILES[file_location] = data
+
+
+def flush_files():
+    """writes all the buffered files and clears the buffer"""
+
+    for file_location, data in BP_FILES.items():
+        with open(file_location, "w+") as fd:
+            fd.write(data)
+
+    BP_FILES.clear()
+
+
 def get_bp_dir():
     return BP_DIR
 
@@ -72,3 +85,4 @@ def init_file_globals():
     SCRIPTS_DIR = None
     SPECS_DIR = None
     BP_DIR = None
+    BP_FILES.clear()
@@ -1,17 +1,48 @@
-from jinja2 import Environment, PackageLoader
+import os
+from jinja2 import Environment, PackageLoader, FileSystemBytecodeCache
+
+# Directory to keep compiled templates across runs, disabled if not set
+JINJA_CACHE_DIR_ENV = "CALM_DSL_JINJA_CACHE_DIR"
+
+_ENV = None
+
+
+def get_env():
+    """returns jinja environment shared by all decompile templates"""
+
+    global _ENV
+    if _ENV is None:
+        bytecode_cache = None
+        cache_dir = os.environ.get(JINJA_CACHE_DIR_ENV)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(cache_dir)
+
+        # Templates are shipped with the package, so no need to check them for changes
+        _ENV = Environment(
+            loader=PackageLoader(__name__, "schemas"),
+            auto_reload=False,
+            cache_size=-1,
+            bytecode_cache=bytecode_cache,
+        )
+
+    return _ENV
+
+
+def reset_env():
+    """drops the jinja environment and compiled templates"""
+
+    global _ENV
+    _ENV = None
 
 
 def get_template(schema_file):
 
-    loader = PackageLoader(__name__, "schemas")
-    env = Environment(loader=loader)
-    template = env.get_template(schema_file)
-    return template
+    # Environment keeps all loaded templates (cache_size=-1)
+    return get_env().get_template(schema_file)
 
 
 def render_template(schema_file, obj):
-
     template = get_template(schema_file)
     text = template.render(obj=obj)
-
     return text.strip()
@@ -3,7 +3,11 @@ import os
 from calm.dsl.decompile.render import render_template
 from calm.dsl.decompile.ref import render_ref_template
 from calm.dsl.decompile.credential import get_cred_var_name
-from calm.dsl.decompile.file_handler import get_scripts_dir, get_scripts_dir_key
+from calm.dsl.decompile.file_handler import (
+    get_scripts_dir,
+    get_scripts_dir_key,
+    write_file,
+)
 from calm.dsl.builtins import TaskType
 from calm.dsl.log import get_logging_handle
 
@@ -177,8 +181,7 @@ def create_script_file(script_type, script="", entity_context=""):
         raise TypeError("Script Type {} not supported".format(script_type))
 
     file_location = os.path.join(scripts_dir, file_name)
-    with open(file_location, "w+") as fd:
-        fd.write(script)
+    write_file(file_location, script)
 
     dsl_file_location = "os.path.join('{}', '{}')".format(
         get_scripts_dir_key(), file_name
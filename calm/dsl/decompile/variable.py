@@ -3,7 +3,7 @@ import os
 from calm.dsl.decompile.render import render_template
 from calm.dsl.decompile.task import render_task_template
 from calm.dsl.builtins import VariableType, TaskType
-from calm.dsl.decompile.file_handler import get_local_dir
+from calm.dsl.decompile.file_handler import get_local_dir, write_file
 from calm.dsl.log import get_logging_handle
 
 LOG = get_logging_handle(__name__)
@@ -180,8 +180,7 @@ def get_secret_var_val(entity_context):
     SECRET_VAR_FILES.append(entity_context)
     file_location = os.path.join(get_local_dir(), entity_context)
 
-    with open(file_location, "w+") as fd:
-        fd.write("")
+    write_file(file_location, "")
 
     # Replace read_local_file by a constant
     return entity_context
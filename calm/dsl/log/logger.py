@@ -1,5 +1,4 @@
 import logging
-import inspect
 
 from colorlog import ColoredFormatter
 import time
@@ -68,13 +67,15 @@ class CustomLogging:
 
     @staticmethod
     def __add_caller_info(msg):
-        stack = inspect.stack()
+        # Frame of the code calling the log method. Only the frame is looked up
+        # (as logging.findCaller does), no source context is read for the stack.
+        frame = sys._getframe(2)
 
-        # filename = stack[2][1]
-        # func = stack[2][3]
-        ln = stack[2][2]
+        ln = frame.f_lineno
         if CustomLogging.IS_RP_ENABLED:
-            ln = "{}-{}:{}".format(stack[2][1], stack[2][3], stack[2][2])
+            ln = "{}-{}:{}".format(
+                frame.f_code.co_filename, frame.f_code.co_name, frame.f_lineno
+            )
 
         return ":{}] {}".format(ln, msg)
 
@@ -96,7 +97,10 @@ class CustomLogging:
 
     def set_logger_level(self, lvl):
         """sets the logger verbose level"""
-        self._logger.setLevel(lvl)
+
+        # setLevel clears the level cache of all loggers, so skip it if unchanged
+        if self._logger.level != lvl:
+            self._logger.setLevel(lvl)
 
     def info(self, msg, nl=True, **kwargs):
         """
@@ -110,6 +114,8 @@ class CustomLogging:
             None
         """
         logger = self.get_logger()
+        if not logger.isEnabledFor(logging.INFO):
+            return
 
         if not nl:
             for handler in logger.handlers:
@@ -133,6 +139,9 @@ class CustomLogging:
         """
 
         logger = self.get_logger()
+        if not logger.isEnabledFor(logging.WARNING):
+            return
+
         return logger.warning(self.__add_caller_info(msg), *args, **kwargs)
 
     def error(self, msg, *args, **kwargs):
@@ -147,6 +156,9 @@ class CustomLogging:
         """
 
         logger = self.get_logger()
+        if not logger.isEnabledFor(logging.ERROR):
+            return
+
         if self.show_trace:
             kwargs["stack_info"] = sys.exc_info()
         return logger.error(self.__add_caller_info(msg), *args, **kwargs)
@@ -163,6 +175,9 @@ class CustomLogging:
         """
 
         logger = self.get_logger()
+        if not logger.isEnabledFor(logging.ERROR):
+            return
+
         exc_info = False
         if self.show_trace:
             exc_info = True
@@ -182,6 +197,9 @@ class CustomLogging:
         """
 
         logger = self.get_logger()
+        if not logger.isEnabledFor(logging.CRITICAL):
+            return
+
         if self.show_trace:
             kwargs["stack_info"] = sys.exc_info()
         return logger.critical(self.__add_caller_info(msg), *args, **kwargs)
@@ -198,6 +216,9 @@ class CustomLogging:
         """
 
         logger = self.get_logger()
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+
         return logger.debug(self.__add_caller_info(msg), *args, **kwargs)
 
     def __addCustomFormatter(self, ch):
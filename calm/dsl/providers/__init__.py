@@ -5,13 +5,9 @@ from .base import (
     get_provider_interface,
 )
 
-from .plugins import get_plugins
-
 __all__ = [
     "get_provider",
     "get_providers",
     "get_provider_types",
     "get_provider_interface",
 ]
-
-get_plugins()
@@ -8,6 +8,8 @@ import jsonref
 from calm.dsl.tools import StrictDraft7Validator
 from calm.dsl.log import get_logging_handle
 
+from .plugins import get_plugins, get_plugin_provider_types, load_plugin
+
 LOG = get_logging_handle(__name__)
 
 
@@ -22,10 +24,7 @@ class ProviderBase:
 
         if provider_type:
 
-            # Init Provider
-            cls._init()
-
-            # Register Provider
+            # Register Provider. Spec and validator are initialized on first use
             cls.providers[provider_type] = cls
 
 
@@ -56,10 +55,14 @@ class Provider(ProviderBase):
 
     @classmethod
     def get_provider_spec(cls):
+        if "provider_spec" not in cls.__dict__:
+            cls._init()
         return cls.provider_spec
 
     @classmethod
     def get_validator(cls):
+        if "Validator" not in cls.__dict__:
+            cls._init()
         return cls.Validator
 
     @classmethod
@@ -87,6 +90,10 @@ class Provider(ProviderBase):
 
 def get_provider(provider_type):
 
+    if provider_type not in ProviderBase.providers:
+        if not load_plugin(provider_type):
+            get_plugins()
+
     if provider_type not in ProviderBase.providers:
         LOG.debug("Registered providers: {}".format(ProviderBase.providers))
         raise Exception("provider not registered")
@@ -95,11 +102,17 @@ def get_provider(provider_type):
 
 
 def get_providers():
+    get_plugins()
     return ProviderBase.providers
 
 
 def get_provider_types():
-    return ProviderBase.providers.keys()
+    provider_types = get_plugin_provider_types()
+    for provider_type in ProviderBase.providers:
+        if provider_type not in provider_types:
+            provider_types.append(provider_type)
+
+    return provider_types
 
 
 def get_provider_interface():
@@ -1,9 +1,24 @@
 import importlib
 import pkgutil
+from collections import OrderedDict
 
 
 _PLUGINS = None
 
+# Provider types of plugins under '.plugins' package. Plugin of a provider is
+# imported only when the provider is used, see get_provider()
+PLUGIN_PACKAGES = OrderedDict(
+    [
+        ("AHV_VM", "ahv_vm"),
+        ("AWS_VM", "aws_vm"),
+        ("AZURE_VM", "azure_vm"),
+        ("EXISTING_VM", "existing_vm"),
+        ("GCP_VM", "gcp_vm"),
+        ("K8S_POD", "k8s"),
+        ("VMWARE_VM", "vmware_vm"),
+    ]
+)
+
 
 def get_plugins():
     global _PLUGINS
@@ -12,6 +27,23 @@ def get_plugins():
     return _PLUGINS
 
 
+def get_plugin_provider_types():
+    """returns provider types of plugins without importing them"""
+
+    return list(PLUGIN_PACKAGES.keys())
+
+
+def load_plugin(provider_type):
+    """imports the plugin of given provider type. Returns None if unknown"""
+
+    if provider_type not in PLUGIN_PACKAGES:
+        return None
+
+    return importlib.import_module(
+        "{}.{}".format(__name__, PLUGIN_PACKAGES[provider_type])
+    )
+
+
 def _import_plugins(name=__name__):
     """Load all plugins under '.plugins' package"""
 
@@ -26,4 +58,4 @@ def _import_plugins(name=__name__):
     return results
 
 
-__all__ = ["get_plugins"]
+__all__ = ["get_plugins", "get_plugin_provider_types", "load_plugin"]
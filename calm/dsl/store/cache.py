@@ -1,12 +1,16 @@
 import click
+import copy
+import json
 import sys
+import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from peewee import OperationalError, IntegrityError
 from distutils.version import LooseVersion as LV
 
 from .version import Version
 from calm.dsl.config import get_context
-from calm.dsl.db import get_db_handle, init_db_handle
+from calm.dsl.db import get_db_handle, init_db_handle, db_writer_context
 from calm.dsl.log import get_logging_handle
 from calm.dsl.api import get_client_handle_obj
 
@@ -18,10 +22,19 @@ CALM_VERSION = Version.get_version("Calm")
 class Cache:
     """Cache class Implementation"""
 
+    # Per process memo of entity lookups and of the cache tables map.
+    # Invalidated whenever data in cache is modified by this process.
+    _lookup_memo = {}
+    _lookup_stats = {"hits": 0, "misses": 0}
+    _cache_tables = None
+
     @classmethod
     def get_cache_tables(cls, sync_version=False):
         """returns tables used for cache purpose"""
 
+        if not sync_version and cls._cache_tables is not None:
+            return dict(cls._cache_tables)
+
         db = get_db_handle()
         db_tables = db.registered_tables
 
@@ -48,12 +61,55 @@ class Cache:
                 LV(calm_version) >= LV(table.feature_min_version)
             ):
                 cache_tables[table.__cache_type__] = table
+
+        cls._cache_tables = dict(cache_tables)
         return cache_tables
 
+    @classmethod
+    def _memoized_lookup(cls, lookup_func, entity_type, key, kwargs):
+        """returns memoized result of lookup_func(entity_type, key, **kwargs)"""
+
+        memo_key = (
+            lookup_func.__name__,
+            entity_type,
+            key,
+            json.dumps(kwargs, sort_keys=True, default=str),
+        )
+        if memo_key in cls._lookup_memo:
+            cls._lookup_stats["hits"] += 1
+        else:
+            cls._lookup_stats["misses"] += 1
+            cls._lookup_memo[memo_key] = lookup_func(entity_type, key, **kwargs)
+
+        # Callers may modify the returned data
+        return copy.deepcopy(cls._lookup_memo[memo_key])
+
+    @classmethod
+    def invalidate_memo(cls):
+        """drops memoized lookups, called on every cache modification"""
+
+        LOG.debug(
+            "Dropping {} memoized cache lookups, stats: {}".format(
+                len(cls._lookup_memo), cls._lookup_stats
+            )
+        )
+        cls._lookup_memo = {}
+        cls._cache_tables = None
+
+    @classmethod
+    def get_memo_stats(cls):
+        """returns hit/miss stats of memoized lookups"""
+
+        return dict(cls._lookup_stats, size=len(cls._lookup_memo))
+
     @classmethod
     def get_entity_data(cls, entity_type, name, **kwargs):
         """returns entity data corresponding to supplied entry using entity name"""
 
+        return cls._memoized_lookup(cls._get_entity_data, entity_type, name, kwargs)
+
+    @classmethod
+    def _get_entity_data(cls, entity_type, name, **kwargs):
         db_cls = cls.get_entity_db_table_object(entity_type)
 
         try:
@@ -80,6 +136,12 @@ class Cache:
     def get_entity_data_using_uuid(cls, entity_type, uuid, *args, **kwargs):
         """returns entity data corresponding to supplied entry using entity uuid"""
 
+        return cls._memoized_lookup(
+            cls._get_entity_data_using_uuid, entity_type, uuid, kwargs
+        )
+
+    @classmethod
+    def _get_entity_data_using_uuid(cls, entity_type, uuid, **kwargs):
         db_cls = cls.get_entity_db_table_object(entity_type)
 
         try:
@@ -123,6 +185,7 @@ class Cache:
         """adds one entity to entity db object"""
 
         db_obj = cls.get_entity_db_table_object(entity_type)
+        cls.invalidate_memo()
         db_obj.add_one(uuid, **kwargs)
 
     @classmethod
@@ -130,6 +193,7 @@ class Cache:
         """adds one entity to entity db object"""
 
         db_obj = cls.get_entity_db_table_object(entity_type)
+        cls.invalidate_memo()
         db_obj.delete_one(uuid, **kwargs)
 
     @classmethod
@@ -137,23 +201,38 @@ class Cache:
         """adds one entity to entity db object"""
 
         db_obj = cls.get_entity_db_table_object(entity_type)
+        cls.invalidate_memo()
         db_obj.update_one(uuid, **kwargs)
 
     @classmethod
-    def sync(cls):
-        """Sync cache by latest data"""
+    def sync(cls, max_workers=8, incremental=False):
+        """Sync cache by latest data.
+        Tables are fetched in parallel on a pool of max_workers threads,
+        while all db writes go through a single writer thread.
+        If incremental is True, only entities changed on server since last
+        sync are updated for tables supporting it.
+        """
 
         def sync_tables(tables):
-            for table in tables:
-                table.sync()
-                click.echo(".", nl=False, err=True)
+            # Version table is required by others, so synced first
+            Version.sync()
+            click.echo(".", nl=False, err=True)
 
+            sync_timings = cls._sync_tables_parallel(
+                tables, max_workers, incremental=incremental
+            )
+            click.echo(" [Done]", err=True)
+
+            LOG.info("Cache sync time per table:")
+            for cache_type, sync_time in sorted(
+                sync_timings.items(), key=lambda x: x[1], reverse=True
+            ):
+                LOG.info("  {}: {:.2f}s".format(cache_type, sync_time))
+
+        cls.invalidate_memo()
         cache_table_map = cls.get_cache_tables(sync_version=True)
         tables = list(cache_table_map.values())
 
-        # Inserting version table at start
-        tables.insert(0, Version)
-
         try:
             LOG.info("Updating cache", nl=False)
             sync_tables(tables)
@@ -165,16 +244,96 @@ class Cache:
             init_db_handle()
             LOG.info("Updating cache", nl=False)
             sync_tables(tables)
-        click.echo(" [Done]", err=True)
 
     @classmethod
-    def sync_table(cls, cache_type):
+    def _sync_tables_parallel(cls, tables, max_workers, incremental=False):
+        """syncs tables on a thread pool, respecting table.sync_dependencies.
+        Returns map of {cache_type: sync time in seconds}"""
+
+        db = get_db_handle()
+        sync_timings = {}
+
+        def sync_table(table, dependency_futures):
+            # Wait till data of dependent tables is written to db
+            for future in dependency_futures:
+                future.result()
+
+            start_time = time.time()
+            try:
+                cls._sync_table_data(table, incremental=incremental)
+                db_writer.flush()
+            finally:
+                # Close the db connection opened by this worker thread
+                if not db.db.is_closed():
+                    db.db.close()
+
+            sync_timings[table.__cache_type__] = time.time() - start_time
+            click.echo(".", nl=False, err=True)
+
+        with db_writer_context(db.db) as db_writer:
+            with ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="CacheSync"
+            ) as executor:
+                futures = {}
+
+                # Dependencies are submitted before dependents, so a waiting
+                # worker never blocks the tables it waits for
+                for table in cls._order_by_dependencies(tables):
+                    dependency_futures = [
+                        futures[dep]
+                        for dep in table.sync_dependencies
+                        if dep in futures
+                    ]
+                    futures[table.__cache_type__] = executor.submit(
+                        sync_table, table, dependency_futures
+                    )
+
+                for future in futures.values():
+                    future.result()
+
+        return sync_timings
+
+    @classmethod
+    def _sync_table_data(cls, table, incremental=False):
+        """syncs table, writing all its changes in a single transaction"""
+
+        with table.write_batch():
+            if incremental:
+                table.sync_incremental()
+            else:
+                table.sync()
+
+    @classmethod
+    def _order_by_dependencies(cls, tables):
+        """returns tables ordered such that dependencies come first"""
+
+        table_map = {table.__cache_type__: table for table in tables}
+        ordered_tables = []
+        visited = set()
+
+        def visit(table):
+            if table.__cache_type__ in visited:
+                return
+            visited.add(table.__cache_type__)
+            for dep in table.sync_dependencies:
+                if dep in table_map:
+                    visit(table_map[dep])
+            ordered_tables.append(table)
+
+        for table in tables:
+            visit(table)
+
+        return ordered_tables
+
+    @classmethod
+    def sync_table(cls, cache_type, incremental=False):
         """sync the cache table provided in cache_type list"""
 
         if not cache_type:
             return
 
         cache_type = [cache_type] if not isinstance(cache_type, list) else cache_type
+        cls.invalidate_memo()
         cache_table_map = cls.get_cache_tables()
 
         for _ct in cache_type:
@@ -183,13 +342,14 @@ class Cache:
                 continue
 
             cache_table = cache_table_map[_ct]
-            cache_table.sync()
+            cls._sync_table_data(cache_table, incremental=incremental)
 
     @classmethod
     def clear_entities(cls):
         """Clear data present in the cache tables"""
 
         # For now clearing means erasing all data. So reinitialising whole database
+        cls.invalidate_memo()
         init_db_handle()
 
     @classmethod
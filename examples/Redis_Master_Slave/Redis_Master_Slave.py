@@ -108,7 +108,7 @@ class AHVRedisMasterSubstrate(Substrate):
         "connection_port": 22,
         "credential": ref(DefaultCred),
     }
-    editables = {
+    provider_spec_editables = {
         "create_spec": {
             "resources": {
                 "nic_list": {},
@@ -42,7 +42,12 @@ setuptools.setup(
     cmdclass={"test": PyTest},
     zip_safe=False,
     include_package_data=True,
-    entry_points={"console_scripts": ["calm=calm.dsl.cli:main"]},
+    entry_points={
+        "console_scripts": [
+            "calm=calm.dsl.cli:main",
+            "calmc=calm.dsl.daemon.client:main",
+        ]
+    },
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Environment :: Console",
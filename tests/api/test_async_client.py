@@ -0,0 +1,113 @@
+import time
+import asyncio
+import threading
+from unittest import mock
+
+import pytest
+
+from calm.dsl.api import connection
+from calm.dsl.api.connection import AsyncConnection, REQUEST
+from calm.dsl.api.handle import get_async_client_handle_obj
+
+
+class FakeResponse:
+    ok = True
+    status_code = 200
+
+    def __init__(self, url):
+        self.url = url
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return {"url": self.url}
+
+
+class FakeSession:
+    """Session whose requests take some time, recording max requests in flight"""
+
+    def __init__(self):
+        self.headers = {}
+        self.auth = None
+        self.closed = False
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def mount(self, prefix, adapter):
+        pass
+
+    def request(self, url, **kwargs):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        time.sleep(0.02)
+        with self.lock:
+            self.in_flight -= 1
+        return FakeResponse(url)
+
+    get = post = put = delete = request
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def session():
+    session = FakeSession()
+    with mock.patch.object(connection, "Session", return_value=session):
+        yield session
+
+
+def test_call(session):
+    async def read():
+        async with AsyncConnection("pc", 9440, auth=("user", "pass")) as conn:
+            return await conn._call("api/test", method=REQUEST.METHOD.GET)
+
+    res, err = asyncio.run(read())
+    assert err is None
+    assert res.json() == {"url": "https://pc:9440/api/test"}
+    assert session.closed
+
+
+def test_concurrency_limit(session):
+    async def read_all():
+        async with AsyncConnection("pc", 9440, max_concurrency=3) as conn:
+            return await asyncio.gather(
+                *[
+                    conn._call("api/test/{}".format(i), method=REQUEST.METHOD.GET)
+                    for i in range(12)
+                ]
+            )
+
+    results = asyncio.run(read_all())
+    assert len(results) == 12 and all(err is None for _, err in results)
+    assert session.max_in_flight == 3
+
+
+def test_client_handle(session):
+    async def read_apps():
+        async with get_async_client_handle_obj("pc", 9440) as client:
+            results = await asyncio.gather(
+                client.application.read("app-1"), client.application.read("app-2")
+            )
+            with pytest.raises(TypeError):
+                client.application.list_all()
+            with pytest.raises(TypeError):
+                client.project.get_name_uuid_map()
+            with pytest.raises(TypeError):
+                client.blueprint.iter_all()
+
+            return client, results
+
+    client, results = asyncio.run(read_apps())
+    assert [res.json()["url"].split("/")[-1] for res, _ in results] == [
+        "app-1",
+        "app-2",
+    ]
+
+    # Session and worker pool are released on exit
+    assert session.closed
+    assert client.connection._executor is None
@@ -0,0 +1,77 @@
+from unittest.mock import MagicMock
+
+from calm.dsl.api.resource import ResourceAPI, project_fields
+
+
+def get_resource_api(total_entities):
+    """returns ResourceAPI whose list call serves pages from a fake inventory"""
+
+    entities = [{"metadata": {"uuid": str(i)}} for i in range(total_entities)]
+
+    def _call(endpoint, request_json=None, **kwargs):
+        offset = request_json["offset"]
+        length = request_json["length"]
+        response = MagicMock()
+        response.json.return_value = {
+            "entities": entities[offset : offset + length],
+            "metadata": {"total_matches": total_entities},
+        }
+        return response, None
+
+    connection = MagicMock()
+    connection._pool_maxsize = 20
+    connection._call.side_effect = _call
+    return ResourceAPI(connection, "apps"), entities
+
+
+class TestResourceListAll:
+    def test_list_all_parallel_keeps_server_order(self):
+        api, entities = get_resource_api(1037)
+        res = api.list_all(api_limit=10, concurrency=8)
+        assert res == entities
+        assert api.connection._call.call_count == 104
+
+    def test_list_all_serial(self):
+        api, entities = get_resource_api(25)
+        res, err = api.list_all(api_limit=10, concurrency=1, ignore_error=True)
+        assert err is None
+        assert res == entities
+
+    def test_list_all_error_in_page(self):
+        api, _ = get_resource_api(50)
+        call = api.connection._call.side_effect
+
+        def _call(endpoint, request_json=None, **kwargs):
+            if request_json["offset"] == 30:
+                return None, {"code": 500, "error": "failed"}
+            return call(endpoint, request_json=request_json, **kwargs)
+
+        api.connection._call.side_effect = _call
+        res, err = api.list_all(api_limit=10, ignore_error=True)
+        assert res == []
+        assert err["code"] == 500
+
+
+class TestResourceIterAll:
+    def test_iter_all_yields_in_order(self):
+        api, entities = get_resource_api(35)
+        res = api.iter_all(api_limit=10)
+        assert next(res) == entities[0]
+        # Only first page is fetched till it is consumed
+        assert api.connection._call.call_count == 1
+        assert [entities[0]] + list(res) == entities
+
+    def test_iter_all_with_fields(self):
+        api, _ = get_resource_api(3)
+        res = list(api.iter_all(fields=["metadata.uuid", "status.name"]))
+        assert res == [{"metadata": {"uuid": str(i)}} for i in range(3)]
+
+    def test_project_fields(self):
+        entity = {
+            "status": {"name": "app1", "resources": {"type": "ahv"}},
+            "metadata": {"uuid": "1234", "kind": "app"},
+        }
+        assert project_fields(entity, ["status.name", "metadata.uuid"]) == {
+            "status": {"name": "app1"},
+            "metadata": {"uuid": "1234"},
+        }
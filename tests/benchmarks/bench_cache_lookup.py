@@ -0,0 +1,81 @@
+"""
+Benchmark for cache lookups.
+
+Fills the subnet cache table with synthetic rows and measures
+get_entity_data / get_entity_data_using_uuid lookups with and without the
+secondary indexes declared on the table.
+
+Usage:
+    python -m tests.benchmarks.bench_cache_lookup [num_rows]
+"""
+
+import os
+import sys
+import time
+import random
+import tempfile
+
+from calm.dsl.db.table_config import dsl_database, AhvSubnetsCache
+
+NUM_ACCOUNTS = 10
+NUM_LOOKUPS = 500
+
+
+def fill_table(count):
+    rows = [
+        {
+            "name": "subnet-{}".format(i),
+            "uuid": "uuid-{}".format(i),
+            "account_uuid": "account-{}".format(i % NUM_ACCOUNTS),
+            "subnet_type": "VLAN",
+        }
+        for i in range(count)
+    ]
+    with AhvSubnetsCache.write_batch():
+        for row in rows:
+            AhvSubnetsCache.create_entry(**row)
+
+
+def run_lookups(count):
+    ids = random.sample(range(count), NUM_LOOKUPS)
+
+    start_time = time.time()
+    for i in ids:
+        account_uuid = "account-{}".format(i % NUM_ACCOUNTS)
+        assert AhvSubnetsCache.get_entity_data(
+            "subnet-{}".format(i), account_uuid=account_uuid
+        )
+        assert AhvSubnetsCache.get_entity_data_using_uuid(
+            "uuid-{}".format(i), account_uuid=account_uuid
+        )
+
+    return (time.time() - start_time) / (2 * NUM_LOOKUPS)
+
+
+def main(count=100000):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        dsl_database.init(os.path.join(tmp_dir, "bench.db"))
+        dsl_database.connect()
+        dsl_database.create_tables([AhvSubnetsCache])
+        fill_table(count)
+
+        indexed_time = run_lookups(count)
+
+        index_names = [
+            index.name
+            for index in dsl_database.get_indexes("ahvsubnetscache")
+            if index.sql
+        ]
+        for index_name in index_names:
+            dsl_database.execute_sql('DROP INDEX "{}"'.format(index_name))
+        unindexed_time = run_lookups(count)
+
+        print("rows: {}".format(count))
+        print("without indexes: {:>8.3f} ms/lookup".format(unindexed_time * 1000))
+        print("with indexes:    {:>8.3f} ms/lookup".format(indexed_time * 1000))
+
+        dsl_database.close()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,77 @@
+"""
+Benchmark for cache table sync writes.
+
+Measures the write throughput of a cache table sync against a synthetic
+entity set, comparing autocommitted per-row writes with the batched write
+path (single transaction, chunked insert_many, single DELETE for clear).
+
+Usage:
+    python -m tests.benchmarks.bench_cache_sync_writes [num_entities]
+"""
+
+import os
+import sys
+import time
+import tempfile
+
+from calm.dsl.db.table_config import dsl_database, UsersCache
+
+
+def get_synthetic_users(count):
+    return [
+        {
+            "name": "user_{}@example.com".format(i),
+            "uuid": "uuid-{}".format(i),
+            "display_name": "User {}".format(i),
+            "directory": "LOCAL",
+        }
+        for i in range(count)
+    ]
+
+
+def sync_row_by_row(entities):
+    for db_entity in UsersCache.select():
+        super(UsersCache, db_entity).delete_instance()
+
+    for entity in entities:
+        UsersCache.create_entry(**entity)
+
+
+def sync_batched(entities):
+    with UsersCache.write_batch():
+        UsersCache.clear()
+        for entity in entities:
+            UsersCache.create_entry(**entity)
+
+
+def run(func, entities):
+    start_time = time.time()
+    func(entities)
+    total_time = time.time() - start_time
+    assert UsersCache.select().count() == len(entities)
+    return total_time
+
+
+def main(count=10000):
+    entities = get_synthetic_users(count)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        dsl_database.init(os.path.join(tmp_dir, "bench.db"))
+        dsl_database.connect()
+        dsl_database.create_tables([UsersCache])
+
+        # Second run of each path also measures clearing of existing rows
+        for func in [sync_row_by_row, sync_batched]:
+            for run_no in range(2):
+                total_time = run(func, entities)
+                print(
+                    "{:<16} run {}: {:>8.3f}s  {:>10.0f} rows/s".format(
+                        func.__name__, run_no + 1, total_time, count / total_time
+                    )
+                )
+
+        dsl_database.close()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
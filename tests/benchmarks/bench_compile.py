@@ -0,0 +1,51 @@
+"""
+Benchmark for blueprint compilation.
+
+Compiles a blueprint file (examples/Redis_Master_Slave by default) repeatedly
+in the same process and reports the time taken per compile. Compiling the
+example needs a synced cache (calm update cache) and the secrets it reads
+from the local dir.
+
+Usage:
+    python -m tests.benchmarks.bench_compile [num_runs] [bp_file]
+"""
+
+import os
+import sys
+import time
+
+from calm.dsl.cli.bps import compile_blueprint
+
+DEFAULT_BP_FILE = os.path.join(
+    os.path.dirname(__file__),
+    "..",
+    "..",
+    "examples",
+    "Redis_Master_Slave",
+    "Redis_Master_Slave.py",
+)
+
+
+def main(runs=10, bp_file=DEFAULT_BP_FILE):
+    bp_file = os.path.abspath(bp_file)
+
+    compile_times = []
+    for _ in range(runs):
+        start_time = time.time()
+        bp_payload = compile_blueprint(bp_file)
+        compile_times.append(time.time() - start_time)
+
+    if bp_payload is None:
+        print("User blueprint not found in {}".format(bp_file))
+        return
+
+    print("compile_blueprint('{}') over {} runs".format(bp_file, runs))
+    print("  min : {:.3f} s".format(min(compile_times)))
+    print("  mean: {:.3f} s".format(sum(compile_times) / runs))
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 10,
+        sys.argv[2] if len(sys.argv) > 2 else DEFAULT_BP_FILE,
+    )
@@ -0,0 +1,97 @@
+"""
+Benchmark for blueprint decompilation.
+
+Decompiles a blueprint json (tests/test_inheritance/test_inheritance_bp_output.json
+by default) repeatedly in the same process and reports the time taken per
+decompile, when templates are loaded in a new jinja environment on every
+render (as done earlier) and when the environment and compiled templates are
+reused. The json can be the output of
+`calm get bp <name> -o json` or just the blueprint resources.
+
+Set CALM_DSL_JINJA_CACHE_DIR to also keep compiled templates on disk across
+processes.
+
+Usage:
+    python -m tests.benchmarks.bench_decompile [num_runs] [bp_json_file]
+"""
+
+import os
+import sys
+import copy
+import json
+import time
+import tempfile
+from unittest import mock
+
+from jinja2 import Environment, PackageLoader
+
+from calm.dsl.cli.bps import _decompile_bp
+from calm.dsl.decompile import render
+
+DEFAULT_BP_FILE = os.path.join(
+    os.path.dirname(__file__),
+    "..",
+    "test_inheritance",
+    "test_inheritance_bp_output.json",
+)
+
+
+def read_bp_payload(bp_file):
+    with open(bp_file) as fd:
+        bp_payload = json.load(fd)
+
+    # Exported resources only
+    if "spec" not in bp_payload:
+        bp_payload = {
+            "spec": {"name": "DslBlueprint", "resources": bp_payload},
+            "metadata": {},
+        }
+
+    bp_payload["spec"]["resources"].setdefault("client_attrs", {})
+    return bp_payload
+
+
+def get_uncached_template(schema_file):
+    loader = PackageLoader(render.__name__, "schemas")
+    env = Environment(loader=loader)
+    return env.get_template(schema_file)
+
+
+def time_decompile(bp_payload, runs):
+    decompile_times = []
+    for _ in range(runs):
+        with tempfile.TemporaryDirectory() as bp_dir:
+            start_time = time.time()
+            _decompile_bp(copy.deepcopy(bp_payload), bp_dir=bp_dir)
+            decompile_times.append(time.time() - start_time)
+
+    return decompile_times
+
+
+def main(runs=10, bp_file=DEFAULT_BP_FILE):
+    bp_file = os.path.abspath(bp_file)
+    bp_payload = read_bp_payload(bp_file)
+
+    with mock.patch.object(render, "get_template", get_uncached_template):
+        uncached_times = time_decompile(bp_payload, runs)
+
+    render.reset_env()
+    cached_times = time_decompile(bp_payload, runs)
+
+    results = [
+        ("new environment per render", uncached_times),
+        ("shared environment", cached_times),
+    ]
+
+    print("_decompile_bp('{}') over {} runs".format(bp_file, runs))
+    for name, decompile_times in results:
+        print("  {}".format(name))
+        print("    min : {:.3f} s".format(min(decompile_times)))
+        print("    mean: {:.3f} s".format(sum(decompile_times) / runs))
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 10,
+        sys.argv[2] if len(sys.argv) > 2 else DEFAULT_BP_FILE,
+    )
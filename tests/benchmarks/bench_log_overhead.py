@@ -0,0 +1,67 @@
+"""
+Benchmark for log call overhead.
+
+Measures the cost of LOG.debug / LOG.info calls made from a nested call stack
+at each verbosity level, i.e. when the records are filtered out and when they
+are emitted. Emitted records are written to a null stream. The cost of
+inspect.stack() at the same depth is printed for reference.
+
+Usage:
+    python -m tests.benchmarks.bench_log_overhead [num_calls]
+"""
+
+import io
+import sys
+import time
+import inspect
+
+from calm.dsl.log import CustomLogging, get_logging_handle
+
+STACK_DEPTH = 30
+
+LOG = get_logging_handle("bench")
+
+
+def at_depth(depth, func, *args):
+    if depth == 0:
+        return func(*args)
+    return at_depth(depth - 1, func, *args)
+
+
+def time_calls(log_func, count):
+    def run():
+        start_time = time.time()
+        for i in range(count):
+            log_func("message {}".format(i))
+        return time.time() - start_time
+
+    return at_depth(STACK_DEPTH, run) / count
+
+
+def main(count=20000):
+    LOG._ch1.setStream(io.StringIO())
+
+    levels = [
+        ("DEBUG", CustomLogging.DEBUG),
+        ("INFO", CustomLogging.INFO),
+        ("WARNING", CustomLogging.WARNING),
+    ]
+    print("Log call overhead at stack depth {}".format(STACK_DEPTH))
+    for level_name, level in levels:
+        CustomLogging.set_verbose_level(level)
+        for log_func in (LOG.debug, LOG.info):
+            LOG._ch1.setStream(io.StringIO())
+            per_call = time_calls(log_func, count)
+            print(
+                "  verbosity {:8s} LOG.{:6s}: {:.2f} us/call".format(
+                    level_name, log_func.__name__, per_call * 1e6
+                )
+            )
+
+    inspect_count = max(count // 20, 1)
+    per_call = time_calls(lambda msg: inspect.stack(), inspect_count)
+    print("  inspect.stack() reference : {:.2f} us/call".format(per_call * 1e6))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,45 @@
+"""
+Benchmark for dsl startup time.
+
+Measures the time taken to import calm.dsl.builtins in a fresh interpreter,
+once without the precompiled schema bundle (first run, templates are rendered
+and the bundle is written) and then with the bundle present on disk.
+
+Usage:
+    python -m tests.benchmarks.bench_startup [num_runs]
+"""
+
+import os
+import sys
+import time
+import tempfile
+import subprocess
+
+IMPORT_STMT = "import calm.dsl.builtins"
+
+
+def time_import(db_location):
+    env = dict(os.environ)
+    env["CALM_DSL_DB_LOCATION"] = db_location
+
+    start_time = time.time()
+    subprocess.run([sys.executable, "-c", IMPORT_STMT], env=env, check=True)
+    return time.time() - start_time
+
+
+def main(runs=5):
+    cold_times = []
+    warm_times = []
+    for _ in range(runs):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_location = os.path.join(tmp_dir, "dsl.db")
+            cold_times.append(time_import(db_location))
+            warm_times.append(time_import(db_location))
+
+    print("'{}' over {} runs".format(IMPORT_STMT, runs))
+    print("  without schema bundle: {:.3f} s".format(min(cold_times)))
+    print("  with schema bundle   : {:.3f} s".format(min(warm_times)))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
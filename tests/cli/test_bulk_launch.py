@@ -0,0 +1,139 @@
+import json
+import os
+import uuid
+from unittest import mock
+
+import pytest
+
+from calm.dsl.cli import bps
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+    def json(self):
+        return self.data
+
+
+class FakeClient:
+    """Launch requests succeed on their second poll"""
+
+    def __init__(self):
+        self.polls = {}
+        self.max_inflight = 0
+        self.application = mock.Mock()
+        self.application.list.return_value = (
+            FakeResponse({"metadata": {"total_matches": 0}}),
+            None,
+        )
+        self.blueprint = mock.Mock()
+        self.blueprint.launch.side_effect = self.launch
+        self.blueprint.poll_launch.side_effect = self.poll_launch
+
+    def launch(self, bp_uuid, payload):
+        request_id = str(uuid.uuid4())
+        self.polls[request_id] = 0
+        inflight = len([x for x in self.polls.values() if x < 2])
+        self.max_inflight = max(self.max_inflight, inflight)
+        return FakeResponse({"status": {"request_id": request_id}}), None
+
+    def poll_launch(self, bp_uuid, request_id):
+        self.polls[request_id] += 1
+        if self.polls[request_id] < 2:
+            return FakeResponse({"status": {"state": "pending"}}), None
+        return (
+            FakeResponse(
+                {"status": {"state": "success", "application_uuid": request_id}}
+            ),
+            None,
+        )
+
+
+BLUEPRINT = {
+    "metadata": {"uuid": "bp-uuid", "name": "bp1"},
+    "status": {"state": "ACTIVE"},
+}
+PROFILES = [
+    {
+        "app_profile_reference": {"name": "Default", "uuid": "profile-uuid"},
+        "runtime_editables": {},
+    }
+]
+
+
+def test_launch_blueprints(tmp_path):
+    manifest_file = os.path.join(str(tmp_path), "manifest.json")
+    report_file = os.path.join(str(tmp_path), "report.json")
+    with open(manifest_file, "w") as fd:
+        json.dump(
+            {
+                "launches": [
+                    {"blueprint": "bp1", "app_name": "app{}".format(i)}
+                    for i in range(5)
+                ]
+            },
+            fd,
+        )
+
+    client = FakeClient()
+    with mock.patch.object(
+        bps, "get_api_client", return_value=client
+    ), mock.patch.object(
+        bps, "get_blueprint", return_value=BLUEPRINT
+    ) as get_blueprint, mock.patch.object(
+        bps, "get_blueprint_runtime_editables", return_value=PROFILES
+    ) as get_editables:
+        bps.launch_blueprints(
+            manifest_file,
+            max_inflight=2,
+            report_file=report_file,
+            poll_interval=0.01,
+            max_requests=1000,
+        )
+
+    # Blueprint and its editables are fetched once for all launches
+    assert get_blueprint.call_count == 1
+    assert get_editables.call_count == 1
+    assert client.blueprint.launch.call_count == 5
+    assert client.max_inflight <= 2
+
+    with open(report_file) as fd:
+        report = json.load(fd)
+    assert [x["name"] for x in report] == ["app{}".format(i) for i in range(5)]
+    assert all(x["state"] == "success" and x["uuid"] for x in report)
+
+
+def test_launch_blueprints_poll_failure(tmp_path):
+    manifest_file = os.path.join(str(tmp_path), "manifest.json")
+    report_file = os.path.join(str(tmp_path), "report.json")
+    with open(manifest_file, "w") as fd:
+        json.dump([{"blueprint": "bp1", "app_name": "app1"}], fd)
+
+    client = FakeClient()
+    client.blueprint.poll_launch.side_effect = None
+    client.blueprint.poll_launch.return_value = (
+        None,
+        {"code": 404, "error": "launch request not found"},
+    )
+    with mock.patch.object(
+        bps, "get_api_client", return_value=client
+    ), mock.patch.object(
+        bps, "get_blueprint", return_value=BLUEPRINT
+    ), mock.patch.object(
+        bps, "get_blueprint_runtime_editables", return_value=PROFILES
+    ), pytest.raises(
+        SystemExit
+    ):
+        bps.launch_blueprints(
+            manifest_file,
+            report_file=report_file,
+            poll_interval=0.01,
+            max_requests=1000,
+        )
+
+    # Launch is reported failed instead of being polled forever
+    assert client.blueprint.poll_launch.call_count == 1
+    with open(report_file) as fd:
+        report = json.load(fd)
+    assert "launch request not found" in report[0]["error"]
@@ -0,0 +1,77 @@
+import os
+import sys
+import shutil
+import tempfile
+import importlib
+
+from calm.dsl.cli.compile_cache import CompileCache
+
+
+class TestCompileCache:
+    def setup_method(self):
+        self.bp_file = "/tmp/calm_test_compile_cache_{}.py".format(os.getpid())
+        self.script_file = self.bp_file + ".sh"
+        for file_path, content in [
+            (self.bp_file, "# blueprint\n"),
+            (self.script_file, "echo hello\n"),
+        ]:
+            with open(file_path, "w") as fd:
+                fd.write(content)
+
+        self.payload = {"spec": {"name": "test_bp"}}
+        CompileCache(self.bp_file).set_payload(self.payload, {self.script_file})
+
+    def teardown_method(self):
+        for file_path in [
+            self.bp_file,
+            self.script_file,
+            CompileCache(self.bp_file).entry_file,
+        ]:
+            if os.path.exists(file_path):
+                os.remove(file_path)
+
+    def test_unchanged_blueprint(self):
+        assert CompileCache(self.bp_file).get_payload() == self.payload
+
+    def test_changed_blueprint(self):
+        with open(self.bp_file, "a") as fd:
+            fd.write("# changed\n")
+
+        assert CompileCache(self.bp_file).get_payload() is None
+
+    def test_changed_dependency(self):
+        with open(self.script_file, "a") as fd:
+            fd.write("echo changed\n")
+
+        assert CompileCache(self.bp_file).get_payload() is None
+
+    def test_removed_dependency(self):
+        os.remove(self.script_file)
+
+        assert CompileCache(self.bp_file).get_payload() is None
+
+    def test_changed_helper_module(self):
+        # Helper imported through sys.path from a dir outside blueprint dir
+        helper_dir = tempfile.mkdtemp()
+        helper_file = os.path.join(helper_dir, "calm_test_bp_helper.py")
+        with open(helper_file, "w") as fd:
+            fd.write("VALUE = 1\n")
+
+        old_module_names = set(sys.modules)
+        sys.path.insert(0, helper_dir)
+        try:
+            importlib.import_module("calm_test_bp_helper")
+            CompileCache(self.bp_file).set_payload(
+                self.payload, {self.script_file}, old_module_names
+            )
+            assert CompileCache(self.bp_file).get_payload() == self.payload
+
+            with open(helper_file, "a") as fd:
+                fd.write("VALUE = 2\n")
+
+            assert CompileCache(self.bp_file).get_payload() is None
+
+        finally:
+            sys.path.remove(helper_dir)
+            sys.modules.pop("calm_test_bp_helper", None)
+            shutil.rmtree(helper_dir)
@@ -0,0 +1,76 @@
+import io
+import os
+import stat
+import threading
+from unittest import mock
+
+from calm.dsl.daemon import send_request
+from calm.dsl.daemon.server import DaemonServer
+
+
+class TestDaemon:
+    def setup_method(self):
+        self.socket_path = "/tmp/calm_test_daemon_{}.sock".format(os.getpid())
+        self.server = DaemonServer(self.socket_path)
+        self.thread = threading.Thread(target=self.server.serve, daemon=True)
+        self.thread.start()
+
+    def teardown_method(self):
+        if self.thread.is_alive():
+            send_request({"action": "stop"}, self.socket_path)
+        self.thread.join(timeout=10)
+        self.server.server_close()
+        os.remove(self.socket_path)
+
+    def run(self, argv, environ=None):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        request = {"argv": argv, "cwd": os.getcwd(), "environ": environ}
+        exit_code = send_request(request, self.socket_path, stdout, stderr)
+        return exit_code, stdout.getvalue(), stderr.getvalue()
+
+    def test_command_output(self):
+        exit_code, stdout, _ = self.run(["get", "--help"])
+        assert exit_code == 0
+        assert "Usage: calm get" in stdout
+
+        # Commands are run in the same process one after another
+        exit_code, stdout, _ = self.run(["show", "--help"])
+        assert exit_code == 0
+        assert "Usage: calm show" in stdout
+
+    def test_invalid_command(self):
+        exit_code, _, stderr = self.run(["invalid-command"])
+        assert exit_code == 2
+        assert "No such command" in stderr
+
+    def test_socket_permissions(self):
+        mode = stat.S_IMODE(os.stat(self.socket_path).st_mode)
+        assert mode == 0o600
+
+    def test_client_environ(self):
+        with mock.patch.dict(os.environ, {"CALM_DSL_LOG_LEVEL": "INFO"}):
+            exit_code, stdout, _ = self.run(
+                ["get", "--help"], environ={"CALM_DSL_TEST_VAR": "1"}
+            )
+            assert exit_code == 0 and "Usage: calm get" in stdout
+
+            # Environment of daemon is restored after the command
+            assert os.environ["CALM_DSL_LOG_LEVEL"] == "INFO"
+            assert "CALM_DSL_TEST_VAR" not in os.environ
+
+    def test_daemon_not_running(self):
+        assert send_request({"action": "status"}, self.socket_path + ".x") is None
+
+    def test_restart_on_server_change(self):
+        exit_code, _, _ = self.run(["get", "--help"])
+        assert exit_code == 0 and self.server._calm_server is not None
+
+        # Schemas were loaded for another server, so command is left to client
+        self.server._calm_server = ("10.0.0.1", "1.0.0")
+        exit_code, stdout, stderr = self.run(["get", "--help"])
+        assert exit_code is None and stdout == ""
+        assert "restarting it" in stderr
+
+        self.thread.join(timeout=10)
+        assert not self.thread.is_alive()
+        assert self.server.restart_requested
@@ -0,0 +1,61 @@
+import sys
+import subprocess
+
+import pytest
+
+# Cumulative import time budgets (in microseconds) checked using `-X importtime`
+IMPORT_TIME_BUDGETS_US = {
+    "calm.dsl.cli": 1500000,
+    "calm.dsl.cli.main": 1400000,
+}
+
+# Modules needed only by specific commands, imported lazily
+LAZY_MODULES = [
+    "calm.dsl.builtins",
+    "calm.dsl.cli.bps",
+    "calm.dsl.cli.apps",
+    "calm.dsl.cli.runlog",
+    "calm.dsl.cli.marketplace",
+    "calm.dsl.providers.plugins.ahv_vm",
+    "black",
+    "click_repl",
+]
+
+
+def get_import_times(stmt):
+    """returns map of module name -> cumulative import time (us) for stmt"""
+
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", stmt],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+
+    import_times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, module_name = line[len("import time:") :].split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        import_times[module_name.strip()] = int(cumulative)
+
+    return import_times
+
+
+class TestImportTime:
+    def setup_class(self):
+        self.import_times = get_import_times("import calm.dsl.cli")
+
+    @pytest.mark.parametrize("module_name", LAZY_MODULES)
+    def test_lazy_modules_not_imported(self, module_name):
+        assert module_name not in self.import_times
+
+    @pytest.mark.parametrize("module_name", list(IMPORT_TIME_BUDGETS_US.keys()))
+    def test_import_time_budget(self, module_name):
+        budget = IMPORT_TIME_BUDGETS_US[module_name]
+        assert self.import_times[module_name] <= budget, "{} took {}us".format(
+            module_name, self.import_times[module_name]
+        )
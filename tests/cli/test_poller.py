@@ -0,0 +1,48 @@
+import threading
+
+from calm.dsl.cli.poller import Poller, poll_until
+
+
+class TestPoller:
+    def test_completion(self):
+        states = iter(["PENDING", "RUNNING", "RUNNING", "SUCCESS"])
+
+        def poll_func():
+            state = next(states)
+            return (state == "SUCCESS", state)
+
+        assert poll_until(poll_func, max_interval=0.01) is True
+
+    def test_backoff_and_reset(self):
+        states = iter(["A", "A", "A", "B", "B"])
+        intervals = []
+
+        def poll_func():
+            state = next(states, None)
+            return (state is None, state)
+
+        poller = Poller(
+            min_interval=0.01,
+            max_interval=0.03,
+            backoff=2,
+            jitter=0,
+            on_poll=lambda stats: intervals.append(stats.interval),
+        )
+        assert poller.poll(poll_func) is True
+
+        # Interval grows while state is unchanged, resets when it changes
+        assert intervals == [0.01, 0.02, 0.03, 0.01, 0.02, 0]
+
+    def test_timeout(self):
+        assert (
+            poll_until(lambda: (False, None), max_interval=0.01, timeout=0.05) is False
+        )
+
+    def test_cancel(self):
+        cancel_event = threading.Event()
+
+        def poll_func():
+            cancel_event.set()
+            return (False, None)
+
+        assert poll_until(poll_func, timeout=None, cancel_event=cancel_event) is False
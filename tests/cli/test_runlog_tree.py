@@ -0,0 +1,46 @@
+from calm.dsl.cli.runlog import RunlogTree
+
+
+def get_runlog(uuid, parent_uuid, creation_time, state="RUNNING"):
+    return {
+        "metadata": {
+            "uuid": uuid,
+            "creation_time": str(creation_time),
+            "last_update_time": str(creation_time),
+        },
+        "status": {
+            "type": "task_runlog",
+            "state": state,
+            "parent_reference": {"uuid": parent_uuid},
+            "root_reference": {"uuid": "root"},
+        },
+    }
+
+
+class TestRunlogTree:
+    def test_incremental_update(self):
+        tree = RunlogTree()
+        entities = [get_runlog("b", "a", 2), get_runlog("a", "root", 1)]
+        assert len(tree.update(entities)) == 2
+        assert [runlog["metadata"]["uuid"] for runlog in tree.runlogs] == ["a", "b"]
+        assert tree.nodes["b"].parent is tree.nodes["a"]
+
+        # Unchanged runlogs are not applied again
+        node_a = tree.nodes["a"]
+        entities = [
+            get_runlog("b", "a", 2, state="SUCCESS"),
+            get_runlog("a", "root", 1),
+        ]
+        changed = tree.update(entities)
+        assert [runlog["metadata"]["uuid"] for runlog in changed] == ["b"]
+        assert tree.nodes["a"] is node_a and node_a.version == 0
+        assert tree.nodes["b"].version == 1
+        assert tree.nodes["b"].runlog["status"]["state"] == "SUCCESS"
+
+    def test_missing_parent(self):
+        tree = RunlogTree()
+        tree.update([get_runlog("a", "root", 1), get_runlog("c", "b", 3)])
+        assert tree.nodes["c"].parent is tree.root
+
+        tree.update([get_runlog("b", "a", 2)])
+        assert tree.nodes["c"].parent is tree.nodes["b"]
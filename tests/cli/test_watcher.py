@@ -0,0 +1,133 @@
+from unittest import mock
+
+import pytest
+
+from calm.dsl.cli.watcher import (
+    MultiWatcher,
+    RateLimiter,
+    RunlogTarget,
+    WatchError,
+    WatchTarget,
+)
+
+
+class ScriptedTarget(WatchTarget):
+
+    kind = "test"
+    terminal_states = ["SUCCESS", "FAILURE"]
+    failure_states = ["FAILURE"]
+
+    def __init__(self, name, states):
+        super().__init__(name, uuid=name)
+        self.states = iter(states)
+
+    def read_state(self, client):
+        return next(self.states)
+
+
+class TestMultiWatcher:
+    def test_all_targets_complete(self):
+        targets = [
+            ScriptedTarget("a", ["PENDING", "RUNNING", "SUCCESS"]),
+            ScriptedTarget("b", ["RUNNING", "RUNNING", "RUNNING", "FAILURE"]),
+        ]
+        changes = []
+
+        def on_change(watcher, changed_targets):
+            changes.extend((x.name, x.state) for x in changed_targets)
+
+        watcher = MultiWatcher(
+            targets,
+            poll_interval=0.01,
+            on_change=on_change,
+            max_requests=1000,
+            client=object(),
+        )
+        assert watcher.run() is True
+
+        assert [x.polls for x in targets] == [3, 4]
+        assert targets[1].failed
+        assert [state for name, state in changes if name == "b"] == [
+            "RUNNING",
+            "FAILURE",
+        ]
+
+    def test_timeout(self):
+        targets = [ScriptedTarget("a", iter(lambda: "RUNNING", None))]
+        watcher = MultiWatcher(
+            targets,
+            poll_interval=0.01,
+            timeout=0.05,
+            max_requests=1000,
+            client=object(),
+        )
+        assert watcher.run() is False
+        assert not targets[0].completed
+
+    def test_errors_are_retried(self):
+        class FlakyTarget(ScriptedTarget):
+            def read_state(self, client):
+                state = super().read_state(client)
+                if state is None:
+                    raise Exception("connection error")
+                return state
+
+        target = FlakyTarget("a", [None, "SUCCESS"])
+        watcher = MultiWatcher(
+            [target], poll_interval=0.01, max_requests=1000, client=object()
+        )
+        assert watcher.run() is True
+        assert target.polls == 2 and target.error is None
+
+    def test_failing_targets_are_dropped(self):
+        class FailingTarget(ScriptedTarget):
+            def __init__(self, name, err):
+                super().__init__(name, [])
+                self.err = err
+
+            def read_state(self, client):
+                raise WatchError(self.err)
+
+        targets = [
+            FailingTarget("not-found", {"code": 404, "error": "not found"}),
+            FailingTarget("server-error", {"code": 500, "error": "server error"}),
+            ScriptedTarget("a", ["RUNNING", "SUCCESS"]),
+        ]
+        errors = []
+
+        def on_change(watcher, changed_targets):
+            errors.extend(x.name for x in changed_targets if x.error)
+
+        watcher = MultiWatcher(
+            targets,
+            poll_interval=0.01,
+            max_errors=3,
+            on_change=on_change,
+            max_requests=1000,
+            client=object(),
+        )
+        assert watcher.run() is False
+
+        # 4xx errors drop the target at once, others after max_errors checks
+        assert [x.polls for x in targets[:2]] == [1, 3]
+        assert errors.count("not-found") == 1 and errors.count("server-error") == 3
+        assert all(x.failed for x in targets[:2])
+        assert targets[2].completed and not targets[2].failed
+
+
+def test_invalid_runlog_uuid():
+    client = mock.Mock()
+    watcher = MultiWatcher(
+        [RunlogTarget("not-a-uuid")],
+        poll_interval=0.01,
+        max_requests=1000,
+        client=client,
+    )
+    assert watcher.run() is False
+    assert "Invalid runbook execution uuid" in watcher.targets[0].error
+    assert not client.runbook.poll_action_run.called
+
+
+def test_rate_limiter_rate():
+    with pytest.raises(ValueError):
+        RateLimiter(0)
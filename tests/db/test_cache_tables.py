@@ -0,0 +1,146 @@
+import os
+from unittest import mock
+
+import pytest
+
+from calm.dsl.api.resource import project_fields
+from calm.dsl.db import table_config
+from calm.dsl.db.table_config import (
+    dsl_database,
+    AhvClustersCache,
+    AhvVpcsCache,
+    AhvSubnetsCache,
+    RolesCache,
+    EntityRevisionTable,
+)
+
+
+@pytest.fixture
+def cache_db(tmp_path):
+    db_location = dsl_database.database
+    dsl_database.init(os.path.join(str(tmp_path), "dsl.db"))
+    dsl_database.connect()
+    dsl_database.create_tables(
+        [
+            AhvClustersCache,
+            AhvVpcsCache,
+            AhvSubnetsCache,
+            RolesCache,
+            EntityRevisionTable,
+        ]
+    )
+    yield dsl_database
+
+    dsl_database.close()
+    dsl_database.init(db_location)
+
+
+def test_write_batch_rows_with_different_columns(cache_db):
+    with AhvSubnetsCache.write_batch():
+        AhvSubnetsCache.create_entry(
+            name="vlan1",
+            uuid="subnet-1",
+            subnet_type="VLAN",
+            account_uuid="account-1",
+            cluster_uuid="cluster-1",
+        )
+        AhvSubnetsCache.create_entry(
+            name="overlay1",
+            uuid="subnet-2",
+            subnet_type="OVERLAY",
+            account_uuid="account-1",
+            vpc_uuid="vpc-1",
+        )
+        AhvSubnetsCache.create_entry(
+            name="vlan2",
+            uuid="subnet-3",
+            subnet_type="VLAN",
+            account_uuid="account-1",
+            cluster_uuid="cluster-1",
+        )
+
+    rows = {row.uuid: (row.cluster_id, row.vpc_id) for row in AhvSubnetsCache.select()}
+    assert rows == {
+        "subnet-1": ("cluster-1", None),
+        "subnet-2": (None, "vpc-1"),
+        "subnet-3": ("cluster-1", None),
+    }
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+    def json(self):
+        return self.data
+
+
+class FakeRoleApi:
+    """Serves roles from a {uuid: (name, spec_version)} map"""
+
+    def __init__(self, roles):
+        self.roles = roles
+        self.list_calls = 0
+        self.iter_all_fields = []
+        self.read_uuids = []
+
+    def get_entity(self, uuid):
+        name, spec_version = self.roles[uuid]
+        return {
+            "metadata": {"uuid": uuid, "spec_version": spec_version},
+            "status": {"name": name},
+        }
+
+    def list(self, params):
+        self.list_calls += 1
+        entities = [self.get_entity(uuid) for uuid in self.roles]
+        return FakeResponse({"entities": entities}), None
+
+    def iter_all(self, fields=None):
+        self.iter_all_fields.append(fields)
+        for uuid in self.roles:
+            yield project_fields(self.get_entity(uuid), fields)
+
+    def read(self, uuid):
+        self.read_uuids.append(uuid)
+        return FakeResponse(self.get_entity(uuid)), None
+
+
+def sync_roles(role_api):
+    client = mock.Mock(role=role_api)
+    with mock.patch.object(
+        table_config, "get_api_client", return_value=client
+    ), mock.patch.object(table_config, "get_resource_api", return_value=role_api):
+        RolesCache.sync_incremental()
+
+    return {row.uuid: row.name for row in RolesCache.select()}
+
+
+def test_sync_incremental(cache_db):
+    role_api = FakeRoleApi({"role-1": ("Admin", 0), "role-2": ("Operator", 0)})
+
+    # No stored revisions, so table is fully synced by a single listing
+    assert sync_roles(role_api) == {"role-1": "Admin", "role-2": "Operator"}
+    assert role_api.list_calls == 1
+    assert role_api.iter_all_fields == []
+    assert EntityRevisionTable.get_revisions("role") == {
+        "role-1": "0|",
+        "role-2": "0|",
+    }
+
+    # Added, updated and deleted roles
+    role_api.roles = {"role-2": ("Developer", 1), "role-3": ("Viewer", 0)}
+    assert sync_roles(role_api) == {"role-2": "Developer", "role-3": "Viewer"}
+    assert role_api.list_calls == 1
+    assert role_api.read_uuids == ["role-2", "role-3"]
+
+    # Listing is projected to the revision fields
+    assert role_api.iter_all_fields == [EntityRevisionTable.revision_fields]
+    assert EntityRevisionTable.get_revisions("role") == {
+        "role-2": "1|",
+        "role-3": "0|",
+    }
+
+    # Nothing is fetched if no role changed
+    assert sync_roles(role_api) == {"role-2": "Developer", "role-3": "Viewer"}
+    assert role_api.read_uuids == ["role-2", "role-3"]
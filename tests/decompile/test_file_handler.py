@@ -0,0 +1,25 @@
+import os
+
+from calm.dsl.decompile import file_handler
+
+
+def test_buffered_files(tmp_path):
+    bp_dir = os.path.join(str(tmp_path), "bp")
+    _, local_dir, _, scripts_dir = file_handler.init_bp_dir(bp_dir)
+    assert os.path.isdir(local_dir) and os.path.isdir(scripts_dir)
+
+    script_file = os.path.join(scripts_dir, "Task1.sh")
+    secret_file = os.path.join(local_dir, "BP_CRED_root_PASSWORD")
+    file_handler.write_file(script_file, "echo hello")
+    file_handler.write_file(secret_file, "")
+    file_handler.write_file(secret_file, "secret")
+
+    # Nothing is written till files are flushed
+    assert not os.path.exists(script_file)
+
+    file_handler.flush_files()
+    with open(script_file) as fd:
+        assert fd.read() == "echo hello"
+    with open(secret_file) as fd:
+        assert fd.read() == "secret"
+    assert file_handler.BP_FILES == {}
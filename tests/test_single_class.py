@@ -1,6 +1,7 @@
 from calm.dsl.builtins import Service, Package
 from calm.dsl.builtins import CalmVariable as Var
 from calm.dsl.builtins import action
+from calm.dsl.builtins.models.entity import compile_session
 
 import pytest
 
@@ -91,6 +92,40 @@ def test_service_invalid_name():
         pytest.fail("Internal name allowed")
 
 
+def test_compile_session_memo():
+    class MySQLService(Service):
+        foo = Var("bar")
+
+    with compile_session():
+        payload = MySQLService.generate_payload()
+
+        # Entity is compiled once in a session
+        assert MySQLService.generate_payload() is payload
+
+        # Mutating the entity drops its compiled payload
+        MySQLService.tier = "db"
+        payload = MySQLService.generate_payload()
+        assert payload["tier"] == "db"
+        assert MySQLService.generate_payload() is payload
+
+    # Payload is not memoized outside a session
+    assert MySQLService.generate_payload() is not payload
+
+
+def test_compile_session_base_mutation():
+    class Animal(Service):
+        pass
+
+    class Dog(Animal):
+        pass
+
+    with compile_session():
+        assert Dog.generate_payload()["tier"] == ""
+
+        Animal.tier = "db"
+        assert Dog.generate_payload()["tier"] == "db"
+
+
 if __name__ == "__main__":
     test_service_invalid()
     test_service_invalid_setattr()